@@ -0,0 +1,86 @@
+"""
+Cold-start benchmark: how long a fresh interpreter takes to import
+linear-python and build a client.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 20 --budget 120
+
+Each statement runs in a new process and the fastest run is kept. Times
+are reported above a bare `import requests`, which every client needs,
+so the budget covers only what linear-python itself adds. Exits non-zero
+if that is over `--budget` milliseconds, or if the cold path imports a
+module that should only be loaded on demand.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+BASELINE = "import requests"
+
+STATEMENTS = {
+    "import": "import linear_python",
+    "client": "from linear_python import LinearClient; LinearClient('key')",
+}
+
+# Only needed for typed results, field selection, webhooks and .env files
+DEFERRED = ("strawberry", "graphql", "dotenv", "starlette", "sqlite3")
+
+
+def cold_start(statement, runs):
+    """Fastest wall time, in seconds, of `statement` in a fresh interpreter."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def loaded_deferred(statement):
+    """Modules from DEFERRED that `statement` ends up importing."""
+    probe = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(' '.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    )
+    return output.stdout.split()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=100.0,
+        help="max milliseconds above the requests baseline",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = cold_start(BASELINE, args.runs)
+    print(f"{'statement':<24} {'total':>11} {'vs requests':>12}")
+    print(f"{'baseline':<24} {baseline * 1000:>8.1f} ms")
+
+    failed = False
+    for name, statement in STATEMENTS.items():
+        total = cold_start(statement, args.runs) * 1000
+        overhead = total - baseline * 1000
+        deferred = loaded_deferred(statement)
+        status = "ok"
+        if overhead > args.budget:
+            status = f"over budget ({args.budget:.0f} ms)"
+        if deferred:
+            status = f"imported {', '.join(deferred)}"
+        failed = failed or status != "ok"
+        print(f"{name:<24} {total:>8.1f} ms {overhead:>+9.1f} ms  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,613 @@
+"""
+Local stand-in for the Linear GraphQL API, used by the benchmarks.
+
+Implements the subset of the schema the client uses (issues, projects,
+teams, users and the viewer) with cursor pagination and simple filters,
+and lets a run configure latency, rate-limit headers and error injection.
+"""
+
+import asyncio
+import enum
+import gzip
+import itertools
+import json
+import logging
+import random
+import socket
+import threading
+import time
+from typing import List, NewType, Optional
+
+import strawberry
+import uvicorn
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+EPOCH = "2024-01-01T00:00:00.000Z"
+
+
+def _filter_scalar(name):
+    # Filters are passed through as plain dicts; see `select`
+    return strawberry.scalar(
+        NewType(name, object), serialize=lambda v: v, parse_value=lambda v: v
+    )
+
+
+IssueFilter = _filter_scalar("IssueFilter")
+TeamFilter = _filter_scalar("TeamFilter")
+UserFilter = _filter_scalar("UserFilter")
+
+
+@strawberry.type
+class PageInfo:
+    hasNextPage: bool
+    endCursor: Optional[str]
+
+
+@strawberry.type
+class User:
+    id: strawberry.ID
+    name: str
+    email: str
+    url: str
+    isMe: bool = False
+    createdAt: str = EPOCH
+    updatedAt: str = EPOCH
+    archivedAt: Optional[str] = None
+
+
+@strawberry.type
+class UserConnection:
+    nodes: List[User]
+    pageInfo: PageInfo
+
+
+@strawberry.type
+class WorkflowState:
+    id: strawberry.ID
+    name: str
+    position: float
+    type: str
+    color: str = "#000000"
+    team: Optional["Team"] = None
+
+
+@strawberry.type
+class WorkflowStateConnection:
+    nodes: List[WorkflowState]
+    pageInfo: PageInfo
+
+
+@strawberry.type
+class IssueLabel:
+    id: strawberry.ID
+    name: str
+    color: str = "#000000"
+    # None for workspace labels
+    team: Optional["Team"] = None
+
+
+@strawberry.type
+class IssueLabelConnection:
+    nodes: List[IssueLabel]
+    pageInfo: PageInfo
+
+
+@strawberry.type
+class Project:
+    id: strawberry.ID
+    name: str
+    url: str
+    description: str = ""
+
+
+@strawberry.type
+class Team:
+    id: strawberry.ID
+    key: str
+    name: str
+    member_ids: strawberry.Private[List[str]]
+    createdAt: str = EPOCH
+    updatedAt: str = EPOCH
+    archivedAt: Optional[str] = None
+
+    @strawberry.field
+    def members(
+        self, info: strawberry.Info, first: int = 50, after: Optional[str] = None
+    ) -> UserConnection:
+        data = info.context["data"]
+        users = [data.users[user_id] for user_id in self.member_ids]
+        return UserConnection(**paginate(users, first, after))
+
+
+@strawberry.type
+class TeamConnection:
+    nodes: List[Team]
+    pageInfo: PageInfo
+
+
+@strawberry.type
+class Issue:
+    id: strawberry.ID
+    identifier: str
+    title: str
+    url: str
+    description: Optional[str]
+    dueDate: Optional[str]
+    priority: float
+    priorityLabel: str
+    assignee: Optional[User]
+    creator: Optional[User]
+    labels: IssueLabelConnection
+    project: Optional[Project]
+    state: WorkflowState
+    team: Team
+    createdAt: str
+    updatedAt: str
+    archivedAt: Optional[str] = None
+
+
+@strawberry.type
+class IssueConnection:
+    nodes: List[Issue]
+    pageInfo: PageInfo
+
+
+@strawberry.type
+class IssuePayload:
+    success: bool
+    lastSyncId: float
+    issue: Optional[Issue]
+
+
+@strawberry.type
+class IssueArchivePayload:
+    success: bool
+    lastSyncId: float
+    entity: Optional[Issue]
+
+
+@strawberry.type
+class ProjectPayload:
+    success: bool
+    lastSyncId: float
+    project: Optional[Project]
+
+
+@strawberry.input
+class IssueCreateInput:
+    teamId: str
+    title: str
+    description: Optional[str] = None
+    priority: Optional[int] = None
+    assigneeId: Optional[str] = None
+    stateId: Optional[str] = None
+    dueDate: Optional[str] = None
+    labelIds: Optional[List[str]] = None
+
+
+@strawberry.input
+class IssueUpdateInput:
+    title: Optional[str] = None
+    description: Optional[str] = None
+    priority: Optional[int] = None
+    assigneeId: Optional[str] = None
+    stateId: Optional[str] = None
+    dueDate: Optional[str] = None
+
+
+@strawberry.input
+class ProjectCreateInput:
+    name: str
+    teamIds: List[str]
+    description: Optional[str] = None
+    priority: Optional[int] = None
+    state: Optional[str] = None
+
+
+@strawberry.enum
+class PaginationOrderBy(enum.Enum):
+    createdAt = "createdAt"
+    updatedAt = "updatedAt"
+
+
+COMPARATORS = {
+    "eq": lambda a, b: a == b,
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+    "neq": lambda a, b: a != b,
+    "in": lambda a, b: a in b,
+    "nin": lambda a, b: a not in b,
+    "null": lambda a, b: (a is None) == b,
+    "containsIgnoreCase": lambda a, b: a is not None and b.lower() in a.lower(),
+}
+
+
+def matches(item, filter):
+    """
+    Whether `item` passes `{field: {comparator: value}}` filters, which may
+    be combined with `and`/`or`, nested through relations (`{team: {id:
+    ...}}`) or applied to connections with `some`/`every`.
+    """
+    for field, condition in filter.items():
+        if field == "and":
+            if not all(matches(item, part) for part in condition):
+                return False
+            continue
+        if field == "or":
+            if not any(matches(item, part) for part in condition):
+                return False
+            continue
+        if field in ("some", "every"):
+            check = any if field == "some" else all
+            if not check(matches(node, condition) for node in item.nodes):
+                return False
+            continue
+        value = getattr(item, field)
+        for op, operand in condition.items():
+            if op in COMPARATORS:
+                if not COMPARATORS[op](value, operand):
+                    return False
+            elif value is None or not matches(value, {op: operand}):
+                return False
+    return True
+
+
+def select(items, filter, include_archived):
+    """Apply a Linear-style filter and hide archived items unless asked."""
+    if not include_archived:
+        items = [item for item in items if item.archivedAt is None]
+    if filter:
+        items = [item for item in items if matches(item, filter)]
+    return items
+
+
+def paginate(items, first, after):
+    start = int(after) if after else 0
+    end = start + first
+    return {
+        "nodes": items[start:end],
+        "pageInfo": PageInfo(
+            hasNextPage=end < len(items), endCursor=str(min(end, len(items)))
+        ),
+    }
+
+
+PRIORITY_LABELS = ["No priority", "Urgent", "High", "Medium", "Low"]
+
+
+class MockData:
+    """In-memory workspace: `users` users spread over `teams` teams."""
+
+    def __init__(self, users=1000, teams=10, issues=1000, description_size=200):
+        self.description = "x" * description_size
+        self.sync_ids = itertools.count(1)
+        self.users = {
+            f"user-{i}": User(
+                id=f"user-{i}",
+                name=f"User {i}",
+                email=f"user{i}@example.com",
+                url=f"https://linear.app/mock/profiles/user{i}",
+            )
+            for i in range(users)
+        }
+        self.user_list = list(self.users.values())
+        self.teams = {}
+        for t in range(teams):
+            self.teams[f"team-{t}"] = Team(
+                id=f"team-{t}",
+                key=f"T{t}",
+                name=f"Team {t}",
+                member_ids=[f"user-{i}" for i in range(t, users, teams)],
+            )
+        self.team_list = list(self.teams.values())
+        self.state = WorkflowState(
+            id="state-1", name="Todo", position=0, type="unstarted"
+        )
+        # One "Todo" per team, plus a workspace-wide "Bug" label
+        self.states = [
+            WorkflowState(
+                id=f"state-{team.id}",
+                name="Todo",
+                position=0,
+                type="unstarted",
+                team=team,
+            )
+            for team in self.team_list
+        ]
+        self.labels = [IssueLabel(id="label-1", name="Bug")]
+        self.issues = {}
+        for i in range(issues):
+            self.create_issue(
+                {"teamId": f"team-{i % teams}", "title": f"Issue {i}"}, f"issue-{i}"
+            )
+
+    def create_issue(self, data, issue_id=None):
+        issue_id = issue_id or f"issue-{len(self.issues)}-{random.getrandbits(32)}"
+        team = self.teams.get(data["teamId"]) or self.team_list[0]
+        now = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+        priority = data.get("priority") or 0
+        assignee = self.users.get(data.get("assigneeId") or "")
+        states = {state.id: state for state in self.states}
+        labels = {label.id: label for label in self.labels}
+        label_ids = data.get("labelIds") or ["label-1"]
+        issue = Issue(
+            id=issue_id,
+            identifier=f"{team.key}-{len(self.issues)}",
+            title=data["title"],
+            url=f"https://linear.app/mock/issue/{issue_id}",
+            description=data.get("description") or self.description,
+            dueDate=data.get("dueDate"),
+            priority=priority,
+            priorityLabel=PRIORITY_LABELS[priority],
+            assignee=assignee,
+            creator=self.user_list[0],
+            labels=IssueLabelConnection(
+                nodes=[
+                    labels[label_id] for label_id in label_ids if label_id in labels
+                ],
+                pageInfo=PageInfo(hasNextPage=False, endCursor=None),
+            ),
+            project=None,
+            state=states.get(data.get("stateId"), self.state),
+            team=team,
+            createdAt=now,
+            updatedAt=now,
+        )
+        self.issues[issue_id] = issue
+        return issue
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def viewer(self, info: strawberry.Info) -> User:
+        return info.context["data"].user_list[0]
+
+    @strawberry.field
+    def user(self, info: strawberry.Info, id: str) -> Optional[User]:
+        return info.context["data"].users.get(id)
+
+    @strawberry.field
+    def users(
+        self,
+        info: strawberry.Info,
+        first: int = 50,
+        after: Optional[str] = None,
+        filter: Optional[UserFilter] = None,
+        include_archived: Optional[bool] = None,
+    ) -> UserConnection:
+        users = select(info.context["data"].user_list, filter, include_archived)
+        return UserConnection(**paginate(users, first, after))
+
+    @strawberry.field
+    def team(self, info: strawberry.Info, id: str) -> Optional[Team]:
+        return info.context["data"].teams.get(id)
+
+    @strawberry.field
+    def teams(
+        self,
+        info: strawberry.Info,
+        first: int = 50,
+        after: Optional[str] = None,
+        filter: Optional[TeamFilter] = None,
+        include_archived: Optional[bool] = None,
+    ) -> TeamConnection:
+        teams = select(info.context["data"].team_list, filter, include_archived)
+        return TeamConnection(**paginate(teams, first, after))
+
+    @strawberry.field
+    def workflow_states(
+        self, info: strawberry.Info, first: int = 50, after: Optional[str] = None
+    ) -> WorkflowStateConnection:
+        return WorkflowStateConnection(
+            **paginate(info.context["data"].states, first, after)
+        )
+
+    @strawberry.field
+    def issue_labels(
+        self, info: strawberry.Info, first: int = 50, after: Optional[str] = None
+    ) -> IssueLabelConnection:
+        return IssueLabelConnection(
+            **paginate(info.context["data"].labels, first, after)
+        )
+
+    @strawberry.field
+    def issue(self, info: strawberry.Info, id: str) -> Optional[Issue]:
+        return info.context["data"].issues.get(id)
+
+    @strawberry.field
+    def issues(
+        self,
+        info: strawberry.Info,
+        first: int = 50,
+        after: Optional[str] = None,
+        filter: Optional[IssueFilter] = None,
+        include_archived: Optional[bool] = None,
+        order_by: Optional[PaginationOrderBy] = None,
+    ) -> IssueConnection:
+        issues = list(info.context["data"].issues.values())
+        issues = select(issues, filter, include_archived)
+        if order_by is not None:
+            issues.sort(key=lambda issue: getattr(issue, order_by.value), reverse=True)
+        return IssueConnection(**paginate(issues, first, after))
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def issue_create(
+        self, info: strawberry.Info, input: IssueCreateInput
+    ) -> Optional[IssuePayload]:
+        data = info.context["data"]
+        issue = data.create_issue(strawberry.asdict(input))
+        return IssuePayload(success=True, lastSyncId=next(data.sync_ids), issue=issue)
+
+    @strawberry.mutation
+    def issue_update(
+        self, info: strawberry.Info, id: str, input: IssueUpdateInput
+    ) -> Optional[IssuePayload]:
+        data = info.context["data"]
+        issue = data.issues.get(id)
+        if issue is None:
+            raise ValueError("Entity not found")
+        for key, value in strawberry.asdict(input).items():
+            if value is not None and hasattr(issue, key):
+                setattr(issue, key, value)
+        return IssuePayload(success=True, lastSyncId=next(data.sync_ids), issue=issue)
+
+    @strawberry.mutation
+    def issue_delete(
+        self,
+        info: strawberry.Info,
+        id: str,
+        permanently_delete: Optional[bool] = None,
+    ) -> Optional[IssueArchivePayload]:
+        data = info.context["data"]
+        issue = data.issues.pop(id, None)
+        if issue is None:
+            raise ValueError("Entity not found")
+        return IssueArchivePayload(
+            success=True, lastSyncId=next(data.sync_ids), entity=issue
+        )
+
+    @strawberry.mutation
+    def project_create(
+        self, info: strawberry.Info, input: ProjectCreateInput
+    ) -> Optional[ProjectPayload]:
+        data = info.context["data"]
+        project_id = f"project-{random.getrandbits(32)}"
+        project = Project(
+            id=project_id,
+            name=input.name,
+            url=f"https://linear.app/mock/project/{project_id}",
+            description=input.description or "",
+        )
+        return ProjectPayload(
+            success=True, lastSyncId=next(data.sync_ids), project=project
+        )
+
+
+schema = strawberry.Schema(query=Query, mutation=Mutation)
+
+# Resolver errors are part of the responses under test, not server faults
+logging.getLogger("strawberry.execution").setLevel(logging.CRITICAL)
+
+
+class RateLimits:
+    """Tracks a fixed-window request budget and renders Linear's headers."""
+
+    def __init__(self, limit=1500, window=3600):
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self.reset_at = time.time() + window
+
+    def take(self):
+        now = time.time()
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+        self.remaining -= 1
+        return self.remaining >= 0
+
+    def headers(self):
+        return {
+            "X-RateLimit-Requests-Limit": str(self.limit),
+            "X-RateLimit-Requests-Remaining": str(max(0, self.remaining)),
+            "X-RateLimit-Requests-Reset": str(int(self.reset_at * 1000)),
+        }
+
+
+def create_app(data=None, latency=0.0, error_rate=0.0, rate_limit=None, compress=False):
+    """
+    Build the ASGI app. `latency` is added to every request, a fraction
+    `error_rate` of requests fail with a 500, and `rate_limit` (requests per
+    hour) enables rate-limit headers and RATELIMITED errors. With `compress`,
+    responses are compressed for clients that accept it. Gzipped request
+    bodies are always accepted.
+    """
+    data = data if data is not None else MockData()
+    limits = RateLimits(rate_limit) if rate_limit else None
+
+    async def graphql(request: Request):
+        raw = await request.body()
+        if request.headers.get("content-encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        body = json.loads(raw)
+        if latency:
+            await asyncio.sleep(latency)
+
+        headers = {}
+        if limits is not None:
+            allowed = limits.take()
+            headers = limits.headers()
+            if not allowed:
+                error = {"message": "Rate limit exceeded"}
+                error["extensions"] = {"code": "RATELIMITED"}
+                return JSONResponse({"errors": [error]}, 400, headers=headers)
+
+        if error_rate and random.random() < error_rate:
+            return JSONResponse({"errors": [{"message": "Injected"}]}, 500)
+
+        result = await schema.execute(
+            body.get("query"),
+            variable_values=body.get("variables"),
+            context_value={"data": data},
+        )
+        payload = {"data": result.data}
+        if result.errors:
+            payload["errors"] = [error.formatted for error in result.errors]
+        return JSONResponse(payload, headers=headers)
+
+    middleware = [Middleware(GZipMiddleware, minimum_size=500)] if compress else []
+    return Starlette(
+        routes=[Route("/graphql", graphql, methods=["POST"])], middleware=middleware
+    )
+
+
+class MockLinearServer:
+    """
+    Runs the mock API with uvicorn on a background thread:
+
+        with MockLinearServer(latency=0.01) as server:
+            client = LinearClient("key", base_url=server.url)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, **app_options):
+        self.host = host
+        self.port = port or _free_port(host)
+        self.url = f"http://{self.host}:{self.port}/graphql"
+        config = uvicorn.Config(
+            create_app(**app_options), host=host, port=self.port, log_level="error"
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def stop(self):
+        self._server.should_exit = True
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def _free_port(host):
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
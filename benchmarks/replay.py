@@ -0,0 +1,136 @@
+"""
+Offline load test: record a session once, then replay it with many
+concurrent virtual clients at the recorded latencies, to measure the
+client's own overhead and how many clients a process can drive.
+
+    python -m benchmarks.replay record session.ndjson.gz --latency 0.05
+    python -m benchmarks.replay replay session.ndjson.gz --clients 50
+    python -m benchmarks.replay replay session.ndjson.gz --clients 50 --speed 4
+    python -m benchmarks.replay replay session.ndjson.gz --clients 200 --speed 0
+
+`record` runs a mixed workload (single reads, pages of users, bulk
+creates) against the mock server through a RecordingTransport; any code
+using a client with `transport=RecordingTransport(path)` records a
+cassette the same way, including against the real API. `replay` gives
+every virtual client its own LinearClient on one shared ReplayTransport
+and sends the recorded requests in their recorded order and spacing.
+--speed scales time (2 is twice as fast); 0 drops all waits, leaving
+only client-side cost. "CPU ms/call" is the calling threads' CPU time
+per request.
+"""
+
+import argparse
+import threading
+import time
+
+from linear_python import LinearClient, RecordingTransport, ReplayTransport
+from linear_python.codec import loads
+
+from .mock_server import MockData, MockLinearServer
+from .run import Result
+
+API_KEY = "lin_api_benchmark"
+
+
+def record(args):
+    data = MockData(users=args.users, teams=args.teams, issues=args.issues)
+    with MockLinearServer(data=data, latency=args.latency) as server:
+        transport = RecordingTransport(args.cassette)
+        with LinearClient(API_KEY, base_url=server.url, transport=transport) as client:
+            for i in range(args.calls):
+                client.get_issue(f"issue-{i % args.issues}")
+            for i, _ in enumerate(client.iter_users(page_size=args.page_size)):
+                if i >= args.page_size * 5:
+                    break
+            team_id = client.get_teams()["nodes"][0]["id"]
+            client.create_issues(
+                [{"title": f"Replay {i}", "teamId": team_id} for i in range(args.bulk)]
+            )
+    print(f"recorded {transport.recorded} requests to {args.cassette}")
+
+
+def _virtual_client(transport, requests, speed, start, timings, cpu, lock):
+    own_timings = []
+    with LinearClient(API_KEY, transport=transport) as client:
+        cpu_start = time.thread_time()
+        for at, query, variables in requests:
+            if speed:
+                delay = start + at / speed - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            sent = time.perf_counter()
+            client._make_request(query, variables)
+            own_timings.append(time.perf_counter() - sent)
+        used = time.thread_time() - cpu_start
+    with lock:
+        timings.extend(own_timings)
+        cpu.append(used)
+
+
+def replay(args):
+    speed = args.speed or None
+    transport = ReplayTransport(args.cassette, speed=speed)
+    requests = []
+    for interaction in transport.interactions:
+        body = loads(interaction.request)
+        # Hash-only persisted queries can't be re-sent without the document
+        if body.get("query") is not None:
+            requests.append((interaction.at, body["query"], body.get("variables")))
+
+    timings = []
+    cpu = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(
+            target=_virtual_client,
+            args=(transport, requests, speed, start, timings, cpu, lock),
+        )
+        for _ in range(args.clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    label = "max" if speed is None else f"{speed:g}x"
+    result = Result(f"{args.clients} clients @ {label}", timings, elapsed, 0)
+    print(
+        f"{'scenario':<28} {'calls':>7} {'p50 (ms)':>9} {'p99 (ms)':>9} "
+        f"{'calls/s':>11} {'CPU ms/call':>11}"
+    )
+    print(
+        f"{result.name:<28} {len(timings):>7} "
+        f"{result.percentile(50) * 1000:>9.2f} {result.percentile(99) * 1000:>9.2f} "
+        f"{len(timings) / elapsed:>11.1f} {sum(cpu) / max(len(timings), 1) * 1000:>11.3f}"
+    )
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recorder = commands.add_parser("record", help="record a cassette")
+    recorder.add_argument("cassette")
+    recorder.add_argument("--calls", type=int, default=200)
+    recorder.add_argument("--users", type=int, default=10_000)
+    recorder.add_argument("--teams", type=int, default=10)
+    recorder.add_argument("--issues", type=int, default=1000)
+    recorder.add_argument("--page-size", type=int, default=50)
+    recorder.add_argument("--bulk", type=int, default=200)
+    recorder.add_argument("--latency", type=float, default=0.0)
+    recorder.set_defaults(run=record)
+
+    replayer = commands.add_parser("replay", help="replay a cassette")
+    replayer.add_argument("cassette")
+    replayer.add_argument("--clients", type=int, default=10)
+    replayer.add_argument("--speed", type=float, default=1.0)
+    replayer.set_defaults(run=replay)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    args.run(args)
@@ -0,0 +1,207 @@
+"""
+Benchmarks for linear-python against the local mock server.
+
+    python -m benchmarks.run                    # all scenarios
+    python -m benchmarks.run single fanout      # a subset
+    python -m benchmarks.run --latency 0.02 --users 100000
+
+Every scenario reports p50/p99 latency per call, throughput and the peak
+memory traced while it ran, so results can be compared across commits.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from linear_python import LinearClient
+
+from .mock_server import MockData, MockLinearServer
+
+API_KEY = "lin_api_benchmark"
+
+
+class Result:
+    def __init__(self, name, timings, elapsed, peak_memory, items=None):
+        self.name = name
+        self.timings = sorted(timings)
+        self.elapsed = elapsed
+        self.peak_memory = peak_memory
+        self.items = items if items is not None else len(timings)
+
+    def percentile(self, p):
+        if not self.timings:
+            return 0.0
+        index = min(len(self.timings) - 1, round(p / 100 * (len(self.timings) - 1)))
+        return self.timings[index]
+
+    def row(self):
+        return (
+            f"{self.name:<28} {len(self.timings):>7} "
+            f"{self.percentile(50) * 1000:>9.2f} {self.percentile(99) * 1000:>9.2f} "
+            f"{self.items / self.elapsed:>11.1f} {self.peak_memory / 2**20:>9.2f}"
+        )
+
+
+HEADER = (
+    f"{'scenario':<28} {'calls':>7} {'p50 (ms)':>9} {'p99 (ms)':>9} "
+    f"{'items/s':>11} {'peak MiB':>9}"
+)
+
+
+def measure(name, fn):
+    """Run `fn(timings)`; it appends per-call seconds and returns an item count."""
+    timings = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = fn(timings)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return Result(name, timings, elapsed, peak, items)
+
+
+def timed(timings, fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    timings.append(time.perf_counter() - start)
+    return result
+
+
+def bench_single(client, args):
+    def run(timings):
+        for i in range(args.calls):
+            timed(timings, client.get_issue, f"issue-{i % args.issues}")
+
+    return measure("single get_issue", run)
+
+
+def bench_fanout(client, args):
+    def run(timings):
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            list(
+                pool.map(
+                    lambda i: timed(timings, client.get_user, f"user-{i % args.users}"),
+                    range(args.calls),
+                )
+            )
+
+    return measure(f"fan-out get_user x{args.concurrency}", run)
+
+
+def bench_async_fanout(server, args):
+    from linear_python import AsyncLinearClient
+
+    async def main(timings):
+        async def call(i):
+            start = time.perf_counter()
+            await client.get_user(f"user-{i % args.users}")
+            timings.append(time.perf_counter() - start)
+
+        async with AsyncLinearClient(
+            API_KEY, transport=_async_transport(args), base_url=server.url
+        ) as client:
+            await asyncio.gather(*(call(i) for i in range(args.calls)))
+
+    return measure(f"async fan-out x{args.concurrency}", lambda t: asyncio.run(main(t)))
+
+
+def _async_transport(args):
+    from linear_python import HTTPXAsyncTransport
+
+    return HTTPXAsyncTransport(max_concurrency=args.concurrency, http2=False)
+
+
+def bench_paginate(client, args, prefetch=False, stream=False):
+    def run(timings):
+        count = 0
+        pages = client.iter_users(
+            page_size=args.page_size, prefetch=prefetch, stream=stream
+        )
+        start = time.perf_counter()
+        for count, _ in enumerate(pages, 1):
+            if count % args.page_size == 0:
+                timings.append(time.perf_counter() - start)
+                start = time.perf_counter()
+        return count
+
+    name = "paginate users"
+    if prefetch:
+        name += " (prefetch)"
+    if stream:
+        name += " (stream)"
+    return measure(name, run)
+
+
+def bench_bulk_create(client, args):
+    inputs = [{"teamId": "team-0", "title": f"Bulk {i}"} for i in range(args.bulk)]
+
+    def run(timings):
+        timed(timings, client.create_issues, inputs)
+        return len(inputs)
+
+    return measure(f"bulk create_issues x{args.bulk}", run)
+
+
+SCENARIOS = ["single", "fanout", "async", "paginate", "prefetch", "stream", "bulk"]
+
+
+def run(args):
+    data = MockData(users=args.users, teams=args.teams, issues=args.issues)
+    results = []
+    with MockLinearServer(
+        data=data,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+    ) as server:
+        with LinearClient(API_KEY, base_url=server.url) as client:
+            for scenario in args.scenarios:
+                if scenario == "single":
+                    results.append(bench_single(client, args))
+                elif scenario == "fanout":
+                    results.append(bench_fanout(client, args))
+                elif scenario == "async":
+                    try:
+                        results.append(bench_async_fanout(server, args))
+                    except ImportError:
+                        print("skipping async fan-out: httpx is not installed")
+                elif scenario == "paginate":
+                    results.append(bench_paginate(client, args))
+                elif scenario == "prefetch":
+                    results.append(bench_paginate(client, args, prefetch=True))
+                elif scenario == "stream":
+                    results.append(bench_paginate(client, args, stream=True))
+                elif scenario == "bulk":
+                    results.append(bench_bulk_create(client, args))
+
+    print(HEADER)
+    for result in results:
+        print(result.row())
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenarios", nargs="*", help=", ".join(SCENARIOS))
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--teams", type=int, default=10)
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--bulk", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    args.scenarios = args.scenarios or SCENARIOS
+    return args
+
+
+if __name__ == "__main__":
+    run(parse_args())
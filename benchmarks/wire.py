@@ -0,0 +1,173 @@
+"""
+Wire-size benchmark: bytes on the wire and client CPU per request (of the
+calling thread, so the in-process mock server isn't counted), with and
+without compression, and for the stdlib json codec vs orjson.
+
+    python -m benchmarks.wire
+    python -m benchmarks.wire --issues 2000 --description-size 4000
+
+Responses come from the mock server with gzip enabled; "identity" rows
+turn off Accept-Encoding to show what the same pages cost uncompressed.
+"""
+
+import argparse
+import json
+import random
+import time
+
+from linear_python import Hook, LinearClient, RequestsTransport
+from linear_python import codec
+
+from .mock_server import MockData, MockLinearServer
+
+API_KEY = "lin_api_benchmark"
+
+PAGE_FIELDS = "id identifier title description priority state { name } labels { name }"
+
+WORDS = (
+    "the issue when user clicks button page loads error crash after deploy "
+    "expected behavior steps reproduce api returns null field timeout retry "
+    "mobile safari android release regression customer reported dashboard"
+).split()
+
+
+def prose(size, rng):
+    """Roughly `size` characters of ticket-like text (compresses like prose)."""
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+class WireBytes(Hook):
+    """Sums request bytes as sent (after any compression)."""
+
+    def __init__(self):
+        self.requests = 0
+        self.request_bytes = 0
+
+    def after(self, info):
+        self.requests += 1
+        self.request_bytes += info.request_bytes
+
+
+class CountingTransport(RequestsTransport):
+    """Records response bytes as received, before decompression."""
+
+    def __init__(self, accept_encoding=None):
+        super().__init__()
+        if accept_encoding is not None:
+            self.accept_encoding = accept_encoding
+        self.responses = 0
+        self.response_bytes = 0
+        self.bodies = []
+
+    def post(self, *args, **kwargs):
+        response = super().post(*args, **kwargs)
+        length = response.headers.get("Content-Length")
+        self.responses += 1
+        self.response_bytes += int(length) if length else len(response.content)
+        self.bodies.append(response.content)
+        return response
+
+
+def row(name, requests, wire_bytes, cpu):
+    return (
+        f"{name:<32} {requests:>8} {wire_bytes / requests / 1024:>14.1f} "
+        f"{cpu / requests * 1000:>12.3f}"
+    )
+
+
+HEADER = f"{'scenario':<32} {'requests':>8} {'KiB/request':>14} {'CPU ms/req':>12}"
+
+
+def bench_reads(url, page_size, accept_encoding):
+    transport = CountingTransport(accept_encoding)
+    client = LinearClient(API_KEY, transport=transport, base_url=url)
+    start = time.thread_time()
+    for _ in client.iter_issues(page_size=page_size, fields=PAGE_FIELDS):
+        pass
+    cpu = time.thread_time() - start
+    return transport, cpu
+
+
+def bench_codec(name, loads, dumps, bodies, variables):
+    start = time.thread_time()
+    for body in bodies:
+        loads(body)
+    for _ in bodies:
+        dumps(variables)
+    cpu = time.thread_time() - start
+    size = sum(len(dumps(variables)) for _ in bodies)
+    return row(name, len(bodies), size, cpu)
+
+
+def bench_writes(url, items, compress_requests):
+    wire = WireBytes()
+    client = LinearClient(
+        API_KEY, base_url=url, hooks=[wire], compress_requests=compress_requests
+    )
+    start = time.thread_time()
+    client.create_issues(items)
+    cpu = time.thread_time() - start
+    return row(
+        f"bulk create, gzip={bool(compress_requests)}",
+        wire.requests,
+        wire.request_bytes,
+        cpu,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--description-size", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--bulk", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    data = MockData(
+        users=100, teams=5, issues=args.issues, description_size=args.description_size
+    )
+    rng = random.Random(0)
+    for issue in data.issues.values():
+        issue.description = prose(args.description_size, rng)
+
+    with MockLinearServer(data=data, compress=True) as server:
+        print(HEADER)
+        bodies = []
+        for name, encoding in (("identity", "identity"), ("negotiated", None)):
+            transport, cpu = bench_reads(server.url, args.page_size, encoding)
+            label = f"read pages, {encoding or transport.accept_encoding}"
+            print(row(label, transport.responses, transport.response_bytes, cpu))
+            bodies = transport.bodies
+
+        items = [
+            {"teamId": "team-0", "title": f"Bulk {i}", "description": prose(500, rng)}
+            for i in range(args.bulk)
+        ]
+        variables = {f"input_{i}": item for i, item in enumerate(items[:50])}
+        print(
+            bench_codec(
+                "codec, json",
+                json.loads,
+                lambda value: json.dumps(value, separators=(",", ":")).encode(),
+                bodies,
+                variables,
+            )
+        )
+        if codec.orjson is not None:
+            print(
+                bench_codec(
+                    "codec, orjson", codec.loads, codec.dumps, bodies, variables
+                )
+            )
+        for compress_requests in (False, True):
+            print(bench_writes(server.url, items, compress_requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,133 @@
-from .base import BaseClient
-from .client import LinearClient
-from .config import Config
-from .resources.issues import IssueClient
-from .resources.projects import ProjectClient
-from .resources.teams import TeamClient
-from .resources.users import UserClient
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import (
+        AsyncBaseClient,
+        AsyncTransport,
+        BaseClient,
+        HTTPXAsyncTransport,
+        HTTPXTransport,
+        LinearAPIError,
+        RequestsTransport,
+        Transport,
+    )
+    from .cache import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+    from .cassette import AsyncReplayTransport, RecordingTransport, ReplayTransport
+    from .client import AsyncLinearClient, LinearClient
+    from .config import Config
+    from .instrumentation import (
+        Hook,
+        OpenTelemetryHook,
+        PrometheusMetrics,
+        RequestInfo,
+    )
+    from .ratelimit import RetryPolicy, Scheduler
+    from .resolver import ResolverIndex
+    from .resources.issues import AsyncIssueClient, IssueClient
+    from .resources.projects import AsyncProjectClient, ProjectClient
+    from .resources.teams import AsyncTeamClient, TeamClient
+    from .resources.users import AsyncUserClient, UserClient
+    from .sync import AsyncSyncEngine, MemoryStore, SQLiteStore, SyncEngine
+    from .webhooks import WebhookEvent, WebhookReceiver
+    from .writebehind import WriteBehindQueue
+
+# Exported name -> submodule. Submodules are imported on first access so
+# `import linear_python` stays cheap (requests, strawberry and dotenv are
+# only loaded by the parts that need them)
+_EXPORTS = {
+    "AsyncBaseClient": "base",
+    "AsyncTransport": "base",
+    "BaseClient": "base",
+    "HTTPXAsyncTransport": "base",
+    "HTTPXTransport": "base",
+    "LinearAPIError": "base",
+    "RequestsTransport": "base",
+    "Transport": "base",
+    "MemoryCacheBackend": "cache",
+    "ResponseCache": "cache",
+    "SQLiteCacheBackend": "cache",
+    "AsyncReplayTransport": "cassette",
+    "RecordingTransport": "cassette",
+    "ReplayTransport": "cassette",
+    "AsyncLinearClient": "client",
+    "LinearClient": "client",
+    "Config": "config",
+    "Hook": "instrumentation",
+    "OpenTelemetryHook": "instrumentation",
+    "PrometheusMetrics": "instrumentation",
+    "RequestInfo": "instrumentation",
+    "RetryPolicy": "ratelimit",
+    "Scheduler": "ratelimit",
+    "ResolverIndex": "resolver",
+    "AsyncIssueClient": "resources.issues",
+    "IssueClient": "resources.issues",
+    "AsyncProjectClient": "resources.projects",
+    "ProjectClient": "resources.projects",
+    "AsyncTeamClient": "resources.teams",
+    "TeamClient": "resources.teams",
+    "AsyncUserClient": "resources.users",
+    "UserClient": "resources.users",
+    "AsyncSyncEngine": "sync",
+    "MemoryStore": "sync",
+    "SQLiteStore": "sync",
+    "SyncEngine": "sync",
+    "WebhookEvent": "webhooks",
+    "WebhookReceiver": "webhooks",
+    "WriteBehindQueue": "writebehind",
+}
 
 __all__ = [
+    "AsyncBaseClient",
+    "AsyncIssueClient",
+    "AsyncLinearClient",
+    "AsyncProjectClient",
+    "AsyncReplayTransport",
+    "AsyncSyncEngine",
+    "AsyncTeamClient",
+    "AsyncTransport",
+    "AsyncUserClient",
     "BaseClient",
+    "HTTPXAsyncTransport",
+    "Hook",
+    "HTTPXTransport",
+    "LinearAPIError",
+    "RequestsTransport",
+    "Transport",
     "LinearClient",
+    "MemoryCacheBackend",
+    "MemoryStore",
+    "OpenTelemetryHook",
+    "PrometheusMetrics",
+    "RecordingTransport",
+    "ReplayTransport",
+    "RequestInfo",
+    "ResolverIndex",
+    "ResponseCache",
+    "SQLiteCacheBackend",
+    "SQLiteStore",
+    "SyncEngine",
     "Config",
     "IssueClient",
     "ProjectClient",
+    "RetryPolicy",
+    "Scheduler",
     "TeamClient",
     "UserClient",
+    "WebhookEvent",
+    "WebhookReceiver",
+    "WriteBehindQueue",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -1,27 +1,633 @@
+import threading
+from functools import partial
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from .codec import (
+    DEFAULT_COMPRESS_THRESHOLD,
+    accept_encoding,
+    compress,
+    response_json,
+)
+from .compose import compose
+from .errors import LinearAPIError
+from .instrumentation import ainstrument, instrument
+from .loader import AsyncDataLoader, DataLoader
+from .models import decode
+from . import registry
+from .operations import build_batch, split_batch_response, split_query_response
+from .resolver import REFERENCE_KEYS, needs_issue_team
+from .streaming import AsyncNodeStream, NodeStream, iter_chunks
+
+DEFAULT_BASE_URL = "https://api.linear.app/graphql"
+
+
+class Transport:
+    """
+    HTTP layer used by BaseClient to talk to the Linear API. With
+    `stream=True`, `post` returns before the body is read so it can be
+    consumed incrementally.
+    """
+
+    def post(self, url, headers=None, json=None, data=None, stream=False):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    Pooled, keep-alive transport backed by requests. Connections to
+    api.linear.app are reused across calls instead of paying a new TCP+TLS
+    handshake per request.
+
+    Safe to share between threads: requests.Session isn't thread-safe, so
+    every thread gets its own lightweight session, but all of them are
+    mounted on one HTTPAdapter and so draw from one connection pool.
+    """
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        keep_alive=True,
+        connect_timeout=5.0,
+        read_timeout=30.0,
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.keep_alive = keep_alive
+        self.accept_encoding = accept_encoding()
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self._local = threading.local()
+
+    @property
+    def session(self):
+        """The calling thread's session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            session.headers["Accept-Encoding"] = self.accept_encoding
+            if not self.keep_alive:
+                session.headers["Connection"] = "close"
+        return session
+
+    def post(self, url, headers=None, json=None, data=None, stream=False):
+        return self.session.post(
+            url,
+            headers=headers,
+            json=json,
+            data=data,
+            timeout=self.timeout,
+            stream=stream,
+        )
+
+    def close(self):
+        # Closing the shared adapter drops the pooled connections of every
+        # thread's session
+        self.adapter.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    Pooled transport backed by httpx, with optional HTTP/2.
+    Requires the `http2` extra: pip install "linear-python[http2]"
+    """
+
+    def __init__(
+        self,
+        pool_maxsize=10,
+        keep_alive=True,
+        connect_timeout=5.0,
+        read_timeout=30.0,
+        keepalive_expiry=30.0,
+        http2=True,
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                'HTTPXTransport requires httpx: pip install "linear-python[http2]"'
+            ) from e
+
+        limits = httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            keepalive_expiry=keepalive_expiry,
+        )
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.client = httpx.Client(http2=http2, limits=limits, timeout=timeout)
+
+    def post(self, url, headers=None, json=None, data=None, stream=False):
+        if not stream:
+            return self.client.post(url, headers=headers, json=json, content=data)
+
+        request = self.client.build_request(
+            "POST", url, headers=headers, json=json, content=data
+        )
+        response = self.client.send(request, stream=True)
+        if response.status_code != 200:
+            # Error bodies are small; read them so .json() works for retries
+            response.read()
+        return response
+
+    def close(self):
+        self.client.close()
+
+
+def _setup_compression(client, compress_requests):
+    # gzip request bodies of at least `compress_threshold` bytes, e.g. large
+    # batched mutations; True uses the default threshold
+    if compress_requests is True:
+        compress_requests = DEFAULT_COMPRESS_THRESHOLD
+    client.compress_threshold = compress_requests or None
+    client._compressed_headers = {**client.headers, "Content-Encoding": "gzip"}
+
+
+def _has_references(client, data):
+    if not isinstance(data, dict) or REFERENCE_KEYS.keys().isdisjoint(data):
+        return False
+    if client.resolver is None:
+        raise ValueError(
+            "team, assignee, state and labels references need a resolver: "
+            "pass resolver=ResolverIndex() to the client, or use IDs"
+        )
+    return True
+
+
+def _forget_moved_issue(client, data, issue_id):
+    # An update that sets the team moves the issue, so the team the
+    # resolver remembers for it is about to be wrong
+    if (
+        issue_id is not None
+        and client.resolver is not None
+        and isinstance(data, dict)
+        and ("team" in data or "teamId" in data)
+    ):
+        client.resolver.forget_issue_team(issue_id)
 
 
 class BaseClient:
-    def __init__(self, api_key):
+    def __init__(
+        self,
+        api_key,
+        transport=None,
+        coalesce_window=None,
+        cache=None,
+        scheduler=None,
+        persisted_queries=False,
+        base_url=DEFAULT_BASE_URL,
+        models=False,
+        hooks=(),
+        compress_requests=False,
+        resolver=None,
+    ):
         self.api_key = api_key
-        self.base_url = "https://api.linear.app/graphql"
+        self.base_url = base_url
         self.headers = {
             "Authorization": api_key,
             "Content-Type": "application/json",
         }
+        self.transport = transport if transport is not None else RequestsTransport()
+        # Seconds to collect concurrent single-ID lookups into one request
+        self.coalesce_window = coalesce_window
+        self._loaders = {}
+        # Optional ResponseCache for read queries
+        self.cache = cache
+        # Optional rate-limit-aware Scheduler, shared across sub-clients
+        self.scheduler = scheduler
+        # Send only query hashes when the server (or a proxy) supports it
+        self.persisted_queries = persisted_queries
+        # Return compact slotted models instead of dicts from read methods
+        self.models = models
+        # Instrumentation hooks (see linear_python.instrumentation)
+        self.hooks = tuple(hooks)
+        _setup_compression(self, compress_requests)
+        # Optional ResolverIndex mapping names, emails and team keys to IDs
+        self.resolver = resolver
+
+    def close(self):
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _post(self, compiled, body, stream=False):
+        headers = self.headers
+        if self.compress_threshold is not None and len(body) >= self.compress_threshold:
+            body = compress(body)
+            headers = self._compressed_headers
+        send = partial(self.transport.post, self.base_url, headers=headers, data=body)
+        if stream:
+            send = partial(send, stream=True)
+        if self.scheduler is not None:
+            send = partial(self.scheduler.execute, send, compiled.name, compiled.kind)
+        if self.hooks:
+            return instrument(self.hooks, compiled.name, body, send, stream)
+        return send()
+
+    def _make_request(self, query, variables=None, cache_tags=(), use_cache=True):
+        cache_key = None
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cache_key, cached = self.cache.lookup(self.api_key, query, variables)
+            if cached is not None:
+                return cached
+
+        compiled = registry.lookup(query)
+        persisted = self.persisted_queries
+        response = self._post(
+            compiled, compiled.body(variables, persisted, include_query=False)
+        )
+        if persisted and registry.persisted_query_missing(response):
+            # Server doesn't know the hash yet; send the full document once
+            response = self._post(compiled, compiled.body(variables, persisted))
+
+        if response.status_code != 200:
+            return None
+
+        result = response_json(response)
+        if use_cache:
+            self.cache.store(cache_key, query, result, cache_tags)
+        return result
+
+    def _stream_nodes(self, query, variables, path):
+        """
+        Send `query` and return a NodeStream over the nodes at
+        data.<path>, decoded as the response body arrives. Streamed
+        responses bypass the response cache.
+        """
+        compiled = registry.lookup(query)
+        response = self._post(
+            compiled, compiled.body(variables, self.persisted_queries), stream=True
+        )
+        if response.status_code != 200:
+            response.close()
+            raise LinearAPIError(f"request failed with status {response.status_code}")
+        return NodeStream(
+            iter_chunks(response), ("data",) + tuple(path), close=response.close
+        )
+
+    def _decode(self, value, type_):
+        return decode(value, type_) if self.models else value
+
+    def _decode_nodes(self, nodes, type_):
+        if not self.models:
+            return nodes
+        return (decode(node, type_) for node in nodes)
+
+    def _invalidate(self, *tags):
+        if self.cache is not None:
+            self.cache.invalidate(*tags)
+
+    def _resolve_references(self, data, issue_id=None):
+        """
+        Replace human-readable references (team, assignee, state, labels)
+        in an issue input with IDs, using the resolver index. Pass the
+        issue's ID for updates, so state and label names are scoped to its
+        team.
+        """
+        _forget_moved_issue(self, data, issue_id)
+        if not _has_references(self, data):
+            return data
+        return self.resolver.resolve_issue_input(self, data, issue_id)
+
+    def _load_issue_teams(self, updates):
+        """
+        Look up, in batched requests, the teams of the issues in `updates`
+        ({issue_id: data}) whose state or label names need one.
+        """
+        issue_ids = [i for i, data in updates.items() if needs_issue_team(data)]
+        if issue_ids and self.resolver is not None:
+            self.resolver.issue_teams(self, issue_ids)
 
-    def _make_request(self, query, variables=None):
-        response = requests.post(
-            self.base_url,
-            headers=self.headers,
-            json={"query": query, "variables": variables},
+    def _make_batch_request(self, name, calls, batch_size):
+        """
+        Send `calls`, a list of (operation, variables), as aliased documents
+        of at most `batch_size` operations each. Returns one result per call.
+        """
+        results = []
+        for start in range(0, len(calls), batch_size):
+            document, variables, aliases = build_batch(
+                name, calls[start : start + batch_size]
+            )
+            response = self._make_request(document, variables)
+            results.extend(split_batch_response(response, aliases))
+        return results
+
+    def fetch_many(self, *calls, **named):
+        """
+        Send several reads, built with linear_python.compose.Q, as one
+        request:
+
+            viewer, teams, eng = client.fetch_many(
+                Q.get_viewer(), Q.get_teams(), Q.get_team("team-id")
+            )
+
+        Results come back in order, each shaped as its own method returns
+        it. Pass the calls as keyword arguments to get a dict instead.
+        """
+        if calls and named:
+            raise TypeError("pass calls positionally or by name, not both")
+        if named:
+            return dict(zip(named, self.fetch_many(*named.values())))
+        if not calls:
+            return []
+
+        document, variables, aliases, tags = compose(calls)
+        response = self._make_request(document, variables, cache_tags=tags)
+        return [
+            self._decode(result, call.type_)
+            for call, result in zip(calls, split_query_response(response, aliases))
+        ]
+
+    def _load(self, operation, key):
+        """
+        Run a single-variable query for `key`, coalescing it with lookups
+        from other threads made within `coalesce_window` seconds.
+        """
+        loader = self._loaders.get(operation)
+        if loader is None:
+            loader = self._loaders.setdefault(
+                operation,
+                DataLoader(
+                    partial(self._load_many, operation), window=self.coalesce_window
+                ),
+            )
+        return loader.load(key)
+
+    def _load_many(self, operation, keys):
+        (variable,) = operation.variables
+        calls = [(operation, {variable: key}) for key in keys]
+        document, variables, aliases = build_batch(operation.name, calls)
+        tags = [f"{operation.field}:{key}" for key in keys]
+        response = self._make_request(document, variables, cache_tags=tags)
+        return split_query_response(response, aliases)
+
+
+class AsyncTransport:
+    """
+    Async HTTP layer used by AsyncBaseClient. At most `max_concurrency`
+    requests are in flight at once; the rest wait on a semaphore.
+    """
+
+    def __init__(self, max_concurrency=100):
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+
+    async def post(self, url, headers=None, json=None, data=None, stream=False):
+        if self._semaphore is None:
+            # asyncio is imported where used so sync clients never load it
+            import asyncio
+
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Only streaming-capable transports need to accept `stream`
+        options = {"stream": True} if stream else {}
+        async with self._semaphore:
+            return await self._send(
+                url, headers=headers, json=json, data=data, **options
+            )
+
+    async def _send(self, url, headers=None, json=None, data=None):
+        raise NotImplementedError
+
+    async def aclose(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class HTTPXAsyncTransport(AsyncTransport):
+    """
+    Pooled async transport backed by httpx.AsyncClient.
+    Requires the `async` extra: pip install "linear-python[async]"
+    """
+
+    def __init__(
+        self,
+        max_concurrency=100,
+        pool_maxsize=100,
+        keep_alive=True,
+        connect_timeout=5.0,
+        read_timeout=30.0,
+        keepalive_expiry=30.0,
+        http2=False,
+    ):
+        super().__init__(max_concurrency=max_concurrency)
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                'HTTPXAsyncTransport requires httpx: pip install "linear-python[async]"'
+            ) from e
+
+        limits = httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            keepalive_expiry=keepalive_expiry,
         )
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.client = httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
 
-        # Add debugging information
-        # print(f"Status Code: {response.status_code}")
-        # print(f"Response: {response.text}")
+    async def _send(self, url, headers=None, json=None, data=None, stream=False):
+        if not stream:
+            return await self.client.post(url, headers=headers, json=json, content=data)
+
+        request = self.client.build_request(
+            "POST", url, headers=headers, json=json, content=data
+        )
+        response = await self.client.send(request, stream=True)
+        if response.status_code != 200:
+            await response.aread()
+        return response
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+class AsyncBaseClient:
+    def __init__(
+        self,
+        api_key,
+        transport=None,
+        coalesce_window=None,
+        cache=None,
+        scheduler=None,
+        persisted_queries=False,
+        base_url=DEFAULT_BASE_URL,
+        models=False,
+        hooks=(),
+        compress_requests=False,
+        resolver=None,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.headers = {
+            "Authorization": api_key,
+            "Content-Type": "application/json",
+        }
+        self.transport = transport if transport is not None else HTTPXAsyncTransport()
+        self.coalesce_window = coalesce_window
+        self._loaders = {}
+        self.cache = cache
+        self.scheduler = scheduler
+        self.persisted_queries = persisted_queries
+        self.models = models
+        self.hooks = tuple(hooks)
+        _setup_compression(self, compress_requests)
+        self.resolver = resolver
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _post(self, compiled, body, stream=False):
+        headers = self.headers
+        if self.compress_threshold is not None and len(body) >= self.compress_threshold:
+            body = compress(body)
+            headers = self._compressed_headers
+        send = partial(self.transport.post, self.base_url, headers=headers, data=body)
+        if stream:
+            send = partial(send, stream=True)
+        if self.scheduler is not None:
+            send = partial(self.scheduler.aexecute, send, compiled.name, compiled.kind)
+        if self.hooks:
+            return await ainstrument(self.hooks, compiled.name, body, send, stream)
+        return await send()
+
+    async def _make_request(self, query, variables=None, cache_tags=(), use_cache=True):
+        cache_key = None
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            cache_key, cached = self.cache.lookup(self.api_key, query, variables)
+            if cached is not None:
+                return cached
+
+        compiled = registry.lookup(query)
+        persisted = self.persisted_queries
+        response = await self._post(
+            compiled, compiled.body(variables, persisted, include_query=False)
+        )
+        if persisted and registry.persisted_query_missing(response):
+            # Server doesn't know the hash yet; send the full document once
+            response = await self._post(compiled, compiled.body(variables, persisted))
 
         if response.status_code != 200:
             return None
 
-        return response.json()
+        result = response_json(response)
+        if use_cache:
+            self.cache.store(cache_key, query, result, cache_tags)
+        return result
+
+    async def _stream_nodes(self, query, variables, path):
+        """Async version of BaseClient._stream_nodes"""
+        compiled = registry.lookup(query)
+        response = await self._post(
+            compiled, compiled.body(variables, self.persisted_queries), stream=True
+        )
+        if response.status_code != 200:
+            await response.aclose()
+            raise LinearAPIError(f"request failed with status {response.status_code}")
+        return AsyncNodeStream(
+            response.aiter_bytes(), ("data",) + tuple(path), aclose=response.aclose
+        )
+
+    def _decode(self, value, type_):
+        return decode(value, type_) if self.models else value
+
+    def _decode_nodes(self, nodes, type_):
+        if not self.models:
+            return nodes
+        return _adecode_nodes(nodes, type_)
+
+    def _invalidate(self, *tags):
+        if self.cache is not None:
+            self.cache.invalidate(*tags)
+
+    async def _resolve_references(self, data, issue_id=None):
+        """Async version of BaseClient._resolve_references"""
+        _forget_moved_issue(self, data, issue_id)
+        if not _has_references(self, data):
+            return data
+        return await self.resolver.aresolve_issue_input(self, data, issue_id)
+
+    async def _load_issue_teams(self, updates):
+        """Async version of BaseClient._load_issue_teams"""
+        issue_ids = [i for i, data in updates.items() if needs_issue_team(data)]
+        if issue_ids and self.resolver is not None:
+            await self.resolver.aissue_teams(self, issue_ids)
+
+    async def _make_batch_request(self, name, calls, batch_size):
+        """Async version of BaseClient._make_batch_request; chunks run concurrently"""
+        import asyncio
+
+        async def send(chunk):
+            document, variables, aliases = build_batch(name, chunk)
+            response = await self._make_request(document, variables)
+            return split_batch_response(response, aliases)
+
+        chunks = [calls[i : i + batch_size] for i in range(0, len(calls), batch_size)]
+        chunk_results = await asyncio.gather(*(send(chunk) for chunk in chunks))
+        return [result for results in chunk_results for result in results]
+
+    async def fetch_many(self, *calls, **named):
+        """Async version of BaseClient.fetch_many"""
+        if calls and named:
+            raise TypeError("pass calls positionally or by name, not both")
+        if named:
+            return dict(zip(named, await self.fetch_many(*named.values())))
+        if not calls:
+            return []
+
+        document, variables, aliases, tags = compose(calls)
+        response = await self._make_request(document, variables, cache_tags=tags)
+        return [
+            self._decode(result, call.type_)
+            for call, result in zip(calls, split_query_response(response, aliases))
+        ]
+
+    async def _load(self, operation, key):
+        """Async version of BaseClient._load"""
+        loader = self._loaders.get(operation)
+        if loader is None:
+            loader = self._loaders[operation] = AsyncDataLoader(
+                partial(self._load_many, operation), window=self.coalesce_window
+            )
+        return await loader.load(key)
+
+    async def _load_many(self, operation, keys):
+        (variable,) = operation.variables
+        calls = [(operation, {variable: key}) for key in keys]
+        document, variables, aliases = build_batch(operation.name, calls)
+        tags = [f"{operation.field}:{key}" for key in keys]
+        response = await self._make_request(document, variables, cache_tags=tags)
+        return split_query_response(response, aliases)
+
+
+async def _adecode_nodes(nodes, type_):
+    async for node in nodes:
+        yield decode(node, type_)
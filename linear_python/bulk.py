@@ -0,0 +1,329 @@
+import csv
+import io
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .codec import dumps, loads
+from .export import _format_of, _read_json, _write_json
+from .resources.issues import _validate_create_input, _validate_update_input
+
+FORMATS = ("ndjson", "csv")
+OPERATIONS = ("create", "update")
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_BATCH_SIZE = 50
+
+# CSV cells are strings; these columns are converted to what the API takes
+INT_COLUMNS = ("priority",)
+FLOAT_COLUMNS = ("estimate", "sortOrder")
+# Comma-separated lists
+LIST_COLUMNS = ("labels", "labelIds", "subscriberIds")
+
+
+class InvalidRow:
+    """
+    An input row that couldn't be read (malformed JSON, a cell that doesn't
+    convert). read_rows yields one in its place and run_bulk records it as
+    a failure, so one bad row doesn't stop the run.
+    """
+
+    __slots__ = ("input", "errors")
+
+    def __init__(self, input, message):
+        self.input = input
+        self.errors = [{"message": message}]
+
+
+def _csv_row(row):
+    data = {}
+    for key, value in row.items():
+        if key is None or value is None or value == "":
+            # Empty cells are left out, so an update doesn't blank the field
+            continue
+        try:
+            if key in INT_COLUMNS:
+                value = int(value)
+            elif key in FLOAT_COLUMNS:
+                value = float(value)
+        except ValueError:
+            raw = {key: value for key, value in row.items() if key is not None}
+            return InvalidRow(raw, f"{key}: {value!r} is not a number")
+        if key in LIST_COLUMNS:
+            value = [item.strip() for item in value.split(",") if item.strip()]
+        data[key] = value
+    return data
+
+
+def _ndjson_row(line):
+    try:
+        row = loads(line)
+    except ValueError as e:
+        return InvalidRow(line.rstrip("\r\n"), f"invalid JSON: {e}")
+    if not isinstance(row, dict):
+        return InvalidRow(row, "expected a JSON object")
+    return row
+
+
+def _open(path):
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def read_rows(path, format=None):
+    """
+    Yield the rows of a CSV or NDJSON file (`-` for stdin) one at a time,
+    so inputs of any size are never held in memory. A row that can't be
+    read is yielded as an InvalidRow.
+    """
+    format = format or ("ndjson" if path == "-" else _format_of(path))
+    if format not in FORMATS:
+        raise ValueError(f"unsupported input format {format!r}, expected {FORMATS}")
+    with _open(path) as f:
+        if format == "csv":
+            for row in csv.DictReader(f):
+                yield _csv_row(row)
+        else:
+            for line in f:
+                if line.strip():
+                    yield _ndjson_row(line)
+
+
+def count_rows(path, format=None):
+    """
+    Rows in `path`, counted from its newlines without parsing it (an
+    estimate for CSV files with multi-line cells); None for stdin.
+    """
+    if path == "-":
+        return None
+    format = format or _format_of(path)
+    count = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+        f.seek(0, os.SEEK_END)
+        if f.tell() and not _ends_with_newline(f):
+            count += 1
+    return count - 1 if format == "csv" and count else count
+
+
+def _ends_with_newline(f):
+    f.seek(-1, os.SEEK_END)
+    return f.read(1) == b"\n"
+
+
+def _batches(rows, operation, batch_size, skip):
+    """(row number, row) batches, leaving out the rows in `skip`."""
+    batch = []
+    ids = set()
+    for number, row in rows:
+        if skip(number):
+            continue
+        if operation == "update" and not isinstance(row, InvalidRow):
+            # update_issues takes a dict, so one issue can't appear twice
+            # in a batch
+            issue_id = row.get("id")
+            if issue_id in ids:
+                yield batch
+                batch, ids = [], set()
+            ids.add(issue_id)
+        batch.append((number, row))
+        if len(batch) >= batch_size:
+            yield batch
+            batch, ids = [], set()
+    if batch:
+        yield batch
+
+
+def _prepare(client, operation, row):
+    """
+    Resolve and validate one row the way create_issues/update_issues will;
+    raises TypeError/ValueError if the row is invalid.
+    """
+    if operation == "create":
+        data = client._resolve_references(row)
+        _validate_create_input(data)
+    else:
+        data = client._resolve_references(_update_input(row), row["id"])
+        _validate_update_input(data)
+    return data
+
+
+def _send(client, operation, batch):
+    # One invalid row (e.g. an unknown team) would fail the whole batch
+    # before anything is sent, so rows are checked up front and only the
+    # valid ones go out. Errors raised once the batch is sent propagate:
+    # Linear may have applied it, so it must not be sent again
+    results = [None] * len(batch)
+    if operation == "update":
+        # Rows without an id fail in _prepare; a null ID in the lookup
+        # would fail the whole request
+        client._load_issue_teams(
+            {
+                row["id"]: row
+                for _, row in batch
+                if not isinstance(row, InvalidRow) and row.get("id") is not None
+            }
+        )
+    ready = []
+    for index, (_, row) in enumerate(batch):
+        if isinstance(row, InvalidRow):
+            results[index] = {"success": False, "errors": row.errors}
+            continue
+        try:
+            ready.append((index, row.get("id"), _prepare(client, operation, row)))
+        except (TypeError, ValueError) as e:
+            results[index] = {"success": False, "errors": [{"message": str(e)}]}
+    if not ready:
+        return results
+
+    if operation == "create":
+        sent = client.create_issues(
+            [data for _, _, data in ready], batch_size=len(ready)
+        )
+    else:
+        sent = client.update_issues(
+            {issue_id: data for _, issue_id, data in ready}, batch_size=len(ready)
+        )
+    for (index, _, _), result in zip(ready, sent):
+        results[index] = result
+    return results
+
+
+def _update_input(row):
+    if "id" not in row:
+        raise ValueError("update rows need an id column")
+    return {key: value for key, value in row.items() if key != "id"}
+
+
+class _Checkpoint:
+    """
+    Which input rows are done: every row before `next`, plus the finished
+    rows after it (batches complete out of order).
+    """
+
+    def __init__(self, path, source):
+        self.path = path
+        self.source = source
+        state = _read_json(path) if path else None
+        if state is not None and state.get("input") != source:
+            raise ValueError(
+                f"checkpoint {path} belongs to {state.get('input')!r}, "
+                f"not {source!r}; delete it to start over"
+            )
+        state = state or {}
+        self.next = state.get("next", 0)
+        self.done = set(state.get("done", ()))
+        self.resumed = bool(state)
+
+    def skip(self, number):
+        return number < self.next or number in self.done
+
+    def finish(self, numbers):
+        self.done.update(numbers)
+        while self.next in self.done:
+            self.done.remove(self.next)
+            self.next += 1
+        if self.path:
+            _write_json(
+                self.path,
+                {"input": self.source, "next": self.next, "done": sorted(self.done)},
+            )
+
+
+def run_bulk(
+    client,
+    rows,
+    operation="create",
+    results=None,
+    failures=None,
+    checkpoint=None,
+    source=None,
+    concurrency=DEFAULT_CONCURRENCY,
+    batch_size=DEFAULT_BATCH_SIZE,
+    progress=None,
+):
+    """
+    Create one issue per row of `rows` (or, with operation="update",
+    update the issue named by each row's `id`), streaming through them
+    with at most `concurrency` batches of `batch_size` mutations in flight.
+
+    Each result is appended to the NDJSON file `results` as
+    {"row", "id", "title"}, and each failure to `failures` as
+    {"row", "input", "errors"}; rows read_rows couldn't parse are failures
+    too, with the raw line or cells as their input. Finished rows are
+    recorded in the JSON file `checkpoint`, so running again with the same
+    `source` skips them.
+    `progress(ok, failed, skipped)` is called as batches finish.
+    Returns {"ok": ..., "failed": ..., "skipped": ...}.
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f"unknown operation {operation!r}, expected {OPERATIONS}")
+    state = _Checkpoint(checkpoint, source)
+    mode = "a" if state.resumed else "w"
+    counts = {"ok": 0, "failed": 0, "skipped": state.next + len(state.done)}
+    if progress is not None and counts["skipped"]:
+        progress(0, 0, counts["skipped"])
+
+    results_file = open(results, mode) if results else None
+    failures_file = open(failures, mode) if failures else None
+
+    def record(batch, outcome):
+        ok = failed = 0
+        for (number, row), result in zip(batch, outcome):
+            if result and result.get("success"):
+                ok += 1
+                if results_file is not None:
+                    issue = result.get("issue") or {}
+                    line = {
+                        "row": number,
+                        "id": issue.get("id"),
+                        "title": issue.get("title"),
+                    }
+                    results_file.write(dumps(line).decode() + "\n")
+            else:
+                failed += 1
+                if failures_file is not None:
+                    errors = (result or {}).get("errors") or [
+                        {"message": "request failed"}
+                    ]
+                    if isinstance(row, InvalidRow):
+                        row = row.input
+                    line = {"row": number, "input": row, "errors": errors}
+                    failures_file.write(dumps(line).decode() + "\n")
+        for f in (results_file, failures_file):
+            if f is not None:
+                f.flush()
+        # Results are on disk before the rows are marked done
+        state.finish(number for number, _ in batch)
+        counts["ok"] += ok
+        counts["failed"] += failed
+        if progress is not None:
+            progress(ok, failed, 0)
+
+    def collect(futures):
+        for future in futures:
+            batch = in_flight.pop(future)
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = [{"success": False, "errors": [{"message": str(e)}]}] * len(
+                    batch
+                )
+            record(batch, outcome)
+
+    in_flight = {}
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for batch in _batches(enumerate(rows), operation, batch_size, state.skip):
+                if len(in_flight) >= concurrency:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(finished)
+                in_flight[executor.submit(_send, client, operation, batch)] = batch
+            collect(list(in_flight))
+    finally:
+        for f in (results_file, failures_file):
+            if f is not None:
+                f.close()
+    return counts
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .registry import parse_operation
+
+DEFAULT_TTL = 60
+DEFAULT_MAXSIZE = 1024
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self):
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"invalidations={self.invalidations})"
+        )
+
+
+class MemoryCacheBackend:
+    """In-process LRU store bounded to `maxsize` entries."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        # tag -> keys, and key -> tags so removing an entry can prune both
+        self._tags = {}
+        self._key_tags = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl, tags=()):
+        with self._lock:
+            self._untag(key)
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            tags = tuple(tags)
+            if tags:
+                self._key_tags[key] = tags
+                for tag in tags:
+                    self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        # Called with the lock held
+        self._entries.pop(key, None)
+        self._untag(key)
+
+    def _untag(self, key):
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def invalidate_tag(self, tag):
+        with self._lock:
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._key_tags.clear()
+
+
+class SQLiteCacheBackend:
+    """
+    LRU store in a sqlite file, so several worker processes can share warm
+    entries. Uses WAL mode so readers don't block the writer.
+    """
+
+    def __init__(self, path, maxsize=10000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value TEXT, expires REAL, accessed REAL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tags "
+                "(tag TEXT, key TEXT, PRIMARY KEY (tag, key))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+
+    def get(self, key):
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires = row
+            if expires <= now:
+                self._delete(key)
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (now, key)
+            )
+            return value
+
+    def set(self, key, value, ttl, tags=()):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO tags VALUES (?, ?)", [(t, key) for t in tags]
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            if count > self.maxsize:
+                stale = self._conn.execute(
+                    "SELECT key FROM entries ORDER BY accessed LIMIT ?",
+                    (count - self.maxsize,),
+                ).fetchall()
+                for (stale_key,) in stale:
+                    self._delete(stale_key)
+
+    def invalidate_tag(self, tag):
+        with self._lock, self._conn:
+            keys = self._conn.execute(
+                "SELECT key FROM tags WHERE tag = ?", (tag,)
+            ).fetchall()
+            for (key,) in keys:
+                self._delete(key)
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM tags")
+
+    def _delete(self, key):
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._conn.execute("DELETE FROM tags WHERE key = ?", (key,))
+
+
+class ResponseCache:
+    """
+    Opt-in cache for read queries, keyed by (api key, query, variables).
+
+    `ttls` maps operation names (e.g. "GetTeams") to their own TTL in
+    seconds; other queries use `ttl`. Entries are tagged with the entities
+    they contain (e.g. "issue:<id>") so mutations can evict them.
+    """
+
+    def __init__(self, backend=None, ttl=DEFAULT_TTL, ttls=None):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stats = CacheStats()
+
+    def key(self, api_key, query, variables):
+        payload = json.dumps([api_key, query, variables], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(self, api_key, query, variables):
+        """
+        Return (key, cached response) for a read query; key is None for
+        mutations, which are never cached.
+        """
+        kind, _ = parse_operation(query)
+        if kind != "query":
+            return None, None
+        key = self.key(api_key, query, variables)
+        return key, self.get(key)
+
+    def store(self, key, query, response, tags=()):
+        if key is None or not response or response.get("errors"):
+            return
+        _, name = parse_operation(query)
+        self.set(key, name, response, tags)
+
+    def get(self, key):
+        value = self.backend.get(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return json.loads(value)
+
+    def set(self, key, operation_name, response, tags=()):
+        ttl = self.ttls.get(operation_name, self.ttl)
+        if ttl > 0:
+            self.backend.set(key, json.dumps(response), ttl, tags)
+
+    def invalidate(self, *tags):
+        for tag in tags:
+            self.stats.invalidations += 1
+            self.backend.invalidate_tag(tag)
+
+    def clear(self):
+        self.backend.clear()
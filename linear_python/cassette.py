@@ -0,0 +1,271 @@
+import gzip
+import hashlib
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+
+from .base import AsyncTransport, RequestsTransport, Transport
+from .codec import dumps, loads
+from .errors import LinearAPIError
+from .registry import parse_operation
+
+CASSETTE_VERSION = 1
+
+# Response headers not worth keeping: they describe the recorded
+# connection or encoding, not the API's answer
+_DROPPED_HEADERS = frozenset(
+    (
+        "connection",
+        "content-encoding",
+        "content-length",
+        "date",
+        "keep-alive",
+        "set-cookie",
+        "transfer-encoding",
+    )
+)
+
+
+def _request_text(headers, json, data):
+    if data is None:
+        return dumps(json).decode() if json is not None else ""
+    if (headers or {}).get("Content-Encoding") == "gzip":
+        data = gzip.decompress(data)
+    return data.decode() if isinstance(data, bytes) else data
+
+
+def _operation(text):
+    """Operation name of a request body, or its hash for a persisted query."""
+    try:
+        body = loads(text)
+        query = body.get("query")
+    except (ValueError, AttributeError):
+        return ""
+    if query is None:
+        extension = (body.get("extensions") or {}).get("persistedQuery") or {}
+        return extension.get("sha256Hash", "")
+    return parse_operation(query)[1]
+
+
+def _key(text):
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+class Interaction:
+    """One recorded request/response pair and its timing."""
+
+    __slots__ = (
+        "at",
+        "operation",
+        "request",
+        "status",
+        "headers",
+        "body",
+        "ttfb",
+        "latency",
+    )
+
+    def __init__(self, at, operation, request, status, headers, body, ttfb, latency):
+        # Seconds since the recording started when the request was sent
+        self.at = at
+        self.operation = operation
+        self.request = request
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.ttfb = ttfb
+        self.latency = latency
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def response(self):
+        """A requests.Response carrying the recorded answer."""
+        from requests import Response
+        from requests.structures import CaseInsensitiveDict
+
+        response = Response()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body.encode()
+        # The body is in memory, so iter_content() slices it
+        response._content_consumed = True
+        response.elapsed = timedelta(seconds=self.ttfb)
+        return response
+
+
+def read_cassette(path):
+    """Yield the Interactions in the cassette at `path`, in recorded order."""
+    with gzip.open(path, "rb") as f:
+        header = loads(f.readline() or b"{}")
+        if header.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"{path} is not a version {CASSETTE_VERSION} cassette")
+        for line in f:
+            yield Interaction(**loads(line))
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests through to `transport` (a RequestsTransport by
+    default) and appends each request/response pair, with its latency,
+    time to first byte and response headers, to the cassette at `path`:
+    gzipped NDJSON, one interaction per line. Request headers, and so the
+    API key, are never written.
+
+    Streamed responses are read in full before they are returned, so they
+    can be recorded.
+    """
+
+    def __init__(self, path, transport=None):
+        self.path = path
+        self.transport = transport if transport is not None else RequestsTransport()
+        self._file = gzip.open(path, "wb")
+        self._file.write(dumps({"version": CASSETTE_VERSION}) + b"\n")
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.recorded = 0
+
+    def post(self, url, headers=None, json=None, data=None, stream=False):
+        sent = time.perf_counter()
+        response = self.transport.post(
+            url, headers=headers, json=json, data=data, stream=stream
+        )
+        if stream and hasattr(response, "read"):
+            # httpx only exposes `content` once a streamed body is read
+            response.read()
+        body = response.content
+        latency = time.perf_counter() - sent
+
+        elapsed = getattr(response, "elapsed", None)
+        ttfb = elapsed.total_seconds() if isinstance(elapsed, timedelta) else latency
+        request = _request_text(headers, json, data)
+        interaction = Interaction(
+            at=sent - self._started,
+            operation=_operation(request),
+            request=request,
+            status=response.status_code,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            },
+            body=body.decode("utf-8", errors="replace"),
+            ttfb=min(ttfb, latency),
+            latency=latency,
+        )
+        line = dumps(interaction.to_dict()) + b"\n"
+        with self._lock:
+            self._file.write(line)
+            self.recorded += 1
+        return response
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self.transport.close()
+
+
+class _Responses:
+    """
+    Recorded interactions indexed by request body. Repeats of the same
+    request get the recorded answers in turn, wrapping around; a request
+    that was never recorded gets an answer recorded for the same
+    operation (e.g. another page), if there is one.
+    """
+
+    def __init__(self, interactions):
+        self.interactions = list(interactions)
+        self._by_key = {}
+        self._by_operation = {}
+        for interaction in self.interactions:
+            self._by_key.setdefault(_key(interaction.request), deque()).append(
+                interaction
+            )
+            self._by_operation.setdefault(interaction.operation, deque()).append(
+                interaction
+            )
+        self._lock = threading.Lock()
+
+    def match(self, request):
+        answers = self._by_key.get(_key(request))
+        if answers is None:
+            answers = self._by_operation.get(_operation(request))
+        if answers is None:
+            raise LinearAPIError(
+                f"no recorded response for {_operation(request) or 'request'}"
+            )
+        with self._lock:
+            interaction = answers[0]
+            answers.rotate(-1)
+        return interaction
+
+
+def _delay(interaction, speed):
+    # speed=None replays as fast as possible; 2.0 halves every latency
+    return 0.0 if not speed else interaction.latency / speed
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests from a cassette written by RecordingTransport, without
+    a network. Each response arrives after its recorded latency divided by
+    `speed` (1.0 is original speed; None answers at once), with the
+    recorded status, headers and body. Safe to share between threads, so
+    many clients can replay one cassette concurrently.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.speed = speed
+        self.responses = _Responses(read_cassette(path))
+
+    @property
+    def interactions(self):
+        return self.responses.interactions
+
+    def post(self, url, headers=None, json=None, data=None, stream=False):
+        interaction = self.responses.match(_request_text(headers, json, data))
+        delay = _delay(interaction, self.speed)
+        if delay:
+            time.sleep(delay)
+        return interaction.response()
+
+
+class AsyncReplayTransport(AsyncTransport):
+    """asyncio version of ReplayTransport, for AsyncLinearClient."""
+
+    def __init__(self, path, speed=1.0, max_concurrency=100):
+        super().__init__(max_concurrency=max_concurrency)
+        self.speed = speed
+        self.responses = _Responses(read_cassette(path))
+
+    @property
+    def interactions(self):
+        return self.responses.interactions
+
+    async def _send(self, url, headers=None, json=None, data=None, stream=False):
+        import asyncio
+
+        interaction = self.responses.match(_request_text(headers, json, data))
+        delay = _delay(interaction, self.speed)
+        if delay:
+            await asyncio.sleep(delay)
+        return AsyncReplayResponse(interaction.response())
+
+
+class AsyncReplayResponse:
+    """A recorded response with the async streaming API httpx responses have."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    async def aiter_bytes(self, chunk_size=None):
+        for chunk in self._response.iter_content(chunk_size or 65536):
+            yield chunk
+
+    async def aclose(self):
+        pass
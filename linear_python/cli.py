@@ -0,0 +1,236 @@
+"""
+The `linear-python` command. Requires the `cli` extra:
+pip install "linear-python[cli]"
+"""
+
+import os
+import time
+from typing import Optional
+
+try:
+    import typer
+    from rich.console import Console
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        ProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+        TimeRemainingColumn,
+    )
+    from rich.text import Text
+except ImportError as e:
+    raise ImportError(
+        "the linear-python command requires typer and rich: "
+        'pip install "linear-python[cli]"'
+    ) from e
+
+from .bulk import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    count_rows,
+    read_rows,
+    run_bulk,
+)
+from .client import LinearClient
+from .config import Config
+from .ratelimit import Scheduler
+from .resolver import ResolverIndex
+
+app = typer.Typer(
+    help="Bulk create and update Linear issues from CSV or NDJSON.",
+    no_args_is_help=True,
+)
+console = Console(stderr=True)
+
+
+class RateColumn(ProgressColumn):
+    """Rows per second, averaged over the last 30 seconds."""
+
+    def render(self, task):
+        if task.speed is None:
+            return Text("- rows/s")
+        return Text(f"{task.speed:,.0f} rows/s")
+
+
+def _client(api_key, base_url, concurrency):
+    api_key = api_key or Config.API_KEY
+    if not api_key:
+        raise typer.BadParameter(
+            "pass --api-key or set LINEAR_API_KEY", param_hint="--api-key"
+        )
+    options = {} if base_url is None else {"base_url": base_url}
+    return LinearClient(
+        api_key,
+        scheduler=Scheduler(max_concurrency=concurrency),
+        resolver=ResolverIndex(),
+        **options,
+    )
+
+
+def _run(
+    operation,
+    path,
+    format,
+    results,
+    failures,
+    checkpoint,
+    restart,
+    concurrency,
+    batch_size,
+    api_key,
+    base_url,
+):
+    if checkpoint is None and path != "-":
+        checkpoint = f"{results}.checkpoint"
+    if restart and checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    client = _client(api_key, base_url, concurrency)
+    source = path if path == "-" else os.path.abspath(path)
+    started = time.monotonic()
+    with client, Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        RateColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+    ) as progress:
+        totals = {"ok": 0, "failed": 0, "rows": count_rows(path, format)}
+        task = progress.add_task(operation, total=totals["rows"])
+
+        def update(ok, failed, skipped):
+            totals["ok"] += ok
+            totals["failed"] += failed
+            if skipped and totals["rows"] is not None:
+                # Rows done by an earlier run don't count towards the rate
+                # or the ETA
+                totals["rows"] = max(totals["rows"] - skipped, 0)
+                progress.update(task, total=totals["rows"])
+            progress.update(
+                task,
+                advance=ok + failed,
+                description=(
+                    f"{operation}: {totals['ok']:,} ok, {totals['failed']:,} failed"
+                ),
+            )
+
+        try:
+            counts = run_bulk(
+                client,
+                read_rows(path, format),
+                operation=operation,
+                results=results,
+                failures=failures,
+                checkpoint=checkpoint,
+                source=source,
+                concurrency=concurrency,
+                batch_size=batch_size,
+                progress=update,
+            )
+        except ValueError as e:
+            raise typer.BadParameter(str(e)) from e
+
+    elapsed = time.monotonic() - started
+    verb = "Created" if operation == "create" else "Updated"
+    console.print(
+        f"{verb} {counts['ok']:,} issues, {counts['failed']:,} failed, "
+        f"{counts['skipped']:,} already done, in {elapsed:.1f}s"
+    )
+    console.print(f"Results: {results}")
+    if counts["failed"]:
+        console.print(f"Failures: {failures}", style="red")
+        raise typer.Exit(1)
+
+
+PATH = typer.Argument(..., help="CSV or NDJSON file, or - for NDJSON on stdin.")
+FORMAT = typer.Option(
+    None, "--format", help="csv or ndjson (default: from the extension)."
+)
+RESULTS = typer.Option("results.ndjson", help="NDJSON file of created/updated issues.")
+FAILURES = typer.Option(
+    "failures.ndjson", help="NDJSON file of failed rows and their errors."
+)
+CHECKPOINT = typer.Option(
+    None, help="Progress file for resuming (default: <results>.checkpoint)."
+)
+RESTART = typer.Option(False, "--restart", help="Ignore an existing checkpoint.")
+CONCURRENCY = typer.Option(DEFAULT_CONCURRENCY, help="Batches in flight at once.")
+BATCH_SIZE = typer.Option(DEFAULT_BATCH_SIZE, help="Mutations per request.")
+API_KEY = typer.Option(None, envvar="LINEAR_API_KEY", help="Linear API key.")
+BASE_URL = typer.Option(None, help="GraphQL endpoint (default: Linear's API).")
+
+
+@app.command("import")
+def import_issues(
+    path: str = PATH,
+    format: Optional[str] = FORMAT,
+    results: str = RESULTS,
+    failures: str = FAILURES,
+    checkpoint: Optional[str] = CHECKPOINT,
+    restart: bool = RESTART,
+    concurrency: int = CONCURRENCY,
+    batch_size: int = BATCH_SIZE,
+    api_key: Optional[str] = API_KEY,
+    base_url: Optional[str] = BASE_URL,
+):
+    """
+    Create one issue per row. Columns are IssueCreateInput fields; team,
+    assignee, state and labels may be given by key, email or name.
+    """
+    _run(
+        "create",
+        path,
+        format,
+        results,
+        failures,
+        checkpoint,
+        restart,
+        concurrency,
+        batch_size,
+        api_key,
+        base_url,
+    )
+
+
+@app.command("update")
+def update_issues(
+    path: str = PATH,
+    format: Optional[str] = FORMAT,
+    results: str = RESULTS,
+    failures: str = FAILURES,
+    checkpoint: Optional[str] = CHECKPOINT,
+    restart: bool = RESTART,
+    concurrency: int = CONCURRENCY,
+    batch_size: int = BATCH_SIZE,
+    api_key: Optional[str] = API_KEY,
+    base_url: Optional[str] = BASE_URL,
+):
+    """
+    Update the issue named by each row's id column with the row's other
+    columns (IssueUpdateInput fields).
+    """
+    _run(
+        "update",
+        path,
+        format,
+        results,
+        failures,
+        checkpoint,
+        restart,
+        concurrency,
+        batch_size,
+        api_key,
+        base_url,
+    )
+
+
+def main():
+    app()
+
+
+if __name__ == "__main__":
+    main()
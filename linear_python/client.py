@@ -1,24 +1,127 @@
-from .resources.issues import IssueClient
-from .resources.projects import ProjectClient
-from .resources.teams import TeamClient
-from .resources.users import UserClient
+from .base import HTTPXAsyncTransport, RequestsTransport
+from .resources.issues import AsyncIssueClient, IssueClient
+from .resources.projects import AsyncProjectClient, ProjectClient
+from .resources.teams import AsyncTeamClient, TeamClient
+from .resources.users import AsyncUserClient, UserClient
+
+
+def _dispatch_table(owner, resources):
+    """
+    Public method name -> sub-client attribute for the methods `owner`
+    delegates. Earlier resources win; methods of `owner` itself are kept.
+    """
+    table = {}
+    for attr, cls in resources:
+        for name in dir(cls):
+            if name.startswith("_") or hasattr(owner, name):
+                continue
+            if callable(getattr(cls, name)):
+                table.setdefault(name, attr)
+    return table
+
+
+def _bind(client):
+    # Bound methods go straight into the instance dict, so resource calls
+    # are plain attribute lookups instead of a __getattr__ probe each time
+    for name, attr in client._DISPATCH.items():
+        client.__dict__[name] = getattr(client.__dict__[attr], name)
+
+
+def _delegate(client, name):
+    # Non-method attributes (api_key, cache, ...) are the same on every
+    # sub-client
+    for attr in client._RESOURCES:
+        resource = client.__dict__.get(attr)
+        if resource is not None and hasattr(resource, name):
+            return getattr(resource, name)
+    raise AttributeError(f"'{type(client).__name__}' object has no attribute '{name}'")
 
 
 class LinearClient:
-    def __init__(self, api_key):
-        self._issues = IssueClient(api_key)
-        self._projects = ProjectClient(api_key)
-        self._teams = TeamClient(api_key)
-        self._users = UserClient(api_key)
+    """
+    Client for every Linear resource. One instance is safe to share between
+    threads (e.g. across gunicorn thread workers): all sub-clients use one
+    transport, whose connection pool is shared by per-thread sessions, and
+    the cache, scheduler and request coalescing are all locked internally.
+    """
+
+    _RESOURCES = ("_issues", "_projects", "_teams", "_users")
+
+    def __init__(self, api_key, transport=None, **options):
+        # One pooled transport is shared by every sub-client
+        self.transport = transport if transport is not None else RequestsTransport()
+        self._issues = IssueClient(api_key, transport=self.transport, **options)
+        self._projects = ProjectClient(api_key, transport=self.transport, **options)
+        self._teams = TeamClient(api_key, transport=self.transport, **options)
+        self._users = UserClient(api_key, transport=self.transport, **options)
+        _bind(self)
+
+    def close(self):
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getattr__(self, name):
+        return _delegate(self, name)
+
+
+LinearClient._DISPATCH = _dispatch_table(
+    LinearClient,
+    [
+        ("_issues", IssueClient),
+        ("_projects", ProjectClient),
+        ("_teams", TeamClient),
+        ("_users", UserClient),
+    ],
+)
+
+
+class AsyncLinearClient:
+    """
+    asyncio counterpart of LinearClient. Every resource method is awaitable,
+    and all sub-clients share one pooled async transport whose
+    `max_concurrency` caps the number of requests in flight.
+    """
+
+    _RESOURCES = ("_issues", "_projects", "_teams", "_users")
+
+    def __init__(self, api_key, transport=None, max_concurrency=100, **options):
+        self.transport = (
+            transport
+            if transport is not None
+            else HTTPXAsyncTransport(max_concurrency=max_concurrency)
+        )
+        self._issues = AsyncIssueClient(api_key, transport=self.transport, **options)
+        self._projects = AsyncProjectClient(
+            api_key, transport=self.transport, **options
+        )
+        self._teams = AsyncTeamClient(api_key, transport=self.transport, **options)
+        self._users = AsyncUserClient(api_key, transport=self.transport, **options)
+        _bind(self)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
     def __getattr__(self, name):
-        # Delegate to appropriate client based on method name
-        if hasattr(self._issues, name):
-            return getattr(self._issues, name)
-        elif hasattr(self._projects, name):
-            return getattr(self._projects, name)
-        elif hasattr(self._teams, name):
-            return getattr(self._teams, name)
-        elif hasattr(self._users, name):
-            return getattr(self._users, name)
-        raise AttributeError(f"'LinearClient' object has no attribute '{name}'")
+        return _delegate(self, name)
+
+
+AsyncLinearClient._DISPATCH = _dispatch_table(
+    AsyncLinearClient,
+    [
+        ("_issues", AsyncIssueClient),
+        ("_projects", AsyncProjectClient),
+        ("_teams", AsyncTeamClient),
+        ("_users", AsyncUserClient),
+    ],
+)
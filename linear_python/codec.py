@@ -0,0 +1,54 @@
+import gzip
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Request bodies at least this large are gzipped when compression is on;
+# smaller ones gain too little to pay for the CPU
+DEFAULT_COMPRESS_THRESHOLD = 1024
+
+GZIP_LEVEL = 6
+
+
+if orjson is not None:
+
+    def dumps(value):
+        """Compact JSON bytes for `value`, using orjson when installed."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(value):
+        """Compact JSON bytes for `value`, using orjson when installed."""
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    loads = json.loads
+
+
+def compress(body):
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def response_json(response):
+    """Decode a response body with the fastest available JSON codec."""
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return loads(content)
+    # Transports whose responses don't expose raw bytes
+    return response.json()
+
+
+def accept_encoding():
+    """
+    The Accept-Encoding value for every codec urllib3 can decode here:
+    gzip and deflate always, br and zstd when brotli and zstandard are
+    installed (pip install "linear-python[compression]").
+    """
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    return ", ".join(ACCEPT_ENCODING.split(","))
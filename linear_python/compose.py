@@ -0,0 +1,97 @@
+from .operations import build_batch
+
+COMPOSED_NAME = "FetchMany"
+
+
+class Call:
+    """
+    A read that hasn't been sent yet: an operation, its variables, the
+    type its result decodes to and the cache tags it depends on.
+    """
+
+    __slots__ = ("operation", "variables", "type_", "cache_tags")
+
+    def __init__(self, operation, variables=None, type_=None, cache_tags=()):
+        self.operation = operation
+        self.variables = variables or {}
+        self.type_ = type_
+        self.cache_tags = tuple(cache_tags)
+
+    def key(self):
+        return (self.operation, tuple(sorted(self.variables.items())))
+
+    def __repr__(self):
+        return f"Call({self.operation.name}, {self.variables!r})"
+
+
+class Composer:
+    """
+    Builds Calls for `fetch_many`. Each method takes the same arguments as
+    the client method of the same name:
+
+        viewer, eng = client.fetch_many(Q.get_viewer(), Q.get_team("team-id"))
+    """
+
+    def get_viewer(self, fields=None):
+        from .resources.users import GET_VIEWER
+
+        return Call(GET_VIEWER.select(fields), type_="User")
+
+    def get_user(self, user_id, fields=None):
+        from .resources.users import GET_USER
+
+        return Call(
+            GET_USER.select(fields), {"id": user_id}, "User", (f"user:{user_id}",)
+        )
+
+    def get_users(self, fields=None):
+        from .resources.users import GET_USERS
+
+        return Call(GET_USERS.select(fields), type_="UserConnection")
+
+    def get_team(self, team_id, fields=None):
+        from .resources.teams import GET_TEAM
+
+        return Call(
+            GET_TEAM.select(fields), {"teamId": team_id}, "Team", (f"team:{team_id}",)
+        )
+
+    def get_teams(self, fields=None):
+        from .resources.teams import GET_TEAMS
+
+        return Call(GET_TEAMS.select(fields), type_="TeamConnection")
+
+    def get_issue(self, issue_id, fields=None):
+        from .resources.issues import GET_ISSUE
+
+        return Call(
+            GET_ISSUE.select(fields),
+            {"issueId": issue_id},
+            "Issue",
+            (f"issue:{issue_id}",),
+        )
+
+
+# Builds calls for fetch_many: Q.get_viewer(), Q.get_team("team-id"), ...
+Q = Composer()
+
+
+def compose(calls):
+    """
+    Merge `calls` into one aliased query; each operation's variables get a
+    per-alias suffix so they can't collide. Identical calls are sent once.
+    Returns (document, variables, aliases, cache tags), with one alias per
+    call.
+    """
+    unique = {}
+    for call in calls:
+        if not isinstance(call, Call):
+            raise TypeError(f"expected a Call (e.g. Q.get_viewer()), got {call!r}")
+        unique.setdefault(call.key(), call)
+    document, variables, sent = build_batch(
+        COMPOSED_NAME, [(call.operation, call.variables) for call in unique.values()]
+    )
+    alias_for = dict(zip(unique, sent))
+    aliases = [alias_for[call.key()] for call in calls]
+    tags = [tag for call in unique.values() for tag in call.cache_tags]
+    return document, variables, aliases, tags
@@ -1,10 +1,39 @@
 import os
 
-from dotenv import load_dotenv
+# Config attribute -> environment variable
+_SETTINGS = {
+    "API_KEY": "LINEAR_API_KEY",
+    "DEFAULT_TEAM_ID": "LINEAR_TEAM_ID",
+}
 
-load_dotenv()
 
+class _EnvConfig(type):
+    """
+    Reads settings from the environment on first access, loading `.env`
+    then rather than at import time.
+    """
 
-class Config:
-    API_KEY = os.getenv("LINEAR_API_KEY")
-    DEFAULT_TEAM_ID = os.getenv("LINEAR_TEAM_ID")
+    def __getattr__(cls, name):
+        variable = _SETTINGS.get(name)
+        if variable is None:
+            raise AttributeError(f"type object 'Config' has no attribute '{name}'")
+        _load_dotenv()
+        value = os.getenv(variable)
+        setattr(cls, name, value)
+        return value
+
+
+_loaded = False
+
+
+def _load_dotenv():
+    global _loaded
+    if not _loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _loaded = True
+
+
+class Config(metaclass=_EnvConfig):
+    pass
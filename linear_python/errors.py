@@ -0,0 +1,2 @@
+class LinearAPIError(Exception):
+    """Raised when a request to the Linear API fails mid-operation."""
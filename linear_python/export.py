@@ -0,0 +1,324 @@
+import csv
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+from .errors import LinearAPIError
+from .filters import compile_filter
+from .pagination import _next_cursor, page_variables
+from .ratelimit import Scheduler
+from .resources.issues import ITER_ISSUES, IssueClient
+from .resources.teams import ITER_TEAMS
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+DEFAULT_EXPORT_PAGE_SIZE = 250
+
+# Rows per Parquet row group, and so the most rows held in memory at once
+PARQUET_BATCH_SIZE = 10000
+
+EXPORT_FIELDS = """
+    id
+    identifier
+    title
+    description
+    priority
+    priorityLabel
+    dueDate
+    url
+    state { name type }
+    team { id key }
+    assignee { id name }
+    project { id name }
+    labels { name }
+    createdAt
+    updatedAt
+    archivedAt
+"""
+
+COLUMNS = (
+    "id",
+    "identifier",
+    "title",
+    "description",
+    "priority",
+    "priority_label",
+    "due_date",
+    "url",
+    "state",
+    "state_type",
+    "team_id",
+    "team_key",
+    "assignee_id",
+    "assignee_name",
+    "project_id",
+    "project_name",
+    "labels",
+    "created_at",
+    "updated_at",
+    "archived_at",
+)
+
+
+def _get(node, *path):
+    for key in path:
+        if node is None:
+            return None
+        node = node.get(key)
+    return node
+
+
+def flatten_issue(node):
+    """One export row (keyed by COLUMNS) for an issue node selected with EXPORT_FIELDS."""
+    labels = _get(node, "labels", "nodes") or []
+    return {
+        "id": node.get("id"),
+        "identifier": node.get("identifier"),
+        "title": node.get("title"),
+        "description": node.get("description"),
+        "priority": node.get("priority"),
+        "priority_label": node.get("priorityLabel"),
+        "due_date": node.get("dueDate"),
+        "url": node.get("url"),
+        "state": _get(node, "state", "name"),
+        "state_type": _get(node, "state", "type"),
+        "team_id": _get(node, "team", "id"),
+        "team_key": _get(node, "team", "key"),
+        "assignee_id": _get(node, "assignee", "id"),
+        "assignee_name": _get(node, "assignee", "name"),
+        "project_id": _get(node, "project", "id"),
+        "project_name": _get(node, "project", "name"),
+        "labels": [label["name"] for label in labels],
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "archived_at": node.get("archivedAt"),
+    }
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_json(path, value):
+    # Written to a temporary file first so an interrupted write never
+    # leaves a half-written checkpoint behind
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(value, f)
+    os.replace(tmp, path)
+
+
+def _worker_options(client, workers):
+    options = {
+        "base_url": client.base_url,
+        "persisted_queries": client.persisted_queries,
+    }
+    scheduler = client.scheduler
+    if scheduler is not None:
+        # Every process paces itself against its share of the budget
+        options["scheduler"] = {
+            "requests_per_hour": scheduler.requests.capacity / workers,
+            "complexity_per_hour": scheduler.complexity.capacity / workers,
+            "max_concurrency": 1,
+            "retry": scheduler.retry,
+        }
+    return options
+
+
+def _shard_filter(filter, team_id):
+    team = {"team": {"id": {"eq": team_id}}}
+    return {"and": [filter, team]} if filter else team
+
+
+def export_shard(api_key, options, filter, include_archived, page_size, part, state):
+    """
+    Page through the issues matching `filter`, appending flattened rows to
+    the NDJSON file `part`. After every page the cursor and the size of
+    `part` are saved to the JSON checkpoint `state`; a later call resumes
+    from there, discarding rows written after the last checkpoint.
+    Returns the number of rows in `part`.
+    """
+    progress = _read_json(state) or {"cursor": None, "size": 0, "rows": 0}
+    if progress.get("done"):
+        return progress["rows"]
+
+    options = dict(options)
+    if options.get("scheduler") is not None:
+        options["scheduler"] = Scheduler(**options["scheduler"])
+    client = IssueClient(api_key, **options)
+    document = ITER_ISSUES.select(EXPORT_FIELDS).document
+    try:
+        with open(part, "ab") as f:
+            f.truncate(progress["size"])
+            while True:
+                variables = page_variables(
+                    page_size, progress["cursor"], filter, include_archived
+                )
+                response = client._make_request(document, variables)
+                if not response:
+                    raise LinearAPIError("request failed while exporting issues")
+                connection = response["data"]["issues"]
+                for node in connection["nodes"]:
+                    f.write(json.dumps(flatten_issue(node)).encode() + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+                cursor = _next_cursor(connection)
+                progress = {
+                    "cursor": cursor,
+                    "size": f.tell(),
+                    "rows": progress["rows"] + len(connection["nodes"]),
+                    "done": cursor is None,
+                }
+                _write_json(state, progress)
+                if cursor is None:
+                    return progress["rows"]
+    finally:
+        client.close()
+
+
+def _team_ids(client):
+    document = ITER_TEAMS.select("id").document
+    after = None
+    while True:
+        response = client._make_request(
+            document, page_variables(DEFAULT_EXPORT_PAGE_SIZE, after)
+        )
+        if not response:
+            raise LinearAPIError("request failed while listing teams")
+        connection = response["data"]["teams"]
+        for node in connection["nodes"]:
+            yield node["id"]
+        after = _next_cursor(connection)
+        if after is None:
+            return
+
+
+def _iter_rows(parts):
+    for part in parts:
+        with open(part, "rb") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def _write_ndjson(parts, out):
+    with open(out, "wb") as f:
+        for part in parts:
+            with open(part, "rb") as src:
+                shutil.copyfileobj(src, f)
+
+
+def _write_csv(parts, out):
+    with open(out, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, COLUMNS)
+        writer.writeheader()
+        for row in _iter_rows(parts):
+            row["labels"] = ",".join(row["labels"])
+            writer.writerow(row)
+
+
+def _write_parquet(parts, out):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            'Parquet export requires pyarrow: pip install "linear-python[parquet]"'
+        ) from e
+
+    schema = pa.schema(
+        [
+            (
+                column,
+                {
+                    "priority": pa.float64(),
+                    "labels": pa.list_(pa.string()),
+                }.get(column, pa.string()),
+            )
+            for column in COLUMNS
+        ]
+    )
+    with pq.ParquetWriter(out, schema) as writer:
+        batch = []
+        for row in _iter_rows(parts):
+            batch.append(row)
+            if len(batch) == PARQUET_BATCH_SIZE:
+                writer.write_table(pa.Table.from_pylist(batch, schema))
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema))
+
+
+WRITERS = {"ndjson": _write_ndjson, "csv": _write_csv, "parquet": _write_parquet}
+
+
+def _format_of(path):
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    return {"jsonl": "ndjson", "json": "ndjson"}.get(ext, ext)
+
+
+def export_issues(
+    client,
+    path,
+    filter=None,
+    format=None,
+    include_archived=False,
+    workers=4,
+    page_size=DEFAULT_EXPORT_PAGE_SIZE,
+    checkpoint=None,
+):
+    """
+    Export every issue matching `filter` (a filter expression or dict) to
+    `path` as NDJSON, CSV or Parquet (`format`, or guessed from the extension). Returns the number
+    of rows written.
+
+    The export is sharded by team. Up to `workers` processes page through
+    the shards in parallel, flatten the rows and spool them to disk in
+    the `checkpoint` directory (`<path>.parts` by default). Memory use
+    doesn't grow with the workspace. If an export is interrupted, calling
+    it again with the same arguments resumes where each shard stopped.
+    """
+    format = format or _format_of(path)
+    if format not in FORMATS:
+        raise ValueError(f"unsupported export format {format!r}, expected {FORMATS}")
+    filter = compile_filter(filter)
+    checkpoint = checkpoint or f"{path}.parts"
+    os.makedirs(checkpoint, exist_ok=True)
+
+    # The shard list is checkpointed too, so a resumed export covers
+    # exactly the teams the interrupted one started with
+    shards_path = os.path.join(checkpoint, "shards.json")
+    shards = _read_json(shards_path)
+    if shards is None:
+        shards = list(_team_ids(client))
+        _write_json(shards_path, shards)
+
+    options = _worker_options(client, max(workers, 1))
+    jobs = [
+        (
+            client.api_key,
+            options,
+            _shard_filter(filter, team_id),
+            include_archived,
+            page_size,
+            os.path.join(checkpoint, f"{index:05d}.ndjson"),
+            os.path.join(checkpoint, f"{index:05d}.json"),
+        )
+        for index, team_id in enumerate(shards)
+    ]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            rows = sum(executor.map(export_shard, *zip(*jobs)))
+    else:
+        rows = sum(export_shard(*job) for job in jobs)
+
+    tmp = f"{path}.tmp"
+    WRITERS[format]([job[5] for job in jobs], tmp)
+    os.replace(tmp, path)
+    shutil.rmtree(checkpoint)
+    return rows
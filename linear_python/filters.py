@@ -0,0 +1,186 @@
+from datetime import date, datetime, timezone
+
+
+class Expr:
+    """
+    A filter expression. Combine expressions with `&` and `|`, then
+    `compile()` them into the filter input (e.g. IssueFilter) Linear takes.
+    """
+
+    def __and__(self, other):
+        return All(self, other)
+
+    def __or__(self, other):
+        return Any(self, other)
+
+    def compile(self):
+        raise NotImplementedError
+
+
+def _value(value):
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec="milliseconds") + "Z"
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_value(item) for item in value]
+    return value
+
+
+def _nest(path, leaf):
+    for name in reversed(path):
+        leaf = {name: leaf}
+    return leaf
+
+
+class Condition(Expr):
+    """`{comparator: value}` on the field at `path`, e.g. team.key eq "ENG"."""
+
+    def __init__(self, path, comparator, value):
+        self.path = path
+        self.comparator = comparator
+        self.value = value
+
+    def compile(self):
+        return _nest(self.path, {self.comparator: _value(self.value)})
+
+    def __repr__(self):
+        return f"Condition({'.'.join(self.path)} {self.comparator} {self.value!r})"
+
+
+class Nested(Expr):
+    """`expr` applied to the related entities at `path`, e.g. labels.some."""
+
+    def __init__(self, path, expr):
+        self.path = path
+        self.expr = expr
+
+    def compile(self):
+        return _nest(self.path, self.expr.compile())
+
+
+class _Raw(Expr):
+    def __init__(self, value):
+        self.value = value
+
+    def compile(self):
+        return self.value
+
+
+class _Combined(Expr):
+    key = None
+
+    def __init__(self, *parts):
+        self.parts = []
+        for part in parts:
+            if not isinstance(part, Expr):
+                raise TypeError(f"cannot combine a filter with {part!r}")
+            # (a & b) & c compiles to one `and` with three parts
+            self.parts.extend(part.parts if type(part) is type(self) else [part])
+
+    def compile(self):
+        return {self.key: [part.compile() for part in self.parts]}
+
+
+class All(_Combined):
+    key = "and"
+
+
+class Any(_Combined):
+    key = "or"
+
+
+class Field:
+    """
+    Reference to a (possibly nested) filter field; attribute access walks
+    relations, and comparisons build Conditions:
+
+        (F.team.key == "ENG") & (F.priority <= 2) & F.labels.some(F.name == "Bug")
+    """
+
+    __hash__ = None
+
+    def __init__(self, *path):
+        self._path = path
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Field(*self._path, name)
+
+    def _condition(self, comparator, value):
+        if not self._path:
+            raise ValueError("compare a field, e.g. F.priority, not F itself")
+        return Condition(self._path, comparator, value)
+
+    def __eq__(self, value):
+        if value is None:
+            return self._condition("null", True)
+        return self._condition("eq", value)
+
+    def __ne__(self, value):
+        if value is None:
+            return self._condition("null", False)
+        return self._condition("neq", value)
+
+    def __lt__(self, value):
+        return self._condition("lt", value)
+
+    def __le__(self, value):
+        return self._condition("lte", value)
+
+    def __gt__(self, value):
+        return self._condition("gt", value)
+
+    def __ge__(self, value):
+        return self._condition("gte", value)
+
+    def in_(self, values):
+        return self._condition("in", list(values))
+
+    def not_in(self, values):
+        return self._condition("nin", list(values))
+
+    def contains(self, text):
+        """Case-insensitive substring match."""
+        return self._condition("containsIgnoreCase", text)
+
+    def between(self, start=None, end=None):
+        """`start <= field <= end`; either bound may be left open."""
+        bounds = {}
+        if start is not None:
+            bounds["gte"] = _value(start)
+        if end is not None:
+            bounds["lte"] = _value(end)
+        if not bounds:
+            raise ValueError("between() needs a start or an end")
+        return Nested(self._path, _Raw(bounds))
+
+    def some(self, expr):
+        """Matches if any related entity (e.g. label) matches `expr`."""
+        return Nested(self._path + ("some",), expr)
+
+    def every(self, expr):
+        """Matches if every related entity matches `expr`."""
+        return Nested(self._path + ("every",), expr)
+
+    def __repr__(self):
+        return f"Field({'.'.join(self._path)})"
+
+
+# Root of every field reference: F.priority, F.team.key, F.assignee.email, ...
+F = Field()
+
+
+def compile_filter(filter):
+    """
+    Turn `filter` into Linear's filter input. Expressions are compiled;
+    dicts (already in Linear's format) and None are passed through.
+    """
+    if filter is None or isinstance(filter, dict):
+        return filter
+    if isinstance(filter, Expr):
+        return filter.compile()
+    raise TypeError(f"expected a filter expression or dict, got {filter!r}")
@@ -0,0 +1,276 @@
+import threading
+import time
+from datetime import timedelta
+
+# Response headers copied into RequestInfo.rate_limit
+_RATE_LIMIT_PREFIXES = ("x-ratelimit-", "x-complexity")
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestInfo:
+    """
+    What hooks are told about one HTTP request. Timings are in seconds:
+    `total` covers the whole call including rate-limit waits and retries,
+    `ttfb` is the time to the response headers of the final attempt when
+    the transport reports it (requests does, httpx doesn't).
+    """
+
+    __slots__ = (
+        "operation",
+        "request_bytes",
+        "stream",
+        "status",
+        "response_bytes",
+        "rate_limit",
+        "ttfb",
+        "total",
+        "context",
+    )
+
+    def __init__(self, operation, request_bytes, stream=False):
+        self.operation = operation
+        self.request_bytes = request_bytes
+        self.stream = stream
+        self.status = None
+        # None for streamed responses, whose body hasn't been read yet
+        self.response_bytes = None
+        self.rate_limit = {}
+        self.ttfb = None
+        self.total = None
+        # Free for hooks to keep per-request state in, e.g. a span
+        self.context = {}
+
+    def _record(self, response):
+        self.status = response.status_code
+        headers = response.headers
+        self.rate_limit = {
+            name: value
+            for name, value in headers.items()
+            if name.lower().startswith(_RATE_LIMIT_PREFIXES)
+        }
+        if self.stream:
+            length = headers.get("Content-Length")
+            self.response_bytes = int(length) if length else None
+        else:
+            self.response_bytes = len(response.content)
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, timedelta) and hasattr(response, "iter_content"):
+            # requests measures `elapsed` up to the parsed response headers
+            self.ttfb = elapsed.total_seconds()
+
+    def __repr__(self):
+        return (
+            f"RequestInfo({self.operation} status={self.status} "
+            f"total={self.total} response_bytes={self.response_bytes})"
+        )
+
+
+class Hook:
+    """
+    Base class for client instrumentation, passed as `hooks=[...]`. Every
+    request calls `before`, then `after` once the response headers have
+    arrived, or `error` if the transport raised. Hooks must not raise.
+    """
+
+    def before(self, info):
+        pass
+
+    def after(self, info):
+        pass
+
+    def error(self, info, exc):
+        pass
+
+
+def instrument(hooks, operation, body, send, stream=False):
+    """Call `send()` and report it to `hooks`."""
+    info = RequestInfo(operation, len(body), stream)
+    for hook in hooks:
+        hook.before(info)
+    start = time.perf_counter()
+    try:
+        response = send()
+    except Exception as exc:
+        info.total = time.perf_counter() - start
+        for hook in hooks:
+            hook.error(info, exc)
+        raise
+    info.total = time.perf_counter() - start
+    info._record(response)
+    for hook in hooks:
+        hook.after(info)
+    return response
+
+
+async def ainstrument(hooks, operation, body, send, stream=False):
+    """Async version of instrument; `send` is a coroutine function."""
+    info = RequestInfo(operation, len(body), stream)
+    for hook in hooks:
+        hook.before(info)
+    start = time.perf_counter()
+    try:
+        response = await send()
+    except Exception as exc:
+        info.total = time.perf_counter() - start
+        for hook in hooks:
+            hook.error(info, exc)
+        raise
+    info.total = time.perf_counter() - start
+    info._record(response)
+    for hook in hooks:
+        hook.after(info)
+    return response
+
+
+def _labels(**labels):
+    return ",".join(f'{name}="{value}"' for name, value in labels.items())
+
+
+class PrometheusMetrics(Hook):
+    """
+    Request counters, latency histograms and rate-limit gauges, rendered
+    in the Prometheus text format by `render()` (e.g. from a /metrics
+    endpoint). Needs no Prometheus client library.
+    """
+
+    def __init__(self, prefix="linear", buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._errors = {}
+        self._request_bytes = {}
+        self._response_bytes = {}
+        # operation -> [count per bucket..., +Inf count, sum]
+        self._durations = {}
+        self._rate_limit = {}
+
+    def _observe(self, operation, seconds):
+        histogram = self._durations.get(operation)
+        if histogram is None:
+            histogram = self._durations[operation] = [0] * (len(self.buckets) + 1)
+            histogram.append(0.0)
+        for index, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                histogram[index] += 1
+        histogram[-2] += 1
+        histogram[-1] += seconds
+
+    def after(self, info):
+        operation = info.operation
+        with self._lock:
+            key = (operation, info.status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._request_bytes[operation] = (
+                self._request_bytes.get(operation, 0) + info.request_bytes
+            )
+            if info.response_bytes is not None:
+                self._response_bytes[operation] = (
+                    self._response_bytes.get(operation, 0) + info.response_bytes
+                )
+            self._observe(operation, info.total)
+            for name, value in info.rate_limit.items():
+                if name.lower().endswith("-remaining"):
+                    self._rate_limit[name.lower()] = value
+
+    def error(self, info, exc):
+        with self._lock:
+            key = (info.operation, type(exc).__name__)
+            self._errors[key] = self._errors.get(key, 0) + 1
+            self._observe(info.operation, info.total)
+
+    def render(self):
+        """The current metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        lines = []
+        with self._lock:
+            lines.append(f"# TYPE {p}_requests_total counter")
+            for (operation, status), count in sorted(self._requests.items()):
+                labels = _labels(operation=operation, status=status)
+                lines.append(f"{p}_requests_total{{{labels}}} {count}")
+
+            lines.append(f"# TYPE {p}_request_errors_total counter")
+            for (operation, error), count in sorted(self._errors.items()):
+                labels = _labels(operation=operation, error=error)
+                lines.append(f"{p}_request_errors_total{{{labels}}} {count}")
+
+            for name, totals in (
+                ("request_bytes_total", self._request_bytes),
+                ("response_bytes_total", self._response_bytes),
+            ):
+                lines.append(f"# TYPE {p}_{name} counter")
+                for operation, total in sorted(totals.items()):
+                    labels = _labels(operation=operation)
+                    lines.append(f"{p}_{name}{{{labels}}} {total}")
+
+            lines.append(f"# TYPE {p}_request_duration_seconds histogram")
+            for operation, histogram in sorted(self._durations.items()):
+                for bound, count in zip(self.buckets, histogram):
+                    labels = _labels(operation=operation, le=bound)
+                    lines.append(
+                        f"{p}_request_duration_seconds_bucket{{{labels}}} {count}"
+                    )
+                labels = _labels(operation=operation, le="+Inf")
+                lines.append(
+                    f"{p}_request_duration_seconds_bucket{{{labels}}} {histogram[-2]}"
+                )
+                labels = _labels(operation=operation)
+                lines.append(
+                    f"{p}_request_duration_seconds_count{{{labels}}} {histogram[-2]}"
+                )
+                lines.append(
+                    f"{p}_request_duration_seconds_sum{{{labels}}} {histogram[-1]}"
+                )
+
+            lines.append(f"# TYPE {p}_rate_limit_remaining gauge")
+            for header, value in sorted(self._rate_limit.items()):
+                labels = _labels(header=header)
+                lines.append(f"{p}_rate_limit_remaining{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook(Hook):
+    """
+    Records every request as an OpenTelemetry client span. Requires the
+    `otel` extra: pip install "linear-python[otel]"
+    """
+
+    def __init__(self, tracer=None):
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                'OpenTelemetryHook requires opentelemetry-api: pip install "linear-python[otel]"'
+            ) from e
+
+        self._trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer(__name__)
+
+    def before(self, info):
+        info.context["span"] = self.tracer.start_span(
+            f"linear {info.operation}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "rpc.system": "graphql",
+                "graphql.operation.name": info.operation,
+                "http.request.body.size": info.request_bytes,
+            },
+        )
+
+    def after(self, info):
+        span = info.context.pop("span")
+        span.set_attribute("http.response.status_code", info.status)
+        if info.response_bytes is not None:
+            span.set_attribute("http.response.body.size", info.response_bytes)
+        for name, value in info.rate_limit.items():
+            span.set_attribute(f"linear.{name.lower()}", value)
+        if info.status >= 400:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+    def error(self, info, exc):
+        span = info.context.pop("span")
+        span.record_exception(exc)
+        span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(exc)))
+        span.end()
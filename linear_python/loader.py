@@ -0,0 +1,132 @@
+import threading
+import time
+from concurrent.futures import Future
+
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_BATCH_SIZE = 100
+
+
+class _Batch:
+    def __init__(self):
+        self.futures = {}
+
+
+def _resolve(batch, results):
+    for future, result in zip(batch.futures.values(), results):
+        if not future.done():
+            future.set_result(result)
+
+
+def _fail(batch, error):
+    for future in batch.futures.values():
+        if not future.done():
+            future.set_exception(error)
+
+
+class DataLoader:
+    """
+    Coalesces single-key lookups made from many threads within `window`
+    seconds into one `batch_fn(keys)` call. Duplicate keys share a result.
+
+    The first caller of a window waits it out and dispatches the batch, so
+    no background threads are needed; a batch that reaches
+    `max_batch_size` is dispatched immediately by the caller that filled it.
+    """
+
+    def __init__(
+        self, batch_fn, window=DEFAULT_WINDOW, max_batch_size=DEFAULT_MAX_BATCH_SIZE
+    ):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._batch = None
+
+    def load(self, key):
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = Future()
+            full = len(batch.futures) >= self.max_batch_size
+            if full:
+                self._batch = None
+
+        if full:
+            self._dispatch(batch)
+        elif leader:
+            time.sleep(self.window)
+            with self._lock:
+                expired = self._batch is batch
+                if expired:
+                    self._batch = None
+            if expired:
+                self._dispatch(batch)
+
+        return future.result()
+
+    def _dispatch(self, batch):
+        try:
+            results = self.batch_fn(list(batch.futures))
+        except Exception as e:
+            _fail(batch, e)
+        else:
+            _resolve(batch, results)
+
+
+class AsyncDataLoader:
+    """asyncio version of DataLoader; `batch_fn(keys)` is a coroutine function."""
+
+    def __init__(
+        self, batch_fn, window=DEFAULT_WINDOW, max_batch_size=DEFAULT_MAX_BATCH_SIZE
+    ):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._batch = None
+
+    async def load(self, key):
+        # asyncio is imported where used so sync clients never load it
+        import asyncio
+
+        batch = self._batch
+        leader = batch is None
+        if leader:
+            batch = self._batch = _Batch()
+        future = batch.futures.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            batch.futures[key] = future
+        full = len(batch.futures) >= self.max_batch_size
+        if full:
+            self._batch = None
+
+        dispatch = None
+        if full:
+            dispatch = asyncio.ensure_future(self._dispatch(batch))
+        elif leader:
+            try:
+                await asyncio.sleep(self.window)
+            finally:
+                # Also when the leader is cancelled, so the batch is still
+                # sent for the other callers and later loads start a new one
+                if self._batch is batch:
+                    self._batch = None
+                    dispatch = asyncio.ensure_future(self._dispatch(batch))
+
+        # Shielded: cancelling one caller mustn't cancel the request or the
+        # result it shares with the batch's other callers
+        if dispatch is not None:
+            await asyncio.shield(dispatch)
+        return await asyncio.shield(future)
+
+    async def _dispatch(self, batch):
+        try:
+            results = await self.batch_fn(list(batch.futures))
+        except Exception as e:
+            _fail(batch, e)
+        else:
+            _resolve(batch, results)
@@ -0,0 +1,169 @@
+import weakref
+from functools import lru_cache
+
+from .selection import _fields_of, resolve_type
+
+# Nested entity references ({"id": ..., "name": ...}) repeat across results,
+# e.g. the same assignee on thousands of issues; equal ones share an instance
+_INTERNED = weakref.WeakValueDictionary()
+
+
+class Model:
+    """
+    Base of the compact, immutable result objects generated by `model_for`.
+
+    Scalar fields are stored in slots. Nested objects and lists stay in
+    their decoded-JSON form until first accessed. Fields that weren't
+    selected raise AttributeError; keys unknown to the type (aliases) are
+    kept in `_extra`.
+    """
+
+    __slots__ = ("__weakref__", "_extra")
+    __type__ = None
+    _fields = ()
+    _nested = {}
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getattr__(self, name):
+        # Only reached for unset slots and for aliased selections
+        if name in self._fields:
+            raise AttributeError(f"{type(self).__name__}.{name} was not selected")
+        extra = object.__getattribute__(self, "_extra")
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(f"{type(self).__name__} has no attribute '{name}'")
+
+    def __reduce__(self):
+        return decode, (self.to_dict(), self.__type__)
+
+    def __repr__(self):
+        items = ", ".join(f"{name}={value!r}" for name, value in self._items())
+        return f"{type(self).__name__}({items})"
+
+    def _items(self):
+        for name in self._fields:
+            slot = f"_{name}" if name in self._nested else name
+            try:
+                yield name, object.__getattribute__(self, slot)
+            except AttributeError:
+                continue
+        if self._extra:
+            yield from self._extra.items()
+
+    def to_dict(self):
+        """Convert back to the plain dict the API returned."""
+        return {name: _to_plain(value) for name, value in self._items()}
+
+
+def _to_plain(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _nested_property(name, type_):
+    slot = f"_{name}"
+
+    def get(self):
+        try:
+            value = object.__getattribute__(self, slot)
+        except AttributeError:
+            raise AttributeError(
+                f"{type(self).__name__}.{name} was not selected"
+            ) from None
+        if type(value) is dict or type(value) is list:
+            value = decode(value, type_)
+            object.__setattr__(self, slot, value)
+        return value
+
+    return property(get)
+
+
+@lru_cache(maxsize=None)
+def model_for(type_):
+    """The slotted Model class for a strawberry type, or None for scalars."""
+    fields = _fields_of(type_)
+    if fields is None:
+        return None
+
+    nested = {
+        name: field_type
+        for name, field_type in fields.items()
+        if _fields_of(field_type) is not None
+    }
+    namespace = {
+        "__slots__": tuple(f"_{name}" if name in nested else name for name in fields),
+        "__type__": type_,
+        "__module__": __name__,
+        "_fields": tuple(fields),
+        "_nested": nested,
+    }
+    for name, field_type in nested.items():
+        namespace[name] = _nested_property(name, field_type)
+    return type(type_.__name__, (Model,), namespace)
+
+
+def _is_leaf(value):
+    return not any(type(item) is dict or type(item) is list for item in value.values())
+
+
+def _build(cls, value):
+    obj = object.__new__(cls)
+    setattr_ = object.__setattr__
+    nested = cls._nested
+    extra = None
+    for name, item in value.items():
+        if name in nested:
+            if type(item) is dict and "id" in item and _is_leaf(item):
+                # Entity references are decoded now so they can be shared
+                item = _intern(nested[name], item)
+            setattr_(obj, f"_{name}", item)
+        elif name in cls._fields:
+            setattr_(obj, name, item)
+        else:
+            if extra is None:
+                extra = {}
+            extra[name] = item
+    setattr_(obj, "_extra", extra)
+    return obj
+
+
+def _intern(type_, value):
+    cls = model_for(type_)
+    key = (cls, tuple(value.items()))
+    try:
+        obj = _INTERNED.get(key)
+    except TypeError:
+        # Unhashable scalar (e.g. a JSON scalar); just don't share it
+        return _build(cls, value)
+    if obj is None:
+        obj = _INTERNED[key] = _build(cls, value)
+    return obj
+
+
+def decode(value, type_):
+    """
+    Decode a result (a dict, a list of dicts, or None) into models of
+    `type_` (a type from linear_python.types or its name), e.g.
+    decode(response["data"]["issue"], Issue).
+    """
+    cls = model_for(resolve_type(type_))
+    if cls is None or value is None:
+        return value
+    if isinstance(value, list):
+        return tuple(decode(item, type_) for item in value)
+    if isinstance(value, dict):
+        return _build(cls, value)
+    return value
+
+
+def as_dict(value):
+    """`value` as a plain dict, whether or not it was decoded into a Model."""
+    return value.to_dict() if isinstance(value, Model) else value
@@ -0,0 +1,160 @@
+import re
+from functools import lru_cache
+
+from .registry import register
+from .selection import build_selection, normalize_fields, replace_selection
+
+_VARIABLE = re.compile(r"\$(\w+)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class Operation:
+    """
+    A GraphQL operation with a single root field.
+
+    Besides rendering its own document, an operation can be merged with
+    others under aliases (`i0: issueCreate(...)`, `i1: ...`) so many calls
+    travel in one request. Variables are suffixed per alias to avoid
+    collisions.
+    """
+
+    def __init__(
+        self,
+        kind,
+        name,
+        field,
+        selection,
+        variables=None,
+        arguments=None,
+        fields_type=None,
+        fields_path=(),
+    ):
+        self.kind = kind
+        self.name = name
+        self.field = field
+        self.selection = _WHITESPACE.sub(" ", selection).strip()
+        self.variables = dict(variables or {})
+        self.arguments = dict(arguments or {})
+        # Strawberry type (or its name in linear_python.types) of the node
+        # at `fields_path`, for select()
+        self.fields_type = fields_type
+        self.fields_path = tuple(fields_path)
+        self.document = build_document(self.kind, self.name, [(None, self, "")])
+        self.compiled = register(self.document)
+
+    def select(self, fields):
+        """
+        Return this operation with only `fields` selected on its result
+        node. Operations are built once per distinct selection and reused.
+        """
+        if fields is None:
+            return self
+        return _select(self, normalize_fields(fields))
+
+    def render(self, alias=None, suffix=""):
+        """Return (variable definitions, field text) for this operation."""
+        definitions = [
+            f"${name}{suffix}: {type_}" for name, type_ in self.variables.items()
+        ]
+        field = f"{alias}: {self.field}" if alias else self.field
+        if self.arguments:
+            args = ", ".join(
+                f"{arg}: ${var}{suffix}" for arg, var in self.arguments.items()
+            )
+            field = f"{field}({args})"
+        selection = self.selection
+        if suffix:
+            selection = _VARIABLE.sub(lambda m: f"${m.group(1)}{suffix}", selection)
+        return definitions, f"{field} {{ {selection} }}"
+
+    def rename_variables(self, variables, suffix):
+        return {f"{name}{suffix}": value for name, value in (variables or {}).items()}
+
+
+@lru_cache(maxsize=256)
+def _select(operation, fields):
+    if operation.fields_type is None:
+        raise ValueError(f"{operation.name} does not support field selection")
+    selection = replace_selection(
+        operation.selection,
+        operation.fields_path,
+        build_selection(operation.fields_type, fields),
+    )
+    return Operation(
+        operation.kind,
+        operation.name,
+        operation.field,
+        selection,
+        variables=operation.variables,
+        arguments=operation.arguments,
+        fields_type=operation.fields_type,
+        fields_path=operation.fields_path,
+    )
+
+
+def build_document(kind, name, parts):
+    """Render `parts`, a list of (alias, operation, suffix), as one document."""
+    definitions = []
+    fields = []
+    for alias, operation, suffix in parts:
+        part_definitions, field = operation.render(alias, suffix)
+        definitions.extend(part_definitions)
+        fields.append(field)
+
+    header = f"{kind} {name}"
+    if definitions:
+        header = f"{header}({', '.join(definitions)})"
+    return f"{header} {{ {' '.join(fields)} }}"
+
+
+def build_batch(name, calls):
+    """
+    Merge `calls`, a list of (operation, variables), into one aliased
+    document. Returns (document, variables, aliases).
+    """
+    parts = []
+    variables = {}
+    aliases = []
+    for index, (operation, call_variables) in enumerate(calls):
+        alias = f"i{index}"
+        suffix = f"_{index}"
+        parts.append((alias, operation, suffix))
+        variables.update(operation.rename_variables(call_variables, suffix))
+        aliases.append(alias)
+
+    kind = calls[0][0].kind
+    return build_document(kind, name, parts), variables, aliases
+
+
+def split_batch_response(response, aliases):
+    """
+    Split an aliased response into one result per alias. Items that failed
+    get {"success": False, "errors": [...]} with the errors whose path
+    points at that alias; if the whole request failed every item is None.
+    """
+    if not response:
+        return [response for _ in aliases]
+
+    data = response.get("data") or {}
+    errors_by_alias = {}
+    for error in response.get("errors") or []:
+        path = error.get("path") or [None]
+        errors_by_alias.setdefault(path[0], []).append(error)
+
+    results = []
+    for alias in aliases:
+        result = data.get(alias)
+        if result is None:
+            errors = errors_by_alias.get(alias) or errors_by_alias.get(None, [])
+            result = {"success": False, "errors": errors}
+        results.append(result)
+    return results
+
+
+def split_query_response(response, aliases):
+    """Split an aliased query response into the data for each alias."""
+    if not response:
+        return [response for _ in aliases]
+
+    data = response.get("data") or {}
+    return [data.get(alias) for alias in aliases]
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from .errors import LinearAPIError
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def _next_cursor(connection):
+    page_info = connection.get("pageInfo") or {}
+    if not page_info.get("hasNextPage"):
+        return None
+    return page_info.get("endCursor")
+
+
+def page_variables(first, after, filter=None, include_archived=False, order_by=None):
+    """Variables for one page of a connection; optional ones are sent only if set."""
+    variables = {"first": first, "after": after}
+    if filter is not None:
+        variables["filter"] = filter
+    if include_archived:
+        variables["includeArchived"] = True
+    if order_by is not None:
+        variables["orderBy"] = order_by
+    return variables
+
+
+def paginate(fetch_page, prefetch=False):
+    """
+    Lazily yield nodes from a cursor-paginated connection.
+
+    `fetch_page(after)` returns the connection dict ({nodes, pageInfo}) for
+    the page after `after`. Only one page is held in memory at a time; with
+    `prefetch=True` the next page is requested on a background thread while
+    the current one is being consumed.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        connection = fetch_page(None)
+        while True:
+            if connection is None:
+                raise LinearAPIError("request failed while paginating")
+
+            cursor = _next_cursor(connection)
+            pending = None
+            if cursor is not None and executor is not None:
+                pending = executor.submit(fetch_page, cursor)
+
+            yield from connection["nodes"]
+
+            if cursor is None:
+                return
+            connection = pending.result() if pending else fetch_page(cursor)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def apaginate(fetch_page, prefetch=False):
+    """Async version of paginate; `fetch_page(after)` is a coroutine function."""
+    # asyncio is imported where used so sync clients never load it
+    import asyncio
+
+    pending = None
+    try:
+        connection = await fetch_page(None)
+        while True:
+            if connection is None:
+                raise LinearAPIError("request failed while paginating")
+
+            cursor = _next_cursor(connection)
+            if cursor is not None and prefetch:
+                pending = asyncio.ensure_future(fetch_page(cursor))
+
+            for node in connection["nodes"]:
+                yield node
+
+            if cursor is None:
+                return
+            if pending is not None:
+                connection, pending = await pending, None
+            else:
+                connection = await fetch_page(cursor)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def stream_pages(fetch_stream):
+    """
+    Like paginate, but `fetch_stream(after)` returns a NodeStream, so nodes
+    are yielded while each page is still downloading. The next cursor is
+    only known once a page is consumed, so there is no prefetching.
+    """
+    after = None
+    while True:
+        stream = fetch_stream(after)
+        yield from stream
+        if stream.connection is None:
+            raise LinearAPIError("request failed while paginating")
+
+        after = _next_cursor(stream.connection)
+        if after is None:
+            return
+
+
+async def astream_pages(fetch_stream):
+    """Async version of stream_pages; `fetch_stream(after)` is a coroutine function."""
+    after = None
+    while True:
+        stream = await fetch_stream(after)
+        async for node in stream:
+            yield node
+        if stream.connection is None:
+            raise LinearAPIError("request failed while paginating")
+
+        after = _next_cursor(stream.connection)
+        if after is None:
+            return
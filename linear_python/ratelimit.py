@@ -0,0 +1,330 @@
+import asyncio
+import random
+import threading
+import time
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _retry_exceptions():
+    exceptions = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    try:
+        import httpx
+    except ImportError:
+        return exceptions
+    return exceptions + (httpx.TransportError,)
+
+
+def is_connect_error(error):
+    """
+    True if `error` was raised while connecting, before any of the request
+    was sent, so retrying it can't apply a mutation twice.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = error.args[0] if error.args else None
+        if isinstance(reason, MaxRetryError):
+            reason = reason.reason
+        return isinstance(reason, NewConnectionError)
+    try:
+        import httpx
+    except ImportError:
+        return False
+    return isinstance(
+        error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    )
+
+
+def _header(headers, name):
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def is_rate_limited(response):
+    """Linear reports rate limiting as 429, or 400 with a RATELIMITED error."""
+    if response.status_code == 429:
+        return True
+    if response.status_code != 400:
+        return False
+    try:
+        errors = response.json().get("errors") or []
+    except ValueError:
+        return False
+    return any(
+        (error.get("extensions") or {}).get("code") == "RATELIMITED" for error in errors
+    )
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `capacity / window` tokens per second, and
+    re-seeded from the remaining/limit/reset values Linear reports.
+    """
+
+    def __init__(self, capacity, window=3600.0):
+        self.capacity = capacity
+        self.window = window
+        self.tokens = float(capacity)
+        self.reset_at = None
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self.capacity / self.window
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens=1):
+        """Take `tokens` and return how many seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            wait = -self.tokens / self.rate
+            if self.reset_at is not None:
+                wait = min(wait, max(0.0, self.reset_at - time.time()))
+            return wait
+
+    def update(self, remaining, limit=None, reset_at=None):
+        with self._lock:
+            if limit:
+                self.capacity = limit
+            self.tokens = min(self.capacity, remaining)
+            self.reset_at = reset_at
+            self._updated = time.monotonic()
+
+    @property
+    def remaining_fraction(self):
+        with self._lock:
+            return max(0.0, self.tokens) / self.capacity if self.capacity else 0.0
+
+
+class RetryPolicy:
+    """
+    Full-jitter exponential backoff for 429/5xx and connection errors.
+    Mutations are only retried when Linear rate limited them or the
+    connection failed before they were sent; after a 5xx or a read
+    timeout Linear may already have applied them.
+    """
+
+    def __init__(
+        self,
+        max_retries=5,
+        backoff_base=0.5,
+        backoff_max=30.0,
+        retry_statuses=RETRY_STATUSES,
+        retry_exceptions=None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_exceptions = (
+            retry_exceptions if retry_exceptions is not None else _retry_exceptions()
+        )
+
+    def should_retry(self, response, kind="query"):
+        if kind == "mutation":
+            return is_rate_limited(response)
+        return response.status_code in self.retry_statuses or is_rate_limited(response)
+
+    def should_retry_error(self, error, kind="query"):
+        return kind != "mutation" or is_connect_error(error)
+
+    def delay(self, attempt, response=None):
+        if response is not None:
+            retry_after = _header(response.headers, "Retry-After")
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+class AdaptiveConcurrency:
+    """
+    Cap on requests in flight. The cap halves when Linear throttles us and
+    grows by one per success, but never beyond a share of `max_concurrency`
+    proportional to the remaining rate-limit budget.
+    """
+
+    def __init__(self, max_concurrency=16, min_concurrency=1):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = max_concurrency
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        # (loop, future) per waiting coroutine. Futures rather than an
+        # asyncio.Condition, which binds to one event loop: callers may run
+        # on several loops and threads, and wake-ups cross between them
+        self._async_waiters = []
+
+    def _ceiling(self, budget_fraction):
+        return max(self.min_concurrency, round(self.max_concurrency * budget_fraction))
+
+    def _wake(self):
+        # Called with self._condition held
+        self._condition.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+            except RuntimeError:
+                # The waiter's loop has been closed
+                pass
+
+    def on_success(self, budget_fraction=1.0):
+        with self._condition:
+            self.limit = min(self.limit + 1, self._ceiling(budget_fraction))
+            self._wake()
+
+    def on_throttle(self):
+        with self._condition:
+            self.limit = max(self.min_concurrency, self.limit // 2)
+
+    def acquire(self):
+        with self._condition:
+            self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._wake()
+
+    async def aacquire(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    async def arelease(self):
+        self.release()
+
+
+def _wake_waiter(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class Scheduler:
+    """
+    Rate-limit-aware request scheduler shared by the sub-clients of a
+    LinearClient. Requests wait for budget in the request and complexity
+    token buckets, run under an adaptive concurrency cap, and are retried
+    with jittered backoff on 429/5xx/connection errors (for mutations,
+    only when that can't apply them twice; see RetryPolicy).
+    """
+
+    def __init__(
+        self,
+        requests_per_hour=1500,
+        complexity_per_hour=250000,
+        max_concurrency=16,
+        retry=None,
+    ):
+        self.requests = TokenBucket(requests_per_hour)
+        self.complexity = TokenBucket(complexity_per_hour)
+        self.concurrency = AdaptiveConcurrency(max_concurrency)
+        self.retry = retry if retry is not None else RetryPolicy()
+        # Last observed complexity per operation, used as the cost estimate
+        self._costs = {}
+
+    def _reserve(self, operation_name):
+        cost = self._costs.get(operation_name, 1)
+        return max(self.requests.reserve(), self.complexity.reserve(cost))
+
+    def observe(self, operation_name, headers):
+        """Re-seed the buckets from Linear's rate-limit response headers."""
+        for bucket, prefix in (
+            (self.requests, "X-RateLimit-Requests"),
+            (self.complexity, "X-RateLimit-Complexity"),
+        ):
+            remaining = _header(headers, f"{prefix}-Remaining")
+            if remaining is not None:
+                reset = _header(headers, f"{prefix}-Reset")
+                bucket.update(
+                    remaining,
+                    limit=_header(headers, f"{prefix}-Limit"),
+                    reset_at=reset / 1000 if reset is not None else None,
+                )
+        complexity = _header(headers, "X-Complexity")
+        if complexity is not None:
+            self._costs[operation_name] = complexity
+
+    def _budget(self):
+        return min(self.requests.remaining_fraction, self.complexity.remaining_fraction)
+
+    def _outcome(self, operation_name, kind, attempt, response, error):
+        """Return the delay before retrying, or None if the result is final."""
+        if error is not None and not self.retry.should_retry_error(error, kind):
+            raise error
+        if response is not None:
+            self.observe(operation_name, response.headers)
+            if not self.retry.should_retry(response, kind):
+                self.concurrency.on_success(self._budget())
+                return None
+            if is_rate_limited(response):
+                self.concurrency.on_throttle()
+        if attempt >= self.retry.max_retries:
+            if error is not None:
+                raise error
+            return None
+        return self.retry.delay(attempt, response)
+
+    def execute(self, send, operation_name="", kind="query"):
+        attempt = 0
+        while True:
+            time.sleep(self._reserve(operation_name))
+            response = error = None
+            self.concurrency.acquire()
+            try:
+                response = send()
+            except self.retry.retry_exceptions as e:
+                error = e
+            finally:
+                self.concurrency.release()
+
+            delay = self._outcome(operation_name, kind, attempt, response, error)
+            if delay is None:
+                return response
+            time.sleep(delay)
+            attempt += 1
+
+    async def aexecute(self, send, operation_name="", kind="query"):
+        """Async version of execute; `send` is a coroutine function."""
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._reserve(operation_name))
+            response = error = None
+            await self.concurrency.aacquire()
+            try:
+                response = await send()
+            except self.retry.retry_exceptions as e:
+                error = e
+            finally:
+                await self.concurrency.arelease()
+
+            delay = self._outcome(operation_name, kind, attempt, response, error)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
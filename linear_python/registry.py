@@ -0,0 +1,89 @@
+import hashlib
+import re
+from functools import lru_cache
+
+from .codec import dumps as _dumps
+
+_OPERATION = re.compile(r"\s*(query|mutation|subscription)\b\s*(\w*)")
+_REGISTRY = {}
+
+
+@lru_cache(maxsize=512)
+def parse_operation(document):
+    """Return (kind, name) for a GraphQL document, e.g. ("query", "GetIssue")."""
+    match = _OPERATION.match(document)
+    if match is None:
+        return "query", ""
+    return match.group(1), match.group(2)
+
+
+class CompiledQuery:
+    """
+    A GraphQL document prepared once: its SHA-256 hash and the constant
+    JSON prefixes of the request body are computed up front, so sending it
+    only costs serializing the variables.
+    """
+
+    __slots__ = ("document", "kind", "name", "hash", "_full", "_hashed", "_persisted")
+
+    def __init__(self, document):
+        self.document = document
+        self.kind, self.name = parse_operation(document)
+        self.hash = hashlib.sha256(document.encode()).hexdigest()
+        query = b'{"query":' + _dumps(document)
+        extensions = b'"extensions":' + _dumps(
+            {"persistedQuery": {"version": 1, "sha256Hash": self.hash}}
+        )
+        self._full = query + b',"variables":'
+        self._hashed = query + b"," + extensions + b',"variables":'
+        self._persisted = b"{" + extensions + b',"variables":'
+
+    def body(self, variables=None, persisted=False, include_query=True):
+        """
+        Return the encoded request body. With `persisted=True` the
+        persisted-query extension is added, and `include_query=False` sends
+        only the hash.
+        """
+        if not persisted:
+            prefix = self._full
+        elif include_query:
+            prefix = self._hashed
+        else:
+            prefix = self._persisted
+        return prefix + _dumps(variables) + b"}"
+
+
+def register(document):
+    """Compile `document` once and keep it for the lifetime of the process."""
+    compiled = _REGISTRY.get(document)
+    if compiled is None:
+        compiled = _REGISTRY[document] = CompiledQuery(document)
+    return compiled
+
+
+def lookup(document):
+    """Return the compiled form of `document`, compiling ad-hoc ones on demand."""
+    compiled = _REGISTRY.get(document)
+    if compiled is None:
+        compiled = _compile(document)
+    return compiled
+
+
+@lru_cache(maxsize=1024)
+def _compile(document):
+    return CompiledQuery(document)
+
+
+def persisted_query_missing(response):
+    """True if the server does not know the hash of a persisted query."""
+    if response.status_code not in (200, 400):
+        return False
+    try:
+        errors = response.json().get("errors") or []
+    except ValueError:
+        return False
+    return any(
+        error.get("message") == "PersistedQueryNotFound"
+        or (error.get("extensions") or {}).get("code") == "PERSISTED_QUERY_NOT_FOUND"
+        for error in errors
+    )
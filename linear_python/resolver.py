@@ -0,0 +1,442 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .errors import LinearAPIError
+from .operations import Operation, build_batch, split_query_response
+from .pagination import _next_cursor
+
+DEFAULT_TTL = 300.0
+# A reference that isn't in the index triggers at most one reload per this
+# many seconds, so a new teammate or label is picked up without waiting for
+# the TTL while typos don't turn into a request each
+DEFAULT_MISS_INTERVAL = 10.0
+PAGE_SIZE = 250
+# Issue -> team lookups kept for scoping updates, and sent per request
+ISSUE_TEAMS_MAXSIZE = 10000
+ISSUE_TEAMS_BATCH_SIZE = 100
+
+# Human-readable key in an issue input -> the ID key it resolves to
+REFERENCE_KEYS = {
+    "team": "teamId",
+    "assignee": "assigneeId",
+    "state": "stateId",
+    "labels": "labelIds",
+}
+
+_PAGE_VARIABLES = {"first": "Int!", "after": "String"}
+_PAGE_ARGUMENTS = {"first": "first", "after": "after"}
+_PAGE_INFO = "pageInfo { hasNextPage endCursor }"
+
+INDEX_USERS = Operation(
+    "query",
+    "IndexUsers",
+    "users",
+    variables=_PAGE_VARIABLES,
+    arguments=_PAGE_ARGUMENTS,
+    selection=f"nodes {{ id name email }} {_PAGE_INFO}",
+)
+
+INDEX_TEAMS = Operation(
+    "query",
+    "IndexTeams",
+    "teams",
+    variables=_PAGE_VARIABLES,
+    arguments=_PAGE_ARGUMENTS,
+    selection=f"nodes {{ id key name }} {_PAGE_INFO}",
+)
+
+INDEX_STATES = Operation(
+    "query",
+    "IndexWorkflowStates",
+    "workflowStates",
+    variables=_PAGE_VARIABLES,
+    arguments=_PAGE_ARGUMENTS,
+    selection=f"nodes {{ id name type team {{ id }} }} {_PAGE_INFO}",
+)
+
+INDEX_LABELS = Operation(
+    "query",
+    "IndexIssueLabels",
+    "issueLabels",
+    variables=_PAGE_VARIABLES,
+    arguments=_PAGE_ARGUMENTS,
+    selection=f"nodes {{ id name team {{ id }} }} {_PAGE_INFO}",
+)
+
+ISSUE_TEAM = Operation(
+    "query",
+    "IssueTeam",
+    "issue",
+    variables={"issueId": "String!"},
+    arguments={"id": "issueId"},
+    selection="id team { id }",
+)
+
+_SOURCES = (INDEX_USERS, INDEX_TEAMS, INDEX_STATES, INDEX_LABELS)
+
+_AMBIGUOUS = object()
+
+
+class UnknownReference(ValueError):
+    """A name, email or key that doesn't match anything in the index."""
+
+
+def _key(value):
+    if isinstance(value, tuple):
+        scope, name = value
+        return scope, name.strip().casefold()
+    return value.strip().casefold()
+
+
+def _add(table, key, id_):
+    if key is None or (isinstance(key, tuple) and key[1] is None):
+        return
+    key = _key(key)
+    current = table.get(key)
+    table[key] = id_ if current is None or current == id_ else _AMBIGUOUS
+
+
+def _find(table, key, kind, ref):
+    id_ = table.get(_key(key))
+    if id_ is None:
+        raise UnknownReference(f"no {kind} matches {ref!r}")
+    if id_ is _AMBIGUOUS:
+        raise ValueError(f"{ref!r} matches more than one {kind}; pass its ID instead")
+    return id_
+
+
+def _team_id(node):
+    return (node.get("team") or {}).get("id")
+
+
+def needs_issue_team(data):
+    """
+    True if an update names a state or label without a team, so the names
+    are looked up in the team of the issue being updated.
+    """
+    return (
+        isinstance(data, dict)
+        and ("state" in data or "labels" in data)
+        and "team" not in data
+        and "teamId" not in data
+    )
+
+
+class Index:
+    """
+    A snapshot of the workspace's users, teams, workflow
+    states and labels, with dict lookups by email, name and team key.
+    """
+
+    def __init__(self, users=(), teams=(), states=(), labels=()):
+        self.loaded_at = time.monotonic()
+        self.users = {}
+        for user in users:
+            _add(self.users, user.get("email"), user["id"])
+            _add(self.users, user.get("name"), user["id"])
+        self.teams = {}
+        for team in teams:
+            _add(self.teams, team.get("key"), team["id"])
+            _add(self.teams, team.get("name"), team["id"])
+        # States belong to a team; labels to a team or (team None) to the
+        # whole workspace. The *_any tables match a name in any team
+        self.states = {}
+        self.states_any = {}
+        for state in states:
+            _add(self.states, (_team_id(state), state.get("name")), state["id"])
+            _add(self.states_any, state.get("name"), state["id"])
+        self.labels = {}
+        self.labels_any = {}
+        for label in labels:
+            _add(self.labels, (_team_id(label), label.get("name")), label["id"])
+            _add(self.labels_any, label.get("name"), label["id"])
+        # IDs are passed through unchanged wherever a reference is accepted
+        tables = (self.users, self.teams, self.states, self.labels)
+        self.ids = {id_ for table in tables for id_ in table.values()}
+        self.ids.discard(_AMBIGUOUS)
+
+    def user(self, ref):
+        """ID of the user whose email or name is `ref`."""
+        return ref if ref in self.ids else _find(self.users, ref, "user", ref)
+
+    def team(self, ref):
+        """ID of the team whose key (e.g. "ENG") or name is `ref`."""
+        return ref if ref in self.ids else _find(self.teams, ref, "team", ref)
+
+    def state(self, ref, team=None):
+        """ID of the workflow state named `ref`, in `team` if given."""
+        if ref in self.ids:
+            return ref
+        if team is None:
+            return _find(self.states_any, ref, "workflow state", ref)
+        return _find(self.states, (self.team(team), ref), "workflow state", ref)
+
+    def label(self, ref, team=None):
+        """
+        ID of the label named `ref`: the team's own label if `team` has one
+        by that name, otherwise a workspace label.
+        """
+        if ref in self.ids:
+            return ref
+        if team is None:
+            return _find(self.labels_any, ref, "label", ref)
+        key = (self.team(team), ref)
+        if _key(key) not in self.labels:
+            key = (None, ref)
+        return _find(self.labels, key, "label", ref)
+
+    def resolve_issue_input(self, data, team_id=None):
+        """
+        Copy of an IssueCreateInput/IssueUpdateInput dict with `team`,
+        `assignee`, `state` and `labels` references replaced by teamId,
+        assigneeId, stateId and labelIds. State and label names are looked
+        up in the input's team, or else in `team_id` (for updates, the
+        issue's team; it is not added to the input).
+        """
+        data = dict(data)
+        team = data.pop("team", None)
+        if team is not None:
+            data["teamId"] = self.team(team)
+        team_id = data.get("teamId") or team_id
+        assignee = data.pop("assignee", None)
+        if assignee is not None:
+            data["assigneeId"] = self.user(assignee)
+        state = data.pop("state", None)
+        if state is not None:
+            data["stateId"] = self.state(state, team_id)
+        labels = data.pop("labels", None)
+        if labels is not None:
+            data["labelIds"] = [self.label(label, team_id) for label in labels]
+        return data
+
+
+def _collect(nodes, connections):
+    """Add each connection's nodes; return {operation: cursor} for the rest."""
+    pending = {}
+    for operation, connection in connections:
+        if connection is None:
+            raise LinearAPIError(f"request failed while loading {operation.field}")
+        nodes[operation].extend(connection["nodes"])
+        cursor = _next_cursor(connection)
+        if cursor is not None:
+            pending[operation] = cursor
+    return pending
+
+
+def _first_pages():
+    calls = [(operation, {"first": PAGE_SIZE}) for operation in _SOURCES]
+    return build_batch("IndexWorkspace", calls)
+
+
+def _issue_team_batches(issue_ids):
+    for start in range(0, len(issue_ids), ISSUE_TEAMS_BATCH_SIZE):
+        chunk = issue_ids[start : start + ISSUE_TEAMS_BATCH_SIZE]
+        calls = [(ISSUE_TEAM, {"issueId": issue_id}) for issue_id in chunk]
+        yield chunk, build_batch("IssueTeams", calls)
+
+
+def _issue_team_ids(chunk, response, aliases):
+    return {
+        issue_id: _team_id(issue)
+        for issue_id, issue in zip(chunk, split_query_response(response, aliases))
+        if issue is not None
+    }
+
+
+def load(client):
+    """
+    Build an Index with `client`. The first page of every source comes
+    back in one request; only sources with more pages need follow-ups.
+    Requests bypass the client's response cache, which would otherwise
+    answer a refresh with the snapshot it is meant to replace.
+    """
+    nodes = {operation: [] for operation in _SOURCES}
+    document, variables, aliases = _first_pages()
+    response = client._make_request(document, variables, use_cache=False)
+    pending = _collect(nodes, zip(_SOURCES, split_query_response(response, aliases)))
+    while pending:
+        operation, cursor = pending.popitem()
+        response = client._make_request(
+            operation.document,
+            {"first": PAGE_SIZE, "after": cursor},
+            use_cache=False,
+        )
+        connection = response["data"][operation.field] if response else None
+        pending.update(_collect(nodes, [(operation, connection)]))
+    return Index(*nodes.values())
+
+
+async def aload(client):
+    """Async version of load"""
+    nodes = {operation: [] for operation in _SOURCES}
+    document, variables, aliases = _first_pages()
+    response = await client._make_request(document, variables, use_cache=False)
+    pending = _collect(nodes, zip(_SOURCES, split_query_response(response, aliases)))
+    while pending:
+        operation, cursor = pending.popitem()
+        response = await client._make_request(
+            operation.document,
+            {"first": PAGE_SIZE, "after": cursor},
+            use_cache=False,
+        )
+        connection = response["data"][operation.field] if response else None
+        pending.update(_collect(nodes, [(operation, connection)]))
+    return Index(*nodes.values())
+
+
+class ResolverIndex:
+    """
+    Keeps an Index of the workspace and refreshes it in the background once
+    it is older than `ttl` seconds; callers keep using the previous
+    snapshot until the new one is ready. Pass one to a client as
+    `resolver=` to let issue mutations take references such as
+    {"team": "ENG", "assignee": "ada@example.com", "state": "In Progress",
+    "labels": ["Bug"]} instead of IDs.
+
+    The teams of issues being updated are remembered for `ttl` seconds as
+    well; an update that moves an issue to another team drops its entry.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, miss_interval=DEFAULT_MISS_INTERVAL):
+        self.ttl = ttl
+        self.miss_interval = miss_interval
+        self._index = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._task = None
+        self._issue_teams = OrderedDict()
+
+    def _stale(self, index, age):
+        return time.monotonic() - index.loaded_at >= age
+
+    def _claim_refresh(self):
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+            return True
+
+    def get(self, client):
+        """The current Index, loaded with `client` on first use."""
+        index = self._index
+        if index is None:
+            index = self._index = load(client)
+        elif self._stale(index, self.ttl) and self._claim_refresh():
+            threading.Thread(target=self._refresh, args=(client,), daemon=True).start()
+        return index
+
+    def _refresh(self, client):
+        try:
+            self._index = load(client)
+        except Exception:
+            # Keep serving the previous snapshot; the next get() retries
+            pass
+        finally:
+            self._refreshing = False
+
+    def resolve_issue_input(self, client, data, issue_id=None):
+        """
+        Resolve the references in `data`. For an update, pass the issue's
+        ID: state and label names are then looked up in its team.
+        """
+        team_id = None
+        if issue_id is not None and needs_issue_team(data):
+            team_id = self.issue_teams(client, [issue_id]).get(issue_id)
+        index = self.get(client)
+        try:
+            return index.resolve_issue_input(data, team_id)
+        except UnknownReference:
+            if not self._stale(index, self.miss_interval):
+                raise
+        self._index = load(client)
+        return self._index.resolve_issue_input(data, team_id)
+
+    def issue_teams(self, client, issue_ids):
+        """
+        {issue_id: team_id} for `issue_ids`. Issues not seen in the last
+        `ttl` seconds are looked up in batched requests; unknown issues are
+        left out.
+        """
+        missing = self._missing_teams(issue_ids)
+        for chunk, (document, variables, aliases) in _issue_team_batches(missing):
+            response = client._make_request(document, variables, use_cache=False)
+            self._remember_teams(_issue_team_ids(chunk, response, aliases))
+        return self._known_teams(issue_ids)
+
+    def forget_issue_team(self, issue_id):
+        """Drop the remembered team of `issue_id`, e.g. after a move."""
+        with self._lock:
+            self._issue_teams.pop(issue_id, None)
+
+    def _missing_teams(self, issue_ids):
+        with self._lock:
+            teams = {i: self._issue_teams.get(i) for i in dict.fromkeys(issue_ids)}
+        now = time.monotonic()
+        return [i for i, entry in teams.items() if entry is None or entry[1] <= now]
+
+    def _remember_teams(self, teams):
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            for issue_id, team_id in teams.items():
+                self._issue_teams.pop(issue_id, None)
+                self._issue_teams[issue_id] = (team_id, expires_at)
+            while len(self._issue_teams) > ISSUE_TEAMS_MAXSIZE:
+                self._issue_teams.popitem(last=False)
+
+    def _known_teams(self, issue_ids):
+        now = time.monotonic()
+        with self._lock:
+            teams = {i: self._issue_teams.get(i) for i in issue_ids}
+        return {
+            i: entry[0]
+            for i, entry in teams.items()
+            if entry is not None and entry[0] is not None and entry[1] > now
+        }
+
+    async def aget(self, client):
+        """Async version of get"""
+        import asyncio
+
+        index = self._index
+        if index is None:
+            index = self._index = await aload(client)
+        elif self._stale(index, self.ttl) and self._claim_refresh():
+            self._task = asyncio.ensure_future(self._arefresh(client))
+        return index
+
+    async def _arefresh(self, client):
+        try:
+            self._index = await aload(client)
+        except Exception:
+            pass
+        finally:
+            self._refreshing = False
+
+    async def aresolve_issue_input(self, client, data, issue_id=None):
+        """Async version of resolve_issue_input"""
+        team_id = None
+        if issue_id is not None and needs_issue_team(data):
+            team_id = (await self.aissue_teams(client, [issue_id])).get(issue_id)
+        index = await self.aget(client)
+        try:
+            return index.resolve_issue_input(data, team_id)
+        except UnknownReference:
+            if not self._stale(index, self.miss_interval):
+                raise
+        self._index = await aload(client)
+        return self._index.resolve_issue_input(data, team_id)
+
+    async def aissue_teams(self, client, issue_ids):
+        """Async version of issue_teams"""
+        missing = self._missing_teams(issue_ids)
+        for chunk, (document, variables, aliases) in _issue_team_batches(missing):
+            response = await client._make_request(document, variables, use_cache=False)
+            self._remember_teams(_issue_team_ids(chunk, response, aliases))
+        return self._known_teams(issue_ids)
+
+    def invalidate(self):
+        """Drop the snapshot so the next lookup reloads it."""
+        self._index = None
+        with self._lock:
+            self._issue_teams.clear()
@@ -1,6 +1,44 @@
-from .issues import IssueClient
-from .projects import ProjectClient
-from .teams import TeamClient
-from .users import UserClient
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["IssueClient", "ProjectClient", "TeamClient", "UserClient"]
+if TYPE_CHECKING:
+    from .issues import AsyncIssueClient, IssueClient
+    from .projects import AsyncProjectClient, ProjectClient
+    from .teams import AsyncTeamClient, TeamClient
+    from .users import AsyncUserClient, UserClient
+
+# Client name -> submodule, imported on first access
+_EXPORTS = {
+    "AsyncIssueClient": "issues",
+    "IssueClient": "issues",
+    "AsyncProjectClient": "projects",
+    "ProjectClient": "projects",
+    "AsyncTeamClient": "teams",
+    "TeamClient": "teams",
+    "AsyncUserClient": "users",
+    "UserClient": "users",
+}
+
+__all__ = [
+    "AsyncIssueClient",
+    "AsyncProjectClient",
+    "AsyncTeamClient",
+    "AsyncUserClient",
+    "IssueClient",
+    "ProjectClient",
+    "TeamClient",
+    "UserClient",
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -1,94 +1,298 @@
-from ..base import BaseClient
-from ..types import (
-    Issue,
-    IssueArchivePayload,
-    IssueCreateInput,
-    IssuePayload,
-    IssueUpdateInput,
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List
+
+from ..base import AsyncBaseClient, BaseClient
+from ..filters import compile_filter
+from ..operations import Operation
+from ..pagination import (
+    DEFAULT_PAGE_SIZE,
+    apaginate,
+    astream_pages,
+    page_variables,
+    paginate,
+    stream_pages,
 )
 
+if TYPE_CHECKING:
+    from ..types import (
+        Issue,
+        IssueArchivePayload,
+        IssueCreateInput,
+        IssuePayload,
+        IssueUpdateInput,
+    )
 
-class IssueClient(BaseClient):
-    def create_issue(self, data: IssueCreateInput) -> IssuePayload:
-        if not isinstance(data, dict):
-            raise TypeError("data must be a dictionary")
-
-        if "teamId" not in data:
-            raise ValueError("teamId is required in data")
-
-        if "title" not in data:
-            raise ValueError("title is required in data")
-
-        mutation = """
-        mutation CreateIssue($input: IssueCreateInput!) {
-            issueCreate(
-                input: $input
-            ) {
-                success
-                issue {
-                    id
-                    title
-                    url
-                }
+CREATE_ISSUE = Operation(
+    "mutation",
+    "CreateIssue",
+    "issueCreate",
+    variables={"input": "IssueCreateInput!"},
+    arguments={"input": "input"},
+    selection="""
+        success
+        issue {
+            id
+            title
+            url
+        }
+    """,
+)
+
+GET_ISSUE = Operation(
+    "query",
+    "GetIssue",
+    "issue",
+    variables={"issueId": "String!"},
+    arguments={"id": "issueId"},
+    selection="""
+        id
+        assignee {
+            id
+            name
+        }
+        creator {
+            id
+            name
+        }
+        description
+        dueDate
+        labels {
+            nodes {
+                id
+                name
             }
         }
-        """
+        priority
+        priorityLabel
+        project {
+            id
+            name
+        }
+        state {
+            id
+            name
+            position
+        }
+        title
+        url
+    """,
+    fields_type="Issue",
+)
+
+ITER_ISSUES = Operation(
+    "query",
+    "IterIssues",
+    "issues",
+    variables={
+        "first": "Int!",
+        "after": "String",
+        "filter": "IssueFilter",
+        "includeArchived": "Boolean",
+        "orderBy": "PaginationOrderBy",
+    },
+    arguments={
+        "first": "first",
+        "after": "after",
+        "filter": "filter",
+        "includeArchived": "includeArchived",
+        "orderBy": "orderBy",
+    },
+    selection="""
+        nodes {
+            id
+            identifier
+            title
+            url
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    """,
+    fields_type="Issue",
+    fields_path=("nodes",),
+)
+
+UPDATE_ISSUE = Operation(
+    "mutation",
+    "UpdateIssue",
+    "issueUpdate",
+    variables={"issueId": "String!", "input": "IssueUpdateInput!"},
+    arguments={"id": "issueId", "input": "input"},
+    selection="""
+        success
+        issue {
+            id
+            title
+            description
+        }
+    """,
+)
+
+DELETE_ISSUE = Operation(
+    "mutation",
+    "DeleteIssue",
+    "issueDelete",
+    variables={"issueId": "String!", "permanentlyDelete": "Boolean"},
+    arguments={"id": "issueId", "permanentlyDelete": "permanentlyDelete"},
+    selection="""
+        success
+        lastSyncId
+        entity {
+            id
+            title
+            description
+        }
+    """,
+)
+
+# Aliased mutations per request; keeps each document well under Linear's
+# query complexity limit.
+DEFAULT_BATCH_SIZE = 50
+
+
+def _validate_create_input(data):
+    if not isinstance(data, dict):
+        raise TypeError("data must be a dictionary")
+
+    if "teamId" not in data:
+        raise ValueError("teamId is required in data")
+
+    if "title" not in data:
+        raise ValueError("title is required in data")
+
+
+def _validate_update_input(data):
+    if data is not None and not isinstance(data, dict):
+        raise TypeError("data must be a dictionary")
+
+
+def _succeeded_tags(issue_ids, results):
+    return [
+        f"issue:{issue_id}"
+        for issue_id, result in zip(issue_ids, results)
+        if result and result.get("success")
+    ]
+
+
+class IssueClient(BaseClient):
+    def create_issue(self, data: IssueCreateInput) -> IssuePayload:
+        data = self._resolve_references(data)
+        _validate_create_input(data)
 
         api_data = {"input": {**data}}
 
-        response = self._make_request(mutation, api_data)
+        response = self._make_request(CREATE_ISSUE.document, api_data)
         if not response:
             return response
 
         return response["data"]["issueCreate"]
 
-    def get_issue(self, issue_id) -> Issue:
-        query = """
-        query GetIssue($issueId: String!) {
-            issue(id: $issueId) {
-                id
-                assignee {
-                  id
-                  name
-                }
-                creator {
-                  id
-                  name
-                }
-                description
-                dueDate
-                labels {
-                  nodes {
-                    id
-                    name
-                  }
-                }
-                priority
-                priorityLabel
-                project {
-                  id
-                  name
-                }
-                state {
-                  id
-                  name
-                  position
-                }
-                title
-                url
-            }
-        }
-        """
+    def get_issue(self, issue_id, fields=None) -> Issue:
+        operation = GET_ISSUE.select(fields)
+
+        if self.coalesce_window is not None:
+            return self._decode(self._load(operation, issue_id), "Issue")
 
         variables = {
             "issueId": issue_id,
         }
 
-        response = self._make_request(query, variables)
+        response = self._make_request(
+            operation.document, variables, cache_tags=(f"issue:{issue_id}",)
+        )
         if not response:
             return response
 
-        return response["data"]["issue"]
+        return self._decode(response["data"]["issue"], "Issue")
+
+    def iter_issues(
+        self,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        filter=None,
+        include_archived=False,
+        stream=False,
+        order_by=None,
+    ):
+        """
+        Lazily iterate over every issue matching `filter` (an IssueFilter
+        dict, e.g. {"updatedAt": {"gt": "2024-01-01T00:00:00.000Z"}}, or a
+        linear_python.filters expression), optionally ordered by
+        "createdAt" or "updatedAt"
+        """
+        operation = ITER_ISSUES.select(fields)
+        filter = compile_filter(filter)
+
+        def fetch_page(after):
+            variables = page_variables(
+                page_size, after, filter, include_archived, order_by
+            )
+            response = self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return response["data"]["issues"]
+
+        def fetch_stream(after):
+            variables = page_variables(
+                page_size, after, filter, include_archived, order_by
+            )
+            return self._stream_nodes(
+                operation.document, variables, ("issues", "nodes")
+            )
+
+        if stream:
+            nodes = stream_pages(fetch_stream)
+        else:
+            nodes = paginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "Issue")
+
+    def search_issues(
+        self,
+        filter=None,
+        order_by=None,
+        fields=None,
+        page_size=DEFAULT_PAGE_SIZE,
+        include_archived=False,
+        stream=True,
+    ):
+        """
+        Iterate over the issues matching `filter`, filtered by Linear rather
+        than locally, e.g.
+
+            from linear_python.filters import F
+
+            client.search_issues(
+                (F.team.key == "ENG") & (F.priority.in_([1, 2]))
+                & (F.assignee.email == "ada@example.com")
+                & F.labels.some(F.name == "Bug"),
+                order_by="updatedAt",
+            )
+
+        Pages are streamed and decoded as they download.
+        """
+        return self.iter_issues(
+            page_size=page_size,
+            fields=fields,
+            filter=filter,
+            include_archived=include_archived,
+            stream=stream,
+            order_by=order_by,
+        )
+
+    def export_issues(self, path, filter=None, format=None, workers=4, **options):
+        """
+        Export every issue matching `filter` to an NDJSON, CSV or Parquet
+        file; see linear_python.export.export_issues
+        """
+        from ..export import export_issues
+
+        return export_issues(
+            self, path, filter=filter, format=format, workers=workers, **options
+        )
 
     def update_issue(
         self, issue_id: str, data: IssueUpdateInput = None
@@ -98,58 +302,241 @@ class IssueClient(BaseClient):
         Required fields: issue_id
         Optional fields in data dict: title, description
         """
-        if data is not None and not isinstance(data, dict):
-            raise TypeError("data must be a dictionary")
-
-        mutation = """
-        mutation UpdateIssue($issueId: String!, $input: IssueUpdateInput!) {
-            issueUpdate(
-                id: $issueId,
-                input: $input
-            ) {
-                success
-                issue {
-                    id
-                    title
-                    description
-                }
-            }
-        }
-        """
+        data = self._resolve_references(data, issue_id)
+        _validate_update_input(data)
 
         api_data = {"issueId": issue_id, "input": {**(data or {})}}
 
-        response = self._make_request(mutation, api_data)
+        response = self._make_request(UPDATE_ISSUE.document, api_data)
         if not response:
             return response
 
-        return response["data"]["issueUpdate"]
+        payload = response["data"]["issueUpdate"]
+        if payload and payload.get("success"):
+            self._invalidate(f"issue:{issue_id}")
+        return payload
 
     def delete_issue(self, issue_id, permanently_delete=True) -> IssueArchivePayload:
-        mutation = """
-        mutation DeleteIssue($issueId: String!, $permanentlyDelete: Boolean) {
-            issueDelete(
-                id: $issueId,
-                permanentlyDelete: $permanentlyDelete
-            ) {
-                success
-                lastSyncId
-                entity {
-                    id
-                    title
-                    description
-                }
-            }  
+        api_data = {
+            "issueId": issue_id,
+            # "permanentlyDelete": permanently_delete,
         }
+
+        response = self._make_request(DELETE_ISSUE.document, api_data)
+        if not response:
+            return response
+
+        payload = response["data"]["issueDelete"]
+        if payload and payload.get("success"):
+            self._invalidate(f"issue:{issue_id}")
+        return payload
+
+    def create_issues(
+        self, items: List[IssueCreateInput], batch_size=DEFAULT_BATCH_SIZE
+    ) -> List[IssuePayload]:
+        """
+        Create many issues, packing up to `batch_size` aliased issueCreate
+        mutations into each request. Returns one payload per input, in
+        order; items that failed get {"success": False, "errors": [...]}.
+        """
+        items = [self._resolve_references(data) for data in items]
+        for data in items:
+            _validate_create_input(data)
+
+        calls = [(CREATE_ISSUE, {"input": {**data}}) for data in items]
+        return self._make_batch_request("CreateIssues", calls, batch_size)
+
+    def update_issues(
+        self, updates: Dict[str, IssueUpdateInput], batch_size=DEFAULT_BATCH_SIZE
+    ) -> List[IssuePayload]:
+        """
+        Update many issues from a dict of issue_id -> data, batching the
+        mutations like create_issues. Results follow the dict's order.
         """
+        self._load_issue_teams(updates)
+        updates = {
+            issue_id: self._resolve_references(data, issue_id)
+            for issue_id, data in updates.items()
+        }
+        for data in updates.values():
+            _validate_update_input(data)
+
+        calls = [
+            (UPDATE_ISSUE, {"issueId": issue_id, "input": {**(data or {})}})
+            for issue_id, data in updates.items()
+        ]
+        results = self._make_batch_request("UpdateIssues", calls, batch_size)
+        self._invalidate(*_succeeded_tags(updates, results))
+        return results
+
+    def delete_issues(
+        self, issue_ids: List[str], batch_size=DEFAULT_BATCH_SIZE
+    ) -> List[IssueArchivePayload]:
+        """Delete many issues, batching the mutations like create_issues"""
+        calls = [(DELETE_ISSUE, {"issueId": issue_id}) for issue_id in issue_ids]
+        results = self._make_batch_request("DeleteIssues", calls, batch_size)
+        self._invalidate(*_succeeded_tags(issue_ids, results))
+        return results
+
 
+class AsyncIssueClient(AsyncBaseClient):
+    async def create_issue(self, data: IssueCreateInput) -> IssuePayload:
+        data = await self._resolve_references(data)
+        _validate_create_input(data)
+
+        api_data = {"input": {**data}}
+
+        response = await self._make_request(CREATE_ISSUE.document, api_data)
+        if not response:
+            return response
+
+        return response["data"]["issueCreate"]
+
+    async def get_issue(self, issue_id, fields=None) -> Issue:
+        operation = GET_ISSUE.select(fields)
+
+        if self.coalesce_window is not None:
+            return self._decode(await self._load(operation, issue_id), "Issue")
+
+        variables = {
+            "issueId": issue_id,
+        }
+
+        response = await self._make_request(
+            operation.document, variables, cache_tags=(f"issue:{issue_id}",)
+        )
+        if not response:
+            return response
+
+        return self._decode(response["data"]["issue"], "Issue")
+
+    def iter_issues(
+        self,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        filter=None,
+        include_archived=False,
+        stream=False,
+        order_by=None,
+    ):
+        """Async iterator over every issue matching `filter`"""
+        operation = ITER_ISSUES.select(fields)
+        filter = compile_filter(filter)
+
+        async def fetch_page(after):
+            variables = page_variables(
+                page_size, after, filter, include_archived, order_by
+            )
+            response = await self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return response["data"]["issues"]
+
+        async def fetch_stream(after):
+            variables = page_variables(
+                page_size, after, filter, include_archived, order_by
+            )
+            return await self._stream_nodes(
+                operation.document, variables, ("issues", "nodes")
+            )
+
+        if stream:
+            nodes = astream_pages(fetch_stream)
+        else:
+            nodes = apaginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "Issue")
+
+    def search_issues(
+        self,
+        filter=None,
+        order_by=None,
+        fields=None,
+        page_size=DEFAULT_PAGE_SIZE,
+        include_archived=False,
+        stream=True,
+    ):
+        """Async version of IssueClient.search_issues"""
+        return self.iter_issues(
+            page_size=page_size,
+            fields=fields,
+            filter=filter,
+            include_archived=include_archived,
+            stream=stream,
+            order_by=order_by,
+        )
+
+    async def update_issue(
+        self, issue_id: str, data: IssueUpdateInput = None
+    ) -> IssuePayload:
+        """Async version of IssueClient.update_issue"""
+        data = await self._resolve_references(data, issue_id)
+        _validate_update_input(data)
+
+        api_data = {"issueId": issue_id, "input": {**(data or {})}}
+
+        response = await self._make_request(UPDATE_ISSUE.document, api_data)
+        if not response:
+            return response
+
+        payload = response["data"]["issueUpdate"]
+        if payload and payload.get("success"):
+            self._invalidate(f"issue:{issue_id}")
+        return payload
+
+    async def delete_issue(
+        self, issue_id, permanently_delete=True
+    ) -> IssueArchivePayload:
         api_data = {
             "issueId": issue_id,
-            # "permanentlyDelete": permanently_delete,
         }
 
-        response = self._make_request(mutation, api_data)
+        response = await self._make_request(DELETE_ISSUE.document, api_data)
         if not response:
             return response
 
-        return response["data"]["issueDelete"]
+        payload = response["data"]["issueDelete"]
+        if payload and payload.get("success"):
+            self._invalidate(f"issue:{issue_id}")
+        return payload
+
+    async def create_issues(
+        self, items: List[IssueCreateInput], batch_size=DEFAULT_BATCH_SIZE
+    ) -> List[IssuePayload]:
+        """Async version of IssueClient.create_issues"""
+        items = [await self._resolve_references(data) for data in items]
+        for data in items:
+            _validate_create_input(data)
+
+        calls = [(CREATE_ISSUE, {"input": {**data}}) for data in items]
+        return await self._make_batch_request("CreateIssues", calls, batch_size)
+
+    async def update_issues(
+        self, updates: Dict[str, IssueUpdateInput], batch_size=DEFAULT_BATCH_SIZE
+    ) -> List[IssuePayload]:
+        """Async version of IssueClient.update_issues"""
+        await self._load_issue_teams(updates)
+        updates = {
+            issue_id: await self._resolve_references(data, issue_id)
+            for issue_id, data in updates.items()
+        }
+        for data in updates.values():
+            _validate_update_input(data)
+
+        calls = [
+            (UPDATE_ISSUE, {"issueId": issue_id, "input": {**(data or {})}})
+            for issue_id, data in updates.items()
+        ]
+        results = await self._make_batch_request("UpdateIssues", calls, batch_size)
+        self._invalidate(*_succeeded_tags(updates, results))
+        return results
+
+    async def delete_issues(
+        self, issue_ids: List[str], batch_size=DEFAULT_BATCH_SIZE
+    ) -> List[IssueArchivePayload]:
+        """Async version of IssueClient.delete_issues"""
+        calls = [(DELETE_ISSUE, {"issueId": issue_id}) for issue_id in issue_ids]
+        results = await self._make_batch_request("DeleteIssues", calls, batch_size)
+        self._invalidate(*_succeeded_tags(issue_ids, results))
+        return results
@@ -1,5 +1,78 @@
-from ..base import BaseClient
-from ..types import ProjectCreateInput, ProjectPayload
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..base import AsyncBaseClient, BaseClient
+from ..operations import Operation
+from ..pagination import (
+    DEFAULT_PAGE_SIZE,
+    apaginate,
+    astream_pages,
+    page_variables,
+    paginate,
+    stream_pages,
+)
+
+if TYPE_CHECKING:
+    from ..types import Project, ProjectCreateInput, ProjectPayload
+
+CREATE_PROJECT = Operation(
+    "mutation",
+    "CreateProject",
+    "projectCreate",
+    variables={"input": "ProjectCreateInput!"},
+    arguments={"input": "input"},
+    selection="""
+        success
+        project {
+            id
+            name
+            url
+        }
+    """,
+)
+
+ITER_PROJECTS = Operation(
+    "query",
+    "IterProjects",
+    "projects",
+    variables={
+        "first": "Int!",
+        "after": "String",
+        "filter": "ProjectFilter",
+        "includeArchived": "Boolean",
+    },
+    arguments={
+        "first": "first",
+        "after": "after",
+        "filter": "filter",
+        "includeArchived": "includeArchived",
+    },
+    selection="""
+        nodes {
+            id
+            name
+            url
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    """,
+    fields_type="Project",
+    fields_path=("nodes",),
+)
+
+
+def _validate_create_input(data):
+    if not isinstance(data, dict):
+        raise TypeError("data must be a dictionary")
+
+    if "name" not in data:
+        raise ValueError("name is required in data")
+
+    if "teamIds" not in data:
+        raise ValueError("teamIds is required in data")
 
 
 class ProjectClient(BaseClient):
@@ -9,34 +82,90 @@ class ProjectClient(BaseClient):
         Required fields: name, teamIds
         Optional fields: description, priority
         """
-        if not isinstance(data, dict):
-            raise TypeError("data must be a dictionary")
-
-        if "name" not in data:
-            raise ValueError("name is required in data")
-
-        if "teamIds" not in data:
-            raise ValueError("teamIds is required in data")
-
-        mutation = """
-        mutation CreateProject($input: ProjectCreateInput!) {
-            projectCreate(
-                input: $input
-            ) {
-                  success
-                  project {
-                      id
-                      name
-                      url
-                  }
-              }
-          }
-        """
+        _validate_create_input(data)
 
         api_data = {"input": {**data}}
 
-        response = self._make_request(mutation, api_data)
+        response = self._make_request(CREATE_PROJECT.document, api_data)
         if not response:
             return response
 
         return response["data"]["projectCreate"]
+
+    def iter_projects(
+        self,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        filter=None,
+        include_archived=False,
+        stream=False,
+    ):
+        """Lazily iterate over every project, following pagination cursors"""
+        operation = ITER_PROJECTS.select(fields)
+
+        def fetch_page(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            response = self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return response["data"]["projects"]
+
+        def fetch_stream(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            return self._stream_nodes(
+                operation.document, variables, ("projects", "nodes")
+            )
+
+        if stream:
+            nodes = stream_pages(fetch_stream)
+        else:
+            nodes = paginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "Project")
+
+
+class AsyncProjectClient(AsyncBaseClient):
+    async def create_project(self, data: ProjectCreateInput) -> ProjectPayload:
+        """Async version of ProjectClient.create_project"""
+        _validate_create_input(data)
+
+        api_data = {"input": {**data}}
+
+        response = await self._make_request(CREATE_PROJECT.document, api_data)
+        if not response:
+            return response
+
+        return response["data"]["projectCreate"]
+
+    def iter_projects(
+        self,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        filter=None,
+        include_archived=False,
+        stream=False,
+    ):
+        """Async iterator over every project, following pagination cursors"""
+        operation = ITER_PROJECTS.select(fields)
+
+        async def fetch_page(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            response = await self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return response["data"]["projects"]
+
+        async def fetch_stream(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            return await self._stream_nodes(
+                operation.document, variables, ("projects", "nodes")
+            )
+
+        if stream:
+            nodes = astream_pages(fetch_stream)
+        else:
+            nodes = apaginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "Project")
@@ -1,49 +1,293 @@
-from ..base import BaseClient
-from ..types import Team, TeamConnection
+from __future__ import annotations
 
+from typing import TYPE_CHECKING
 
-class TeamClient(BaseClient):
-    def get_teams(self) -> TeamConnection:
-        query = """
-        query GetTeams {
-            teams {
-                nodes {
-                    id
-                    name
-                }
-            }
+from ..base import AsyncBaseClient, BaseClient
+from ..operations import Operation
+from ..pagination import (
+    DEFAULT_PAGE_SIZE,
+    apaginate,
+    astream_pages,
+    page_variables,
+    paginate,
+    stream_pages,
+)
+
+if TYPE_CHECKING:
+    from ..types import Team, TeamConnection, User
+
+GET_TEAMS = Operation(
+    "query",
+    "GetTeams",
+    "teams",
+    selection="""
+        nodes {
+            id
+            name
         }
-        """
+    """,
+    fields_type="Team",
+    fields_path=("nodes",),
+)
 
-        response = self._make_request(query)
-        if not response:
-            return response
+GET_TEAM = Operation(
+    "query",
+    "GetTeam",
+    "team",
+    variables={"teamId": "String!"},
+    arguments={"id": "teamId"},
+    selection="""
+        id
+        name
+        members {
+            nodes {
+                id
+                email
+                name
+            }
+        }
+    """,
+    fields_type="Team",
+)
 
-        return response["data"]["teams"]
+ITER_TEAMS = Operation(
+    "query",
+    "IterTeams",
+    "teams",
+    variables={
+        "first": "Int!",
+        "after": "String",
+        "filter": "TeamFilter",
+        "includeArchived": "Boolean",
+    },
+    arguments={
+        "first": "first",
+        "after": "after",
+        "filter": "filter",
+        "includeArchived": "includeArchived",
+    },
+    selection="""
+        nodes {
+            id
+            name
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    """,
+    fields_type="Team",
+    fields_path=("nodes",),
+)
 
-    def get_team(self, team_id) -> Team:
-        query = """
-        query GetTeam($teamId: String!) {
-            team(id: $teamId) {
+ITER_TEAM_MEMBERS = Operation(
+    "query",
+    "IterTeamMembers",
+    "team",
+    variables={"teamId": "String!", "first": "Int!", "after": "String"},
+    arguments={"id": "teamId"},
+    selection="""
+        members(first: $first, after: $after) {
+            nodes {
                 id
+                email
                 name
-                members {
-                    nodes {
-                        id
-                        email
-                        name
-                    }
-                }
             }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    """,
+    fields_type="User",
+    fields_path=("members", "nodes"),
+)
+
+
+def _members_connection(response):
+    team = response["data"]["team"]
+    if team is None:
+        return {"nodes": []}
+    return team["members"]
+
+
+class TeamClient(BaseClient):
+    def get_teams(self, fields=None) -> TeamConnection:
+        operation = GET_TEAMS.select(fields)
+
+        response = self._make_request(operation.document)
+        if not response:
+            return response
+
+        return self._decode(response["data"]["teams"], "TeamConnection")
+
+    def get_team(self, team_id, fields=None) -> Team:
+        operation = GET_TEAM.select(fields)
+
+        if self.coalesce_window is not None:
+            return self._decode(self._load(operation, team_id), "Team")
+
+        variables = {
+            "teamId": team_id,
         }
-        """
+
+        response = self._make_request(
+            operation.document, variables, cache_tags=(f"team:{team_id}",)
+        )
+        if not response:
+            return response
+
+        return self._decode(response["data"]["team"], "Team")
+
+    def iter_teams(
+        self,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        filter=None,
+        include_archived=False,
+        stream=False,
+    ):
+        """Lazily iterate over every team, following pagination cursors"""
+        operation = ITER_TEAMS.select(fields)
+
+        def fetch_page(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            response = self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return response["data"]["teams"]
+
+        def fetch_stream(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            return self._stream_nodes(operation.document, variables, ("teams", "nodes"))
+
+        if stream:
+            nodes = stream_pages(fetch_stream)
+        else:
+            nodes = paginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "Team")
+
+    def iter_team_members(
+        self,
+        team_id,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        stream=False,
+    ):
+        """Lazily iterate over a team's members, following pagination cursors"""
+        operation = ITER_TEAM_MEMBERS.select(fields)
+
+        def fetch_page(after):
+            variables = {"teamId": team_id, "first": page_size, "after": after}
+            response = self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return _members_connection(response)
+
+        def fetch_stream(after):
+            variables = {"teamId": team_id, "first": page_size, "after": after}
+            return self._stream_nodes(
+                operation.document, variables, ("team", "members", "nodes")
+            )
+
+        if stream:
+            nodes = stream_pages(fetch_stream)
+        else:
+            nodes = paginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "User")
+
+
+class AsyncTeamClient(AsyncBaseClient):
+    async def get_teams(self, fields=None) -> TeamConnection:
+        operation = GET_TEAMS.select(fields)
+
+        response = await self._make_request(operation.document)
+        if not response:
+            return response
+
+        return self._decode(response["data"]["teams"], "TeamConnection")
+
+    async def get_team(self, team_id, fields=None) -> Team:
+        operation = GET_TEAM.select(fields)
+
+        if self.coalesce_window is not None:
+            return self._decode(await self._load(operation, team_id), "Team")
 
         variables = {
             "teamId": team_id,
         }
 
-        response = self._make_request(query, variables)
+        response = await self._make_request(
+            operation.document, variables, cache_tags=(f"team:{team_id}",)
+        )
         if not response:
             return response
 
-        return response["data"]["team"]
+        return self._decode(response["data"]["team"], "Team")
+
+    def iter_teams(
+        self,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        filter=None,
+        include_archived=False,
+        stream=False,
+    ):
+        """Async iterator over every team, following pagination cursors"""
+        operation = ITER_TEAMS.select(fields)
+
+        async def fetch_page(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            response = await self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return response["data"]["teams"]
+
+        async def fetch_stream(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            return await self._stream_nodes(
+                operation.document, variables, ("teams", "nodes")
+            )
+
+        if stream:
+            nodes = astream_pages(fetch_stream)
+        else:
+            nodes = apaginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "Team")
+
+    def iter_team_members(
+        self,
+        team_id,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        stream=False,
+    ):
+        """Async iterator over a team's members, following pagination cursors"""
+        operation = ITER_TEAM_MEMBERS.select(fields)
+
+        async def fetch_page(after):
+            variables = {"teamId": team_id, "first": page_size, "after": after}
+            response = await self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return _members_connection(response)
+
+        async def fetch_stream(after):
+            variables = {"teamId": team_id, "first": page_size, "after": after}
+            return await self._stream_nodes(
+                operation.document, variables, ("team", "members", "nodes")
+            )
+
+        if stream:
+            nodes = astream_pages(fetch_stream)
+        else:
+            nodes = apaginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "User")
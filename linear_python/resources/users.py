@@ -1,60 +1,229 @@
-from ..base import BaseClient
-from ..types import User, UserConnection
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..base import AsyncBaseClient, BaseClient
+from ..operations import Operation
+from ..pagination import (
+    DEFAULT_PAGE_SIZE,
+    apaginate,
+    astream_pages,
+    page_variables,
+    paginate,
+    stream_pages,
+)
+
+if TYPE_CHECKING:
+    from ..types import User, UserConnection
+
+GET_USER = Operation(
+    "query",
+    "GetUser",
+    "user",
+    variables={"id": "String!"},
+    arguments={"id": "id"},
+    selection="""
+        id
+        name
+        email
+    """,
+    fields_type="User",
+)
+
+GET_USERS = Operation(
+    "query",
+    "GetUsers",
+    "users",
+    selection="""
+        nodes {
+            id
+            name
+            email
+        }
+    """,
+    fields_type="User",
+    fields_path=("nodes",),
+)
+
+ITER_USERS = Operation(
+    "query",
+    "IterUsers",
+    "users",
+    variables={
+        "first": "Int!",
+        "after": "String",
+        "filter": "UserFilter",
+        "includeArchived": "Boolean",
+    },
+    arguments={
+        "first": "first",
+        "after": "after",
+        "filter": "filter",
+        "includeArchived": "includeArchived",
+    },
+    selection="""
+        nodes {
+            id
+            name
+            email
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    """,
+    fields_type="User",
+    fields_path=("nodes",),
+)
+
+GET_VIEWER = Operation(
+    "query",
+    "Me",
+    "viewer",
+    selection="""
+        id
+        name
+        email
+    """,
+    fields_type="User",
+)
 
 
 class UserClient(BaseClient):
-    def get_user(self, user_id: str) -> User:
+    def get_user(self, user_id: str, fields=None) -> User:
         """Get a specific user by ID"""
-        query = """
-        query GetUser($id: String!) {
-            user(id: $id) {
-                id
-                name
-                email
-            }
-        }
-        """
+        operation = GET_USER.select(fields)
+
+        if self.coalesce_window is not None:
+            return self._decode(self._load(operation, user_id), "User")
 
         variables = {"id": user_id}
 
-        response = self._make_request(query, variables)
+        response = self._make_request(
+            operation.document, variables, cache_tags=(f"user:{user_id}",)
+        )
         if not response:
             return response
 
-        return response["data"]["user"]
+        return self._decode(response["data"]["user"], "User")
 
-    def get_users(self) -> UserConnection:
+    def get_users(self, fields=None) -> UserConnection:
         """Get all users"""
-        query = """
-        query GetUsers {
-            users {
-                nodes {
-                    id
-                    name
-                    email
-                }
-            }
-        }
-        """
-        response = self._make_request(query)
+        operation = GET_USERS.select(fields)
+
+        response = self._make_request(operation.document)
         if not response:
             return response
 
-        return response["data"]["users"]
+        return self._decode(response["data"]["users"], "UserConnection")
+
+    def iter_users(
+        self,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        filter=None,
+        include_archived=False,
+        stream=False,
+    ):
+        """Lazily iterate over every user, following pagination cursors"""
+        operation = ITER_USERS.select(fields)
+
+        def fetch_page(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            response = self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return response["data"]["users"]
+
+        def fetch_stream(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            return self._stream_nodes(operation.document, variables, ("users", "nodes"))
 
-    def get_viewer(self) -> User:
+        if stream:
+            nodes = stream_pages(fetch_stream)
+        else:
+            nodes = paginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "User")
+
+    def get_viewer(self, fields=None) -> User:
         """Get the currently authenticated user"""
-        query = """
-        query Me {
-            viewer {
-                id
-                name
-                email
-            }
-        }
-        """
-        response = self._make_request(query)
+        operation = GET_VIEWER.select(fields)
+
+        response = self._make_request(operation.document)
+        if not response:
+            return response
+
+        return self._decode(response["data"]["viewer"], "User")
+
+
+class AsyncUserClient(AsyncBaseClient):
+    async def get_user(self, user_id: str, fields=None) -> User:
+        """Get a specific user by ID"""
+        operation = GET_USER.select(fields)
+
+        if self.coalesce_window is not None:
+            return self._decode(await self._load(operation, user_id), "User")
+
+        variables = {"id": user_id}
+
+        response = await self._make_request(
+            operation.document, variables, cache_tags=(f"user:{user_id}",)
+        )
+        if not response:
+            return response
+
+        return self._decode(response["data"]["user"], "User")
+
+    async def get_users(self, fields=None) -> UserConnection:
+        """Get all users"""
+        operation = GET_USERS.select(fields)
+
+        response = await self._make_request(operation.document)
+        if not response:
+            return response
+
+        return self._decode(response["data"]["users"], "UserConnection")
+
+    def iter_users(
+        self,
+        page_size=DEFAULT_PAGE_SIZE,
+        prefetch=False,
+        fields=None,
+        filter=None,
+        include_archived=False,
+        stream=False,
+    ):
+        """Async iterator over every user, following pagination cursors"""
+        operation = ITER_USERS.select(fields)
+
+        async def fetch_page(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            response = await self._make_request(operation.document, variables)
+            if not response:
+                return response
+
+            return response["data"]["users"]
+
+        async def fetch_stream(after):
+            variables = page_variables(page_size, after, filter, include_archived)
+            return await self._stream_nodes(
+                operation.document, variables, ("users", "nodes")
+            )
+
+        if stream:
+            nodes = astream_pages(fetch_stream)
+        else:
+            nodes = apaginate(fetch_page, prefetch=prefetch)
+        return self._decode_nodes(nodes, "User")
+
+    async def get_viewer(self, fields=None) -> User:
+        """Get the currently authenticated user"""
+        operation = GET_VIEWER.select(fields)
+
+        response = await self._make_request(operation.document)
         if not response:
             return response
 
-        return response["data"]["viewer"]
+        return self._decode(response["data"]["viewer"], "User")
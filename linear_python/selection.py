@@ -0,0 +1,137 @@
+import re
+from functools import lru_cache
+
+_WHITESPACE = re.compile(r"\s+")
+_CONNECTION_FIELDS = {"nodes", "pageInfo", "edges"}
+
+
+def normalize_fields(fields):
+    """
+    Turn a `fields=` argument into a canonical selection string.
+
+    Accepts a selection string ("id state { name }"), an iterable of such
+    strings (["id", "state { name }"]) or a dict mapping field names to
+    True or a nested selection ({"id": True, "state": ["name"]}).
+    """
+    if isinstance(fields, str):
+        text = fields
+    elif isinstance(fields, dict):
+        text = " ".join(_from_dict_item(name, sub) for name, sub in fields.items())
+    else:
+        text = " ".join(
+            normalize_fields(field) if isinstance(field, dict) else field
+            for field in fields
+        )
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _from_dict_item(name, sub):
+    if sub is True or sub is None:
+        return name
+    return f"{name} {{ {normalize_fields(sub)} }}"
+
+
+def resolve_type(type_):
+    """
+    A type from linear_python.types, given either as the type or by name.
+    Operations name their types so strawberry is only imported when a
+    selection or a model is actually built.
+    """
+    if isinstance(type_, str):
+        from . import types
+
+        return getattr(types, type_)
+    return type_
+
+
+def _unwrap(type_):
+    while hasattr(type_, "of_type"):
+        type_ = type_.of_type
+    return type_
+
+
+@lru_cache(maxsize=None)
+def _fields_of(type_):
+    definition = getattr(type_, "__strawberry_definition__", None)
+    if definition is None:
+        return None
+    return {
+        field.graphql_name or field.python_name: _unwrap(field.type)
+        for field in definition.fields
+    }
+
+
+def _parse_selection(text):
+    from graphql import parse
+
+    return parse(f"{{ {text} }}").definitions[0].selection_set
+
+
+def _print_selection(selection_set):
+    from graphql import print_ast
+
+    text = print_ast(selection_set).strip()
+    return _WHITESPACE.sub(" ", text[1:-1]).strip()
+
+
+def _render(type_, selection_set):
+    from graphql import print_ast
+    from graphql.language import FieldNode
+
+    fields = _fields_of(type_)
+    parts = []
+    for node in selection_set.selections:
+        if not isinstance(node, FieldNode):
+            raise ValueError("fields= does not support fragments")
+
+        name = node.name.value
+        if name not in fields:
+            raise ValueError(f"{type_.__name__} has no field '{name}'")
+
+        head = f"{node.alias.value}: {name}" if node.alias else name
+        if node.arguments:
+            head += f"({', '.join(print_ast(arg) for arg in node.arguments)})"
+        field_type = fields[name]
+        sub_fields = _fields_of(field_type)
+        if sub_fields is None:
+            if node.selection_set is not None:
+                raise ValueError(f"{type_.__name__}.{name} has no sub-fields")
+            parts.append(head)
+            continue
+
+        if node.selection_set is None:
+            if "id" not in sub_fields:
+                raise ValueError(f"{type_.__name__}.{name} needs a sub-selection")
+            sub = "id"
+        elif "nodes" in sub_fields and not any(
+            child.name.value in _CONNECTION_FIELDS
+            for child in node.selection_set.selections
+        ):
+            # Shorthand for connections: `labels { name }` selects node fields
+            sub = f"nodes {{ {_render(sub_fields['nodes'], node.selection_set)} }}"
+        else:
+            sub = _render(field_type, node.selection_set)
+        parts.append(f"{head} {{ {sub} }}")
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=256)
+def build_selection(type_, fields):
+    """Validate a normalized selection against a strawberry type and render it."""
+    return _render(resolve_type(type_), _parse_selection(fields))
+
+
+def replace_selection(selection, path, replacement):
+    """Return `selection` with the sub-selection at `path` set to `replacement`."""
+    if not path:
+        return replacement
+
+    selection_set = _parse_selection(selection)
+    root = selection_set
+    for name in path:
+        node = next(
+            child for child in selection_set.selections if child.name.value == name
+        )
+        selection_set = node.selection_set
+    node.selection_set = _parse_selection(replacement)
+    return _print_selection(root)
@@ -0,0 +1,231 @@
+import codecs
+import json
+
+from .errors import LinearAPIError
+
+CHUNK_SIZE = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _Incomplete(Exception):
+    """The next JSON token continues in a chunk that hasn't arrived yet."""
+
+
+class _Frame:
+    __slots__ = ("value", "depth", "state", "key")
+
+    def __init__(self, value, depth, state):
+        self.value = value
+        self.depth = depth
+        self.state = state
+        self.key = None
+
+
+class NodeParser:
+    """
+    Incremental parser for a GraphQL response body that yields the items
+    of the array at `path` (e.g. ("data", "users", "nodes")) as soon as
+    each one is decoded.
+
+    Objects along `path` are walked key by key and the target array item
+    by item; every other value (pageInfo, errors, ...) is decoded whole
+    into `document`, where the target array is left empty.
+    """
+
+    def __init__(self, path):
+        self.path = tuple(path)
+        self.document = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._final = False
+        self._stack = []
+        self._done = False
+
+    def feed(self, chunk):
+        """Add raw bytes from the response; returns the items completed by them."""
+        self._text = self._text[self._pos :] + self._decoder.decode(chunk)
+        self._pos = 0
+        return self._parse()
+
+    def close(self):
+        """Signal the end of the body; returns any remaining items."""
+        self._text = self._text[self._pos :] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._final = True
+        nodes = self._parse()
+        if not self._done:
+            raise ValueError("truncated JSON response")
+        return nodes
+
+    def _decode(self, pos):
+        try:
+            value, end = _DECODER.raw_decode(self._text, pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            raise _Incomplete
+        # A number at the end of the buffer may continue in the next chunk
+        if end == len(self._text) and not self._final:
+            raise _Incomplete
+        return value, end
+
+    def _parse(self):
+        nodes = []
+        text = self._text
+        pos = self._pos
+        last = len(self.path) - 1
+        try:
+            while True:
+                while pos < len(text) and text[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == len(text):
+                    break
+                char = text[pos]
+                if self._done:
+                    raise ValueError("unexpected data after JSON response")
+
+                if not self._stack:
+                    if char != "{":
+                        raise ValueError("expected a JSON object")
+                    self.document = {}
+                    self._stack.append(_Frame(self.document, 0, "key"))
+                    pos += 1
+                    continue
+
+                frame = self._stack[-1]
+                if isinstance(frame.value, list):
+                    if frame.state == "item" and char != "]":
+                        node, pos = self._decode(pos)
+                        nodes.append(node)
+                        frame.state = "next"
+                    elif char == "]":
+                        self._stack.pop()
+                        pos += 1
+                    elif char == ",":
+                        frame.state = "item"
+                        pos += 1
+                    else:
+                        raise ValueError(f"unexpected {char!r} in array")
+                    continue
+
+                if frame.state == "key":
+                    if char == "}":
+                        self._pop()
+                        pos += 1
+                    else:
+                        frame.key, pos = self._decode(pos)
+                        frame.state = "colon"
+                elif frame.state == "colon":
+                    if char != ":":
+                        raise ValueError(f"expected ':' but found {char!r}")
+                    frame.state = "value"
+                    pos += 1
+                elif frame.state == "value":
+                    on_path = frame.key == self.path[frame.depth]
+                    if on_path and frame.depth < last and char == "{":
+                        child = frame.value[frame.key] = {}
+                        self._stack.append(_Frame(child, frame.depth + 1, "key"))
+                        pos += 1
+                    elif on_path and frame.depth == last and char == "[":
+                        items = frame.value[frame.key] = []
+                        self._stack.append(_Frame(items, frame.depth + 1, "item"))
+                        pos += 1
+                    else:
+                        frame.value[frame.key], pos = self._decode(pos)
+                    frame.state = "next"
+                elif char == ",":
+                    frame.state = "key"
+                    pos += 1
+                elif char == "}":
+                    self._pop()
+                    pos += 1
+                else:
+                    raise ValueError(f"unexpected {char!r} in object")
+        except _Incomplete:
+            pass
+        self._pos = pos
+        return nodes
+
+    def _pop(self):
+        self._stack.pop()
+        if not self._stack:
+            self._done = True
+
+
+def _raise_for_errors(document):
+    errors = (document or {}).get("errors")
+    if errors:
+        messages = "; ".join(str(error.get("message", error)) for error in errors)
+        raise LinearAPIError(f"GraphQL errors: {messages}")
+
+
+def _walk(document, path):
+    for key in path:
+        if not isinstance(document, dict):
+            return None
+        document = document.get(key)
+    return document
+
+
+def iter_chunks(response, chunk_size=CHUNK_SIZE):
+    """Raw body chunks of a streamed requests or httpx response."""
+    if hasattr(response, "iter_content"):
+        return response.iter_content(chunk_size)
+    return response.iter_bytes(chunk_size)
+
+
+class NodeStream:
+    """
+    Iterable over the nodes of a streamed connection. GraphQL errors are
+    raised as LinearAPIError, even when they follow the data. Once
+    exhausted, `connection` holds the rest of the connection (pageInfo).
+    """
+
+    def __init__(self, chunks, path, close=None):
+        self.path = tuple(path)
+        self.document = None
+        self._chunks = chunks
+        self._close = close
+
+    @property
+    def connection(self):
+        return _walk(self.document, self.path[:-1])
+
+    def __iter__(self):
+        parser = NodeParser(self.path)
+        try:
+            for chunk in self._chunks:
+                yield from parser.feed(chunk)
+                _raise_for_errors(parser.document)
+            yield from parser.close()
+            _raise_for_errors(parser.document)
+        finally:
+            self.document = parser.document
+            if self._close is not None:
+                self._close()
+
+
+class AsyncNodeStream(NodeStream):
+    """NodeStream over an async iterator of chunks; use with `async for`."""
+
+    def __init__(self, chunks, path, aclose=None):
+        super().__init__(chunks, path)
+        self._aclose = aclose
+
+    async def __aiter__(self):
+        parser = NodeParser(self.path)
+        try:
+            async for chunk in self._chunks:
+                for node in parser.feed(chunk):
+                    yield node
+                _raise_for_errors(parser.document)
+            for node in parser.close():
+                yield node
+            _raise_for_errors(parser.document)
+        finally:
+            self.document = parser.document
+            if self._aclose is not None:
+                await self._aclose()
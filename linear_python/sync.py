@@ -0,0 +1,239 @@
+import json
+import sqlite3
+import threading
+
+from .models import as_dict
+
+ENTITY_KINDS = ("team", "user", "project", "issue")
+
+# Linear accepts up to 250 nodes per page; larger pages mean fewer round trips
+DEFAULT_SYNC_PAGE_SIZE = 250
+
+SYNC_FIELDS = {
+    "team": "id key name createdAt updatedAt archivedAt",
+    "user": "id name email url createdAt updatedAt archivedAt",
+    "project": "id name description url createdAt updatedAt archivedAt",
+    "issue": """
+        id
+        identifier
+        title
+        description
+        priority
+        priorityLabel
+        dueDate
+        url
+        state { id name type }
+        team { id key }
+        assignee { id }
+        creator { id }
+        project { id }
+        labels { id name }
+        createdAt
+        updatedAt
+        archivedAt
+    """,
+}
+
+
+class MemoryStore:
+    """Entities held in per-kind dicts; reads never leave the process."""
+
+    def __init__(self):
+        self._entities = {kind: {} for kind in ENTITY_KINDS}
+        self._watermarks = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind, entity_id):
+        return self._entities[kind].get(entity_id)
+
+    def all(self, kind):
+        return list(self._entities[kind].values())
+
+    def put(self, kind, nodes):
+        with self._lock:
+            entities = self._entities[kind]
+            for node in nodes:
+                entities[node["id"]] = node
+
+    def delete(self, kind, entity_ids):
+        with self._lock:
+            for entity_id in entity_ids:
+                self._entities[kind].pop(entity_id, None)
+
+    def watermark(self, kind):
+        return self._watermarks.get(kind)
+
+    def set_watermark(self, kind, value):
+        self._watermarks[kind] = value
+
+    def clear(self):
+        with self._lock:
+            for entities in self._entities.values():
+                entities.clear()
+            self._watermarks.clear()
+
+
+class SQLiteStore:
+    """Entities persisted in a sqlite file, so a mirror survives restarts."""
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entities "
+                "(kind TEXT, id TEXT, data TEXT, PRIMARY KEY (kind, id))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks (kind TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def get(self, kind, entity_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entities WHERE kind = ? AND id = ?", (kind, entity_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def all(self, kind):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM entities WHERE kind = ?", (kind,)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def put(self, kind, nodes):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?)",
+                [(kind, node["id"], json.dumps(node)) for node in nodes],
+            )
+
+    def delete(self, kind, entity_ids):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM entities WHERE kind = ? AND id = ?",
+                [(kind, entity_id) for entity_id in entity_ids],
+            )
+
+    def watermark(self, kind):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM watermarks WHERE kind = ?", (kind,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, kind, value):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?)", (kind, value)
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entities")
+            self._conn.execute("DELETE FROM watermarks")
+
+
+class SyncEngine:
+    """
+    Local mirror of a workspace's teams, users, projects and issues.
+
+    The first `sync()` loads every entity; later calls fetch only entities
+    whose `updatedAt` is at or after the newest one already stored, and
+    drop archived ones. Reads (`get`, `all`) are served from the store.
+    """
+
+    def __init__(
+        self,
+        client,
+        store=None,
+        kinds=ENTITY_KINDS,
+        page_size=DEFAULT_SYNC_PAGE_SIZE,
+    ):
+        self.client = client
+        self.store = store if store is not None else MemoryStore()
+        self.kinds = tuple(kinds)
+        self.page_size = page_size
+
+    def _iterate(self, kind):
+        watermark = self.store.watermark(kind)
+        # `gte` re-reads entities sharing the watermark's timestamp instead
+        # of missing ones updated in the same millisecond
+        return getattr(self.client, f"iter_{kind}s")(
+            page_size=self.page_size,
+            fields=SYNC_FIELDS[kind],
+            filter={"updatedAt": {"gte": watermark}} if watermark else None,
+            include_archived=watermark is not None,
+        )
+
+    def _finish(self, kind, newest):
+        # Pages aren't ordered by updatedAt, so the watermark only moves once
+        # every page of the kind has been applied
+        watermark = self.store.watermark(kind)
+        if newest is not None and (watermark is None or newest > watermark):
+            self.store.set_watermark(kind, newest)
+
+    def sync(self):
+        """Pull changes for every kind; returns the number of entities applied."""
+        counts = {}
+        for kind in self.kinds:
+            counts[kind] = 0
+            newest = None
+            page = []
+            for node in self._iterate(kind):
+                node = as_dict(node)
+                page.append(node)
+                if newest is None or node["updatedAt"] > newest:
+                    newest = node["updatedAt"]
+                if len(page) == self.page_size:
+                    self.apply(kind, page)
+                    counts[kind] += len(page)
+                    page = []
+            self.apply(kind, page)
+            counts[kind] += len(page)
+            self._finish(kind, newest)
+        return counts
+
+    def apply(self, kind, nodes):
+        """Upsert `nodes` into the mirror; archived ones are removed."""
+        if isinstance(nodes, dict):
+            nodes = [nodes]
+        archived = [node["id"] for node in nodes if node.get("archivedAt")]
+        self.store.put(kind, [node for node in nodes if not node.get("archivedAt")])
+        if archived:
+            self.store.delete(kind, archived)
+
+    def remove(self, kind, entity_id):
+        self.store.delete(kind, [entity_id])
+
+    def get(self, kind, entity_id):
+        return self.store.get(kind, entity_id)
+
+    def all(self, kind):
+        return self.store.all(kind)
+
+
+class AsyncSyncEngine(SyncEngine):
+    """SyncEngine driven by an AsyncLinearClient; `sync()` is a coroutine."""
+
+    async def sync(self):
+        counts = {}
+        for kind in self.kinds:
+            counts[kind] = 0
+            newest = None
+            page = []
+            async for node in self._iterate(kind):
+                node = as_dict(node)
+                page.append(node)
+                if newest is None or node["updatedAt"] > newest:
+                    newest = node["updatedAt"]
+                if len(page) == self.page_size:
+                    self.apply(kind, page)
+                    counts[kind] += len(page)
+                    page = []
+            self.apply(kind, page)
+            counts[kind] += len(page)
+            self._finish(kind, newest)
+        return counts
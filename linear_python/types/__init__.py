@@ -1,25 +1,80 @@
-from .issue import (
-    Issue,
-    IssueArchivePayload,
-    IssueCreateInput,
-    IssuePayload,
-    IssueUpdateInput,
-)
-from .project import Project, ProjectCreateInput, ProjectPayload
-from .team import Team, TeamConnection
-from .user import User, UserConnection
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .issue import (
+        Issue,
+        IssueArchivePayload,
+        IssueConnection,
+        IssueCreateInput,
+        IssuePayload,
+        IssueUpdateInput,
+    )
+    from .issue_label import IssueLabel, IssueLabelConnection
+    from .page_info import PageInfo
+    from .project import (
+        Project,
+        ProjectConnection,
+        ProjectCreateInput,
+        ProjectPayload,
+    )
+    from .team import Team, TeamConnection
+    from .user import User, UserConnection
+    from .workflow_state import WorkflowState
+
+# Type name -> submodule; importing a type imports strawberry, so it's
+# deferred until a type is first used
+_EXPORTS = {
+    "Issue": "issue",
+    "IssueArchivePayload": "issue",
+    "IssueConnection": "issue",
+    "IssueCreateInput": "issue",
+    "IssuePayload": "issue",
+    "IssueUpdateInput": "issue",
+    "IssueLabel": "issue_label",
+    "IssueLabelConnection": "issue_label",
+    "PageInfo": "page_info",
+    "Project": "project",
+    "ProjectConnection": "project",
+    "ProjectCreateInput": "project",
+    "ProjectPayload": "project",
+    "Team": "team",
+    "TeamConnection": "team",
+    "User": "user",
+    "UserConnection": "user",
+    "WorkflowState": "workflow_state",
+}
 
 __all__ = [
     "Issue",
     "IssueArchivePayload",
+    "IssueConnection",
     "IssueCreateInput",
+    "IssueLabel",
+    "IssueLabelConnection",
     "IssuePayload",
     "IssueUpdateInput",
+    "PageInfo",
     "Project",
+    "ProjectConnection",
     "ProjectCreateInput",
     "ProjectPayload",
     "Team",
     "TeamConnection",
     "User",
     "UserConnection",
+    "WorkflowState",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
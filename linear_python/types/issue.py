@@ -1,15 +1,42 @@
-from typing import Optional
+from typing import List, Optional
 
 import strawberry
 
+from .issue_label import IssueLabelConnection
+from .page_info import PageInfo
+from .project import Project
+from .team import Team
+from .user import User
+from .workflow_state import WorkflowState
+
 
 @strawberry.type
 class Issue:
     id: strawberry.ID
+    archivedAt: Optional[str]
+    assignee: Optional[User]
+    createdAt: str
+    creator: Optional[User]
+    description: Optional[str]
+    dueDate: Optional[str]
+    identifier: str
+    labels: IssueLabelConnection
+    priority: float
+    priorityLabel: str
+    project: Optional[Project]
+    state: WorkflowState
+    team: Team
     title: str
+    updatedAt: str
     url: str
 
 
+@strawberry.type
+class IssueConnection:
+    nodes: List[Issue]
+    pageInfo: PageInfo
+
+
 @strawberry.type
 class IssueArchivePayload:
     entity: Issue
@@ -0,0 +1,18 @@
+from typing import List
+
+import strawberry
+
+from .page_info import PageInfo
+
+
+@strawberry.type
+class IssueLabel:
+    id: strawberry.ID
+    color: str
+    name: str
+
+
+@strawberry.type
+class IssueLabelConnection:
+    nodes: List[IssueLabel]
+    pageInfo: PageInfo
@@ -0,0 +1,11 @@
+from typing import Optional
+
+import strawberry
+
+
+@strawberry.type
+class PageInfo:
+    endCursor: Optional[str]
+    hasNextPage: bool
+    hasPreviousPage: bool
+    startCursor: Optional[str]
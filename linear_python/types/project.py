@@ -1,16 +1,27 @@
-from typing import Optional
+from typing import List, Optional
 
 import strawberry
 
+from .page_info import PageInfo
+
 
 @strawberry.type
 class Project:
     id: strawberry.ID
+    archivedAt: Optional[str]
+    createdAt: str
     description: str
     name: str
+    updatedAt: str
     url: str
 
 
+@strawberry.type
+class ProjectConnection:
+    nodes: List[Project]
+    pageInfo: PageInfo
+
+
 @strawberry.type
 class ProjectCreateInput:
     description: Optional[str]
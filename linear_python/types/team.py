@@ -1,17 +1,23 @@
-from typing import List
+from typing import List, Optional
 
 import strawberry
 
+from .page_info import PageInfo
 from .user import UserConnection
 
 
 @strawberry.type
 class Team:
     id: strawberry.ID
+    archivedAt: Optional[str]
+    createdAt: str
+    key: str
     name: str
     members: UserConnection
+    updatedAt: str
 
 
 @strawberry.type
 class TeamConnection:
     nodes: List[Team]
+    pageInfo: PageInfo
@@ -1,16 +1,22 @@
 from typing import List, Optional
 import strawberry
 
+from .page_info import PageInfo
+
 
 @strawberry.type
 class User:
+    archivedAt: Optional[str]
+    createdAt: str
     email: str
     id: strawberry.ID
     isMe: bool
     name: str 
+    updatedAt: str
     url: str
 
 
 @strawberry.type
 class UserConnection:
-    nodes: List[User]
\ No newline at end of file
+    nodes: List[User]
+    pageInfo: PageInfo
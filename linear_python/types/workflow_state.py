@@ -0,0 +1,10 @@
+import strawberry
+
+
+@strawberry.type
+class WorkflowState:
+    id: strawberry.ID
+    color: str
+    name: str
+    position: float
+    type: str
@@ -0,0 +1,205 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+
+from .selection import resolve_type
+
+SIGNATURE_HEADER = "Linear-Signature"
+
+# Reject deliveries whose webhookTimestamp is older than this, to stop replays
+DEFAULT_MAX_AGE = 60
+
+# Webhook `type` -> (mirror/cache kind, name of the type describing `data`)
+ENTITY_TYPES = {
+    "Issue": ("issue", "Issue"),
+    "Project": ("project", "Project"),
+    "Team": ("team", "Team"),
+    "User": ("user", "User"),
+}
+
+
+def verify_signature(body, signature, secret):
+    """Check the hex HMAC-SHA256 of the raw body that Linear signs deliveries with."""
+    if not signature:
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def _normalize(data):
+    """
+    Reshape webhook data like query results: `teamId` becomes `team: {id}`
+    (when no nested object is sent) and label lists become connections.
+    """
+    node = dict(data)
+    for key, value in data.items():
+        if key.endswith("Id") and key != "lastSyncId":
+            field = key[:-2]
+            if field not in node:
+                node[field] = {"id": value} if value is not None else None
+    if isinstance(node.get("labels"), list):
+        node["labels"] = {"nodes": node["labels"]}
+    return node
+
+
+class WebhookEvent:
+    __slots__ = ("action", "type", "data", "url", "created_at", "timestamp")
+
+    def __init__(self, payload):
+        self.action = payload.get("action")
+        self.type = payload.get("type")
+        self.data = payload.get("data") or {}
+        self.url = payload.get("url")
+        self.created_at = payload.get("createdAt")
+        self.timestamp = payload.get("webhookTimestamp")
+
+    @property
+    def kind(self):
+        """Mirror kind ("issue", "user", ...), or None for other event types."""
+        entity = ENTITY_TYPES.get(self.type)
+        return entity[0] if entity else None
+
+    @property
+    def entity_type(self):
+        """The type from linear_python.types describing `entity`, if any."""
+        entity = ENTITY_TYPES.get(self.type)
+        return resolve_type(entity[1]) if entity else None
+
+    @property
+    def entity(self):
+        """The event's entity shaped like the matching query results."""
+        return _normalize(self.data)
+
+    def __repr__(self):
+        return f"WebhookEvent({self.action} {self.type} {self.data.get('id')})"
+
+
+class WebhookReceiver:
+    """
+    ASGI app receiving Linear webhooks, usable directly with uvicorn.
+
+    Deliveries are checked against `secret`. Issue/Project/Team/User events
+    are then applied to `mirror` (a SyncEngine), so reads from the mirror
+    need no re-fetch, and evict the entity from `cache` (a ResponseCache),
+    so the next read through the cache re-fetches it instead of returning
+    stale data.
+    With `queue_size`, every event is also queued for `batches()`.
+    """
+
+    def __init__(
+        self,
+        secret,
+        mirror=None,
+        cache=None,
+        queue_size=0,
+        max_age=DEFAULT_MAX_AGE,
+        path="/webhooks/linear",
+    ):
+        try:
+            from starlette.applications import Starlette
+            from starlette.routing import Route
+        except ImportError as e:
+            raise ImportError(
+                'WebhookReceiver requires starlette: pip install "linear-python[webhooks]"'
+            ) from e
+
+        self.secret = secret
+        self.mirror = mirror
+        self.cache = cache
+        self.max_age = max_age
+        self.queue_size = queue_size
+        self._queue = None
+        self.app = Starlette(routes=[Route(path, self._receive, methods=["POST"])])
+
+    async def __call__(self, scope, receive, send):
+        await self.app(scope, receive, send)
+
+    @property
+    def queue(self):
+        # Created on first use so it binds to the event loop serving requests
+        if self._queue is None and self.queue_size:
+            self._queue = asyncio.Queue(self.queue_size)
+        return self._queue
+
+    def _expired(self, event):
+        if self.max_age is None or event.timestamp is None:
+            return False
+        return abs(time.time() - event.timestamp / 1000) > self.max_age
+
+    async def _receive(self, request):
+        from starlette.responses import Response
+
+        body = await request.body()
+        if not verify_signature(
+            body, request.headers.get(SIGNATURE_HEADER), self.secret
+        ):
+            return Response("invalid signature", status_code=401)
+        try:
+            event = WebhookEvent(json.loads(body))
+        except (ValueError, AttributeError):
+            return Response("invalid payload", status_code=400)
+        if self._expired(event):
+            return Response("stale delivery", status_code=401)
+
+        self.apply(event)
+        if self.queue_size:
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Linear retries failed deliveries, so push back instead of
+                # dropping. The retry is applied again, which apply() skips
+                # if a newer version of the entity has arrived since
+                return Response("queue full", status_code=503)
+        return Response(status_code=200)
+
+    def apply(self, event):
+        """
+        Apply one event to the mirror and cache. An event whose updatedAt
+        is older than the mirrored entity's is not applied to the mirror.
+        """
+        kind = event.kind
+        entity_id = event.data.get("id")
+        if kind is None or entity_id is None:
+            return
+
+        if self.cache is not None:
+            self.cache.invalidate(f"{kind}:{entity_id}")
+        if self.mirror is None:
+            return
+        if event.action == "remove":
+            self.mirror.remove(kind, entity_id)
+        else:
+            current = self.mirror.get(kind, entity_id) or {}
+            # Deliveries can arrive out of order (retries, concurrent
+            # requests); don't let an older version overwrite a newer one.
+            # Linear's timestamps are fixed-width ISO 8601 strings, so they
+            # compare as strings, as in SyncEngine
+            updated_at = event.data.get("updatedAt")
+            stored_at = current.get("updatedAt")
+            if updated_at and stored_at and updated_at < stored_at:
+                return
+            self.mirror.apply(kind, {**current, **event.entity})
+
+    async def batches(self, max_size=100, max_wait=1.0):
+        """
+        Yield queued events in lists of up to `max_size`, waiting at most
+        `max_wait` seconds after the first event for a batch to fill.
+        """
+        if not self.queue_size:
+            raise ValueError("batches() needs a WebhookReceiver with queue_size")
+
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + max_wait
+            while len(batch) < max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            yield batch
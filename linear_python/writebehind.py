@@ -0,0 +1,396 @@
+import json
+import sqlite3
+import threading
+import time
+
+from . import registry
+from .codec import response_json
+from .operations import build_batch, split_batch_response
+from .ratelimit import RetryPolicy, is_connect_error, is_rate_limited
+from .resolver import REFERENCE_KEYS
+from .resources.issues import (
+    CREATE_ISSUE,
+    DELETE_ISSUE,
+    UPDATE_ISSUE,
+    _validate_create_input,
+    _validate_update_input,
+)
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_BATCH_SIZE = 50
+# Ceiling for the delay between flushes while requests keep failing
+MAX_BACKOFF = 60.0
+
+_ID_KEYS = {id_key: key for key, id_key in REFERENCE_KEYS.items()}
+
+# The scheduler's rules for when a mutation is safe to send again
+_MUTATION_RETRY = RetryPolicy()
+
+# Result of a call whose request may have reached Linear but got no answer
+# (a 5xx, a read timeout, an unreadable body): it may have been applied
+_UNKNOWN = object()
+
+OUTCOME_UNKNOWN = (
+    "outcome unknown: the request failed after it was sent, so the issue "
+    "may have been created; not sent again to avoid a duplicate"
+)
+
+
+def merge_patch(current, patch):
+    """
+    Fold `patch` into the pending IssueUpdateInput `current`; later values
+    win. A reference (e.g. `state`) replaces its ID field (`stateId`), and
+    the other way round.
+    """
+    merged = dict(current)
+    for key, value in patch.items():
+        counterpart = REFERENCE_KEYS.get(key) or _ID_KEYS.get(key)
+        if counterpart is not None:
+            merged.pop(counterpart, None)
+        merged[key] = value
+    return merged
+
+
+def _rejected_as_a_whole(results):
+    """
+    True if every item failed with errors about the document rather than
+    about one of its aliases (errors without a path). Requests that failed
+    outright are handled as they are instead.
+    """
+    return all(
+        result is not None
+        and result is not _UNKNOWN
+        and not result.get("success")
+        and result.get("errors")
+        and not any(error.get("path") for error in result["errors"])
+        for result in results
+    )
+
+
+class WriteBehindQueue:
+    """
+    Write-behind mode for issue mutations. `create_issue`, `update_issue`
+    and `delete_issue` append to a sqlite journal at `path` and return at
+    once. A background thread sends the journal in aliased batches of up
+    to `batch_size` mutations once `batch_size` operations are waiting or
+    every `flush_interval` seconds.
+
+    Updates to the same issue made before a flush are merged into one
+    mutation, and a delete drops the updates still waiting for its issue.
+    Items Linear rejects are moved to `failed()`.
+
+    Operations are removed from the journal once Linear has answered.
+    Requests that never reached Linear (rate limited, or the connection
+    failed) are retried with backoff. If a request fails after it was sent
+    (a 5xx, a read timeout), Linear may have applied it: updates and
+    deletes are retried, since applying them twice is harmless, but creates
+    are moved to `failed()` as "outcome unknown" rather than risk a
+    duplicate issue. A create is sent twice only if the process dies
+    between sending its batch and recording the answer; opening the same
+    path then replays everything left in the journal.
+    """
+
+    def __init__(
+        self,
+        client,
+        path,
+        batch_size=DEFAULT_BATCH_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+        background=True,
+    ):
+        self.client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = {"queued": 0, "merged": 0, "sent": 0, "requests": 0}
+        self._lock = threading.Lock()
+        # Serializes flushes, so each operation is sent by one flush
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # Journal rows being sent right now; patches are not merged into them
+        self._in_flight = set()
+        self._closed = False
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS operations (seq INTEGER PRIMARY KEY "
+                "AUTOINCREMENT, kind TEXT, issue_id TEXT, data TEXT, created REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS operations_issue ON operations (issue_id)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS failed (seq INTEGER PRIMARY KEY, "
+                "kind TEXT, issue_id TEXT, data TEXT, errors TEXT)"
+            )
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def create_issue(self, data):
+        """Queue an issueCreate; returns the operation's journal sequence number."""
+        if not isinstance(data, dict):
+            raise TypeError("data must be a dictionary")
+        return self._append("create", None, data)
+
+    def update_issue(self, issue_id, data=None):
+        """
+        Queue an issueUpdate, merged into an update for the same issue that
+        hasn't been sent yet if there is one. Returns its sequence number.
+        """
+        _validate_update_input(data)
+        data = data or {}
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT seq, kind, data FROM operations WHERE issue_id = ? "
+                "ORDER BY seq DESC LIMIT 1",
+                (issue_id,),
+            ).fetchone()
+            if row is not None and row[1] == "update" and row[0] not in self._in_flight:
+                seq, _, current = row
+                merged = merge_patch(json.loads(current), data)
+                self._conn.execute(
+                    "UPDATE operations SET data = ? WHERE seq = ?",
+                    (json.dumps(merged), seq),
+                )
+                self.stats["merged"] += 1
+                return seq
+            return self._insert("update", issue_id, data)
+
+    def delete_issue(self, issue_id):
+        """Queue an issueDelete, dropping updates to the issue still waiting."""
+        with self._lock, self._conn:
+            pending = [
+                seq
+                for (seq,) in self._conn.execute(
+                    "SELECT seq FROM operations WHERE issue_id = ? AND kind = 'update'",
+                    (issue_id,),
+                )
+                if seq not in self._in_flight
+            ]
+            self._conn.executemany(
+                "DELETE FROM operations WHERE seq = ?", [(seq,) for seq in pending]
+            )
+            self.stats["merged"] += len(pending)
+            return self._insert("delete", issue_id, {})
+
+    def _append(self, kind, issue_id, data):
+        with self._lock, self._conn:
+            return self._insert(kind, issue_id, data)
+
+    def _insert(self, kind, issue_id, data):
+        # Called with the lock held, inside a transaction
+        cursor = self._conn.execute(
+            "INSERT INTO operations (kind, issue_id, data, created) VALUES (?, ?, ?, ?)",
+            (kind, issue_id, json.dumps(data), time.time()),
+        )
+        self.stats["queued"] += 1
+        if self._pending() >= self.batch_size:
+            self._wakeup.notify()
+        return cursor.lastrowid
+
+    def _pending(self):
+        return self._conn.execute("SELECT COUNT(*) FROM operations").fetchone()[0]
+
+    def pending(self):
+        """Number of operations in the journal, including ones being sent."""
+        with self._lock:
+            return self._pending()
+
+    def failed(self):
+        """Operations Linear rejected, with the errors it returned."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, kind, issue_id, data, errors FROM failed ORDER BY seq"
+            ).fetchall()
+        return [
+            {
+                "seq": seq,
+                "kind": kind,
+                "issue_id": issue_id,
+                "data": json.loads(data),
+                "errors": json.loads(errors),
+            }
+            for seq, kind, issue_id, data, errors in rows
+        ]
+
+    def _take(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, kind, issue_id, data FROM operations ORDER BY seq LIMIT ?",
+                (self.batch_size,),
+            ).fetchall()
+            self._in_flight.update(row[0] for row in rows)
+        return rows
+
+    def _call(self, kind, issue_id, data):
+        """(operation, variables) for one journal row; raises if it's invalid."""
+        if kind == "delete":
+            return DELETE_ISSUE, {"issueId": issue_id}
+        data = self.client._resolve_references(data, issue_id)
+        if kind == "create":
+            _validate_create_input(data)
+            return CREATE_ISSUE, {"input": data}
+        return UPDATE_ISSUE, {"issueId": issue_id, "input": data}
+
+    def _request(self, calls):
+        """
+        Send `calls` as one aliased document. Returns one result per call:
+        None for every call if the request didn't reach Linear, or
+        _UNKNOWN if it may have been applied but brought no answer.
+        """
+        document, variables, aliases = build_batch("FlushIssueWrites", calls)
+        compiled = registry.lookup(document)
+        try:
+            response = self.client._post(compiled, compiled.body(variables))
+        except _MUTATION_RETRY.retry_exceptions as e:
+            return [None if is_connect_error(e) else _UNKNOWN] * len(calls)
+        self.stats["requests"] += 1
+        if _MUTATION_RETRY.should_retry(response, "mutation"):
+            return [None] * len(calls)
+        # A 400 that isn't rate limiting is Linear rejecting the document
+        # itself, e.g. for an unknown input field
+        if response.status_code == 400 and not is_rate_limited(response):
+            try:
+                payload = response_json(response)
+            except ValueError:
+                payload = None
+            if payload and payload.get("errors"):
+                return split_batch_response(
+                    {"data": None, "errors": payload["errors"]}, aliases
+                )
+        if response.status_code != 200:
+            return [_UNKNOWN] * len(calls)
+        try:
+            payload = response_json(response)
+        except ValueError:
+            return [_UNKNOWN] * len(calls)
+        return split_batch_response(payload, aliases)
+
+    def _send_calls(self, calls):
+        """
+        Send `calls`, splitting the batch in halves while Linear rejects it
+        as a whole, so one invalid row fails on its own instead of taking
+        its siblings with it (or blocking the journal).
+        """
+        results = self._request(calls)
+        if len(calls) == 1 or not _rejected_as_a_whole(results):
+            return results
+        middle = len(calls) // 2
+        first = self._send_calls(calls[:middle])
+        if all(result is None or result is _UNKNOWN for result in first):
+            # The request itself failed; leave the second half unsent
+            return first + [None] * (len(calls) - middle)
+        return first + self._send_calls(calls[middle:])
+
+    def _send(self, rows):
+        """
+        Send one batch of journal rows. Returns False if rows were left in
+        the journal for a later attempt.
+        """
+        self.client._load_issue_teams(
+            {
+                issue_id: json.loads(data)
+                for _, kind, issue_id, data in rows
+                if kind == "update"
+            }
+        )
+        calls = []
+        sent = []
+        rejected = []
+        for seq, kind, issue_id, data in rows:
+            try:
+                calls.append(self._call(kind, issue_id, json.loads(data)))
+                sent.append((seq, kind, issue_id, data))
+            except (TypeError, ValueError) as e:
+                rejected.append((seq, kind, issue_id, data, [{"message": str(e)}]))
+
+        results = self._send_calls(calls) if calls else []
+        done = []
+        retry = False
+        for row, result in zip(sent, results):
+            if result is _UNKNOWN and row[1] == "create":
+                rejected.append((*row, [{"message": OUTCOME_UNKNOWN}]))
+            elif result is None or result is _UNKNOWN:
+                retry = True
+            elif result.get("success"):
+                done.append(row[0])
+                if row[2] is not None:
+                    self.client._invalidate(f"issue:{row[2]}")
+            else:
+                rejected.append((*row, result.get("errors") or []))
+        self._finish(done, rejected)
+        self.stats["sent"] += len(done)
+        return not retry
+
+    def _finish(self, done, rejected):
+        """Drop sent rows from the journal and move rejected ones to `failed`."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO failed VALUES (?, ?, ?, ?, ?)",
+                [
+                    (seq, kind, issue_id, data, json.dumps(errors))
+                    for seq, kind, issue_id, data, errors in rejected
+                ],
+            )
+            self._conn.executemany(
+                "DELETE FROM operations WHERE seq = ?",
+                [(seq,) for seq in done + [row[0] for row in rejected]],
+            )
+
+    def flush(self):
+        """
+        Send everything in the journal now. Returns False if a request
+        failed, leaving the rest queued.
+        """
+        with self._flush_lock:
+            while True:
+                rows = self._take()
+                if not rows:
+                    return True
+                try:
+                    ok = self._send(rows)
+                except Exception:
+                    ok = False
+                finally:
+                    with self._lock:
+                        self._in_flight.difference_update(row[0] for row in rows)
+                if not ok:
+                    return False
+
+    def _run(self):
+        delay = self.flush_interval
+        while True:
+            with self._lock:
+                backing_off = delay > self.flush_interval
+                if not self._closed and (
+                    backing_off or self._pending() < self.batch_size
+                ):
+                    self._wakeup.wait(delay)
+                if self._closed:
+                    return
+            if self.flush():
+                delay = self.flush_interval
+            else:
+                delay = min(delay * 2, MAX_BACKOFF)
+
+    def close(self, flush=True):
+        """
+        Stop the background thread, by default after a final flush.
+        Whatever can't be sent stays in the journal for next time.
+        """
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join()
+        if flush:
+            self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -11,6 +11,16 @@ setup(
         "pydantic>=2.0.0",
         "typing-extensions>=4.5.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.24.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "webhooks": ["starlette>=0.27.0"],
+        "parquet": ["pyarrow>=10.0.0"],
+        "otel": ["opentelemetry-api>=1.15.0"],
+        "compression": ["brotli>=1.0.0", "zstandard>=0.18.0"],
+        "cli": ["typer>=0.9.0", "rich>=13.0.0"],
+    },
+    entry_points={"console_scripts": ["linear-python=linear_python.cli:main"]},
     author="Jourdan Bul-lalayao",
     description="A Python client for the Linear API",
     long_description=open("README.md").read(),
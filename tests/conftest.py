@@ -0,0 +1,17 @@
+import json
+from datetime import timedelta
+
+import requests
+
+
+def make_response(payload=None, status_code=200, headers=None, elapsed=None):
+    """A requests.Response with `payload` as its JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(
+        payload if payload is not None else {"data": {}}
+    ).encode()
+    if elapsed is not None:
+        response.elapsed = timedelta(seconds=elapsed)
+    return response
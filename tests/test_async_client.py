@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from linear_python.base import AsyncTransport
+from linear_python.client import AsyncLinearClient
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class FakeAsyncTransport(AsyncTransport):
+    def __init__(self, payload, status_code=200, delay=0, max_concurrency=100):
+        super().__init__(max_concurrency=max_concurrency)
+        self.payload = payload
+        self.status_code = status_code
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _send(self, url, headers=None, json=None, data=None):
+        self.calls.append(data)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return FakeResponse(self.payload, self.status_code)
+
+
+def test_sub_clients_share_transport():
+    transport = FakeAsyncTransport({})
+    client = AsyncLinearClient("test_api_key", transport=transport)
+
+    assert client._issues.transport is transport
+    assert client._projects.transport is transport
+    assert client._teams.transport is transport
+    assert client._users.transport is transport
+
+
+@pytest.mark.parametrize(
+    "method, args, field",
+    [
+        ("create_issue", ({"teamId": "team-1", "title": "Test"},), "issueCreate"),
+        ("get_issue", ("issue-1",), "issue"),
+        ("update_issue", ("issue-1", {"title": "New"}), "issueUpdate"),
+        ("delete_issue", ("issue-1",), "issueDelete"),
+        ("create_project", ({"name": "P", "teamIds": ["team-1"]},), "projectCreate"),
+        ("get_teams", (), "teams"),
+        ("get_team", ("team-1",), "team"),
+        ("get_user", ("user-1",), "user"),
+        ("get_users", (), "users"),
+        ("get_viewer", (), "viewer"),
+    ],
+)
+def test_async_methods(method, args, field):
+    transport = FakeAsyncTransport({"data": {field: {"id": "value"}}})
+    client = AsyncLinearClient("test_api_key", transport=transport)
+
+    result = asyncio.run(getattr(client, method)(*args))
+
+    assert result == {"id": "value"}
+    assert len(transport.calls) == 1
+
+
+def test_async_request_failure():
+    transport = FakeAsyncTransport({}, status_code=500)
+    client = AsyncLinearClient("test_api_key", transport=transport)
+
+    assert asyncio.run(client.get_viewer()) is None
+
+
+def test_async_validation():
+    client = AsyncLinearClient("test_api_key", transport=FakeAsyncTransport({}))
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.create_issue({"teamId": "team-1"}))
+
+
+def test_concurrency_limit():
+    transport = FakeAsyncTransport(
+        {"data": {"viewer": {"id": "viewer1"}}}, delay=0.01, max_concurrency=5
+    )
+    client = AsyncLinearClient("test_api_key", transport=transport)
+
+    async def fan_out():
+        return await asyncio.gather(*(client.get_viewer() for _ in range(50)))
+
+    results = asyncio.run(fan_out())
+
+    assert len(results) == 50
+    assert transport.peak_in_flight == 5
@@ -1,4 +1,6 @@
-from linear_python.base import BaseClient
+import threading
+
+from linear_python.base import BaseClient, RequestsTransport
 
 
 def test_base_client_initialization():
@@ -15,7 +17,7 @@ def test_make_request_success(mocker):
     mock_response = mocker.Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"data": {"test": "value"}}
-    mock_post = mocker.patch("requests.post", return_value=mock_response)
+    mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
     client = BaseClient("test_api_key")
     result = client._make_request("test_query", {"var": "value"})
@@ -27,9 +29,99 @@ def test_make_request_success(mocker):
 def test_make_request_failure(mocker):
     mock_response = mocker.Mock()
     mock_response.status_code = 400
-    mocker.patch("requests.post", return_value=mock_response)
+    mocker.patch("requests.Session.post", return_value=mock_response)
 
     client = BaseClient("test_api_key")
     result = client._make_request("test_query")
 
     assert result is None
+
+
+def test_make_request_uses_transport(mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"data": {"test": "value"}}
+    transport = mocker.Mock()
+    transport.post.return_value = mock_response
+
+    client = BaseClient("test_api_key", transport=transport)
+    result = client._make_request("test_query", {"var": "value"})
+
+    assert result == {"data": {"test": "value"}}
+    transport.post.assert_called_once_with(
+        "https://api.linear.app/graphql",
+        headers=client.headers,
+        data=b'{"query":"test_query","variables":{"var":"value"}}',
+    )
+
+
+def test_make_request_uses_base_url(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value.status_code = 200
+
+    client = BaseClient(
+        "test_api_key", transport=transport, base_url="http://localhost:8000/graphql"
+    )
+    client._make_request("test_query")
+
+    assert transport.post.call_args.args[0] == "http://localhost:8000/graphql"
+
+
+def test_requests_transport_reuses_session(mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"data": {}}
+    mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
+
+    transport = RequestsTransport(pool_maxsize=4, connect_timeout=1, read_timeout=2)
+    client = BaseClient("test_api_key", transport=transport)
+    client._make_request("q1")
+    client._make_request("q2")
+
+    assert mock_post.call_count == 2
+    assert mock_post.call_args.kwargs["timeout"] == (1, 2)
+    adapter = transport.session.get_adapter("https://api.linear.app/graphql")
+    assert adapter._pool_maxsize == 4
+
+
+def test_requests_transport_sessions_per_thread_share_adapter():
+    transport = RequestsTransport()
+    sessions = []
+
+    def capture():
+        sessions.append(transport.session)
+
+    threads = [threading.Thread(target=capture) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert transport.session is transport.session
+    assert len({id(session) for session in sessions}) == 4
+    for session in sessions:
+        assert session.get_adapter("https://api.linear.app/graphql") is (
+            transport.adapter
+        )
+
+
+def test_requests_transport_without_keep_alive():
+    transport = RequestsTransport(keep_alive=False)
+    assert transport.session.headers["Connection"] == "close"
+
+
+def test_persisted_query_falls_back_to_full_document(mocker):
+    missing = mocker.Mock(status_code=200)
+    missing.json.return_value = {"errors": [{"message": "PersistedQueryNotFound"}]}
+    found = mocker.Mock(status_code=200)
+    found.json.return_value = {"data": {"test": "value"}}
+    transport = mocker.Mock()
+    transport.post.side_effect = [missing, found]
+
+    client = BaseClient("test_api_key", transport=transport, persisted_queries=True)
+    result = client._make_request("query Test { test }")
+
+    assert result == {"data": {"test": "value"}}
+    first, second = [call.kwargs["data"] for call in transport.post.call_args_list]
+    assert b'"query"' not in first and b'"sha256Hash"' in first
+    assert b'"query"' in second and b'"sha256Hash"' in second
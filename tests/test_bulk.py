@@ -0,0 +1,225 @@
+import json
+
+import pytest
+
+from linear_python.bulk import count_rows, read_rows, run_bulk
+
+
+class FakeClient:
+    def __init__(self, fail_titles=()):
+        self.fail_titles = set(fail_titles)
+        self.requests = []
+
+    def _payload(self, data, issue_id=None):
+        if data.get("title") in self.fail_titles:
+            return {"success": False, "errors": [{"message": "rejected"}]}
+        return {
+            "success": True,
+            "issue": {"id": issue_id or data["title"], "title": data["title"]},
+        }
+
+    def _resolve_references(self, data, issue_id=None):
+        return data
+
+    def _load_issue_teams(self, updates):
+        pass
+
+    def create_issues(self, items, batch_size):
+        self.requests.append([item["title"] for item in items])
+        if any("teamId" not in item for item in items):
+            raise ValueError("teamId is required in data")
+        return [self._payload(item) for item in items]
+
+    def update_issues(self, updates, batch_size):
+        self.requests.append(list(updates))
+        return [self._payload(data, issue_id) for issue_id, data in updates.items()]
+
+
+def rows(count):
+    return [{"teamId": "t", "title": f"Issue {i}"} for i in range(count)]
+
+
+def read_ndjson(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_run_bulk_batches_and_records_results(tmp_path):
+    client = FakeClient(fail_titles={"Issue 3"})
+    results, failures = tmp_path / "results.ndjson", tmp_path / "failures.ndjson"
+    seen = []
+
+    counts = run_bulk(
+        client,
+        iter(rows(7)),
+        results=results,
+        failures=failures,
+        batch_size=3,
+        concurrency=2,
+        progress=lambda ok, failed, skipped: seen.append((ok, failed, skipped)),
+    )
+
+    assert counts == {"ok": 6, "failed": 1, "skipped": 0}
+    assert sorted(len(batch) for batch in client.requests) == [1, 3, 3]
+    assert sorted(line["row"] for line in read_ndjson(results)) == [0, 1, 2, 4, 5, 6]
+    (failure,) = read_ndjson(failures)
+    assert failure["row"] == 3
+    assert failure["input"]["title"] == "Issue 3"
+    assert failure["errors"] == [{"message": "rejected"}]
+    assert sum(ok + failed for ok, failed, _ in seen) == 7
+
+
+def test_invalid_row_is_isolated(tmp_path):
+    client = FakeClient()
+    items = rows(3)
+    del items[1]["teamId"]
+    failures = tmp_path / "failures.ndjson"
+
+    counts = run_bulk(client, items, failures=failures, batch_size=3)
+
+    assert counts["ok"] == 2
+    (failure,) = read_ndjson(failures)
+    assert failure["row"] == 1
+    assert "teamId" in failure["errors"][0]["message"]
+
+
+def test_update_rows_without_id_are_left_out_of_the_team_lookup(tmp_path):
+    client = FakeClient()
+    lookups = []
+    client._load_issue_teams = lookups.append
+    items = [{"id": "issue-1", "title": "a"}, {"title": "b"}]
+    failures = tmp_path / "failures.ndjson"
+
+    counts = run_bulk(client, items, operation="update", failures=failures)
+
+    assert lookups == [{"issue-1": items[0]}]
+    assert counts["ok"] == 1
+    (failure,) = read_ndjson(failures)
+    assert "id column" in failure["errors"][0]["message"]
+
+
+def test_batch_that_fails_after_sending_is_not_resent(tmp_path):
+    client = FakeClient()
+
+    def truncated(items, batch_size):
+        client.requests.append([item["title"] for item in items])
+        raise json.JSONDecodeError("Unterminated string", "{", 1)
+
+    client.create_issues = truncated
+    failures = tmp_path / "failures.ndjson"
+
+    counts = run_bulk(client, rows(3), failures=failures, batch_size=3)
+
+    assert counts["failed"] == 3
+    assert client.requests == [["Issue 0", "Issue 1", "Issue 2"]]
+    assert "Unterminated" in read_ndjson(failures)[0]["errors"][0]["message"]
+
+
+def test_resume_skips_finished_rows(tmp_path):
+    checkpoint = tmp_path / "run.checkpoint"
+    checkpoint.write_text(json.dumps({"input": "in.csv", "next": 2, "done": [4]}))
+    results = tmp_path / "results.ndjson"
+    results.write_text('{"row": 0}\n{"row": 1}\n{"row": 4}\n')
+    client = FakeClient()
+
+    counts = run_bulk(
+        client,
+        rows(6),
+        results=results,
+        checkpoint=checkpoint,
+        source="in.csv",
+        batch_size=10,
+    )
+
+    assert client.requests == [["Issue 2", "Issue 3", "Issue 5"]]
+    assert counts == {"ok": 3, "failed": 0, "skipped": 3}
+    assert [line["row"] for line in read_ndjson(results)] == [0, 1, 4, 2, 3, 5]
+    assert json.loads(checkpoint.read_text()) == {
+        "input": "in.csv",
+        "next": 6,
+        "done": [],
+    }
+
+
+def test_checkpoint_for_another_input(tmp_path):
+    checkpoint = tmp_path / "run.checkpoint"
+    checkpoint.write_text(json.dumps({"input": "a.csv", "next": 2, "done": []}))
+
+    with pytest.raises(ValueError, match="a.csv"):
+        run_bulk(FakeClient(), rows(3), checkpoint=checkpoint, source="b.csv")
+
+
+def test_update_batches_never_repeat_an_issue():
+    client = FakeClient()
+    updates = [
+        {"id": "a", "title": "A"},
+        {"id": "b", "title": "B"},
+        {"id": "a", "title": "A again"},
+    ]
+
+    counts = run_bulk(client, updates, operation="update", batch_size=10)
+
+    assert counts["ok"] == 3
+    assert client.requests == [["a", "b"], ["a"]]
+
+
+def test_read_rows_csv(tmp_path):
+    path = tmp_path / "issues.csv"
+    path.write_text(
+        "team,title,priority,labels,description\n"
+        'ENG,Fix login,2,"Bug, Auth",\n'
+        "OPS,Rotate keys,,,Quarterly\n"
+    )
+
+    assert list(read_rows(str(path))) == [
+        {"team": "ENG", "title": "Fix login", "priority": 2, "labels": ["Bug", "Auth"]},
+        {"team": "OPS", "title": "Rotate keys", "description": "Quarterly"},
+    ]
+    assert count_rows(str(path)) == 2
+
+
+def test_read_rows_ndjson(tmp_path):
+    path = tmp_path / "issues.ndjson"
+    path.write_text('{"title": "a"}\n\n{"title": "b"}')
+
+    assert [row["title"] for row in read_rows(str(path))] == ["a", "b"]
+    path.write_text('{"title": "a"}\n{"title": "b"}')
+    assert count_rows(str(path)) == 2
+    with pytest.raises(ValueError):
+        list(read_rows(str(path), format="xlsx"))
+
+
+@pytest.mark.parametrize(
+    "name, content, failed",
+    [
+        (
+            "issues.csv",
+            "teamId,title,priority\nt,a,1\nt,b,high\nt,c,\n",
+            {1: {"teamId": "t", "title": "b", "priority": "high"}},
+        ),
+        (
+            "issues.ndjson",
+            '{"teamId": "t", "title": "a"}\n{"title": \n[]\n',
+            {1: '{"title": ', 2: []},
+        ),
+    ],
+)
+def test_unreadable_rows_are_recorded_as_failures(tmp_path, name, content, failed):
+    path = tmp_path / name
+    path.write_text(content)
+    failures = tmp_path / "failures.ndjson"
+    checkpoint = tmp_path / "checkpoint.json"
+
+    counts = run_bulk(
+        FakeClient(),
+        read_rows(str(path)),
+        failures=failures,
+        checkpoint=str(checkpoint),
+        source=str(path),
+    )
+
+    assert counts == {"ok": 3 - len(failed), "failed": len(failed), "skipped": 0}
+    lines = read_ndjson(failures)
+    assert {line["row"]: line["input"] for line in lines} == failed
+    assert all(line["errors"][0]["message"] for line in lines)
+    assert json.loads(checkpoint.read_text())["next"] == 3
@@ -0,0 +1,129 @@
+import pytest
+
+from linear_python.cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+)
+from linear_python.client import LinearClient
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend(maxsize=2)
+    return SQLiteCacheBackend(str(tmp_path / "cache.db"), maxsize=2)
+
+
+def mock_transport(mocker, payload):
+    response = mocker.Mock()
+    response.status_code = 200
+    response.json.side_effect = lambda: payload
+    transport = mocker.Mock()
+    transport.post.return_value = response
+    return transport
+
+
+def test_backend_lru_eviction(backend):
+    backend.set("a", "1", ttl=60)
+    backend.set("b", "2", ttl=60)
+    assert backend.get("a") == "1"
+    backend.set("c", "3", ttl=60)
+
+    assert backend.get("a") == "1"
+    assert backend.get("b") is None
+    assert backend.get("c") == "3"
+
+
+def test_backend_ttl_expiry(backend):
+    backend.set("a", "1", ttl=-1)
+    assert backend.get("a") is None
+
+
+def test_backend_invalidate_tag(backend):
+    backend.set("a", "1", ttl=60, tags=["issue:1"])
+    backend.set("b", "2", ttl=60, tags=["issue:2"])
+    backend.invalidate_tag("issue:1")
+
+    assert backend.get("a") is None
+    assert backend.get("b") == "2"
+
+
+def test_memory_backend_tag_index_stays_bounded():
+    backend = MemoryCacheBackend(maxsize=10)
+    for i in range(10_000):
+        backend.set(f"key-{i}", "1", ttl=60, tags=[f"issue:{i}"])
+    assert len(backend._entries) == len(backend._tags) == 10
+
+    # Overwritten, expired and invalidated entries drop their tags too
+    backend.set("key-9999", "2", ttl=60, tags=["issue:other"])
+    assert "issue:9999" not in backend._tags
+    backend.set("key-9998", "2", ttl=-1, tags=["issue:9998"])
+    assert backend.get("key-9998") is None
+    backend.invalidate_tag("issue:other")
+    assert len(backend._entries) == len(backend._tags) == len(backend._key_tags) == 8
+
+
+def test_sqlite_backend_shared_between_connections(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SQLiteCacheBackend(path).set("a", "1", ttl=60)
+    assert SQLiteCacheBackend(path).get("a") == "1"
+
+
+def test_reads_are_cached(mocker):
+    cache = ResponseCache()
+    transport = mock_transport(mocker, {"data": {"teams": {"nodes": []}}})
+    client = LinearClient("test_api_key", transport=transport, cache=cache)
+
+    assert client.get_teams() == {"nodes": []}
+    assert client.get_teams() == {"nodes": []}
+
+    assert transport.post.call_count == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_cache_key_includes_api_key():
+    cache = ResponseCache()
+    assert cache.key("key-1", "query", None) != cache.key("key-2", "query", None)
+
+
+def test_per_operation_ttl(mocker):
+    cache = ResponseCache(ttls={"GetTeams": 0})
+    transport = mock_transport(mocker, {"data": {"teams": {"nodes": []}}})
+    client = LinearClient("test_api_key", transport=transport, cache=cache)
+
+    client.get_teams()
+    client.get_teams()
+
+    assert transport.post.call_count == 2
+
+
+def test_update_issue_invalidates_get_issue(mocker):
+    cache = ResponseCache()
+    payload = {
+        "data": {
+            "issue": {"id": "issue-1", "title": "Old"},
+            "issueUpdate": {"success": True, "issue": {"id": "issue-1"}},
+        }
+    }
+    transport = mock_transport(mocker, payload)
+    client = LinearClient("test_api_key", transport=transport, cache=cache)
+
+    client.get_issue("issue-1")
+    client.get_issue("issue-1")
+    assert transport.post.call_count == 1
+
+    client.update_issue("issue-1", {"title": "New"})
+    client.get_issue("issue-1")
+    assert transport.post.call_count == 3
+
+
+def test_mutations_and_errors_are_not_cached(mocker):
+    cache = ResponseCache()
+    transport = mock_transport(mocker, {"data": {"team": None}, "errors": [{}]})
+    client = LinearClient("test_api_key", transport=transport, cache=cache)
+
+    client.get_team("missing")
+    client.get_team("missing")
+
+    assert transport.post.call_count == 2
@@ -0,0 +1,150 @@
+import asyncio
+import gzip
+import json
+import time
+
+import pytest
+
+from linear_python import AsyncLinearClient, LinearClient
+from linear_python.base import LinearAPIError
+from linear_python.cassette import (
+    AsyncReplayTransport,
+    RecordingTransport,
+    ReplayTransport,
+    read_cassette,
+)
+
+from .conftest import make_response
+
+
+def viewer(name):
+    return {"data": {"viewer": {"id": "user-1", "name": name}}}
+
+
+def record(tmp_path, mocker, responses):
+    path = str(tmp_path / "session.ndjson.gz")
+    inner = mocker.Mock()
+    inner.post.side_effect = responses
+    transport = RecordingTransport(path, transport=inner)
+    return path, transport
+
+
+def test_records_requests_and_responses(tmp_path, mocker):
+    response = make_response(
+        viewer("Ada"),
+        headers={
+            "X-RateLimit-Requests-Remaining": "1499",
+            "Date": "Sun, 18 Oct 2026 08:00:00 GMT",
+            "Set-Cookie": "session=secret",
+        },
+    )
+    path, transport = record(tmp_path, mocker, [response])
+    with LinearClient("secret-key", transport=transport) as client:
+        client.get_viewer()
+
+    [interaction] = list(read_cassette(path))
+    assert interaction.operation == "Me"
+    assert json.loads(interaction.request)["query"].startswith("query Me")
+    assert interaction.status == 200
+    assert json.loads(interaction.body) == viewer("Ada")
+    assert interaction.headers == {"X-RateLimit-Requests-Remaining": "1499"}
+    assert interaction.latency >= interaction.ttfb >= 0
+    with gzip.open(path, "rt") as f:
+        assert "secret" not in f.read()
+
+
+def test_replay_returns_recorded_responses(tmp_path, mocker):
+    path, transport = record(
+        tmp_path,
+        mocker,
+        [
+            make_response(viewer("Ada"), headers={"X-Request-Id": "1"}),
+            make_response({"errors": [{"message": "down"}]}, status_code=500),
+        ],
+    )
+    with LinearClient("key", transport=transport) as client:
+        client.get_viewer()
+        client.get_user("user-2")
+
+    with LinearClient("key", transport=ReplayTransport(path, speed=None)) as client:
+        assert client.get_viewer()["name"] == "Ada"
+        assert client.get_user("user-2") is None
+        response = client.transport.post(
+            client.base_url, data=client.transport.interactions[0].request.encode()
+        )
+    assert response.headers["x-request-id"] == "1"
+    assert response.json() == viewer("Ada")
+
+
+def test_repeated_requests_cycle_through_recorded_responses(tmp_path, mocker):
+    path, transport = record(
+        tmp_path, mocker, [make_response(viewer("Ada")), make_response(viewer("Bo"))]
+    )
+    with LinearClient("key", transport=transport) as client:
+        client.get_viewer()
+        client.get_viewer()
+
+    with LinearClient("key", transport=ReplayTransport(path, speed=None)) as client:
+        names = [client.get_viewer()["name"] for _ in range(3)]
+    assert names == ["Ada", "Bo", "Ada"]
+
+
+def test_unrecorded_requests(tmp_path, mocker):
+    path, transport = record(
+        tmp_path, mocker, [make_response({"data": {"user": {"id": "user-1"}}})]
+    )
+    with LinearClient("key", transport=transport) as client:
+        client.get_user("user-1")
+
+    with LinearClient("key", transport=ReplayTransport(path, speed=None)) as client:
+        # Same operation, other variables: answered with a recorded GetUser
+        assert client.get_user("user-9")["id"] == "user-1"
+        with pytest.raises(LinearAPIError, match="Me"):
+            client.get_viewer()
+
+
+def test_replay_waits_for_recorded_latency(tmp_path, mocker):
+    def slow(*args, **kwargs):
+        time.sleep(0.05)
+        return make_response(viewer("Ada"))
+
+    path = str(tmp_path / "session.ndjson.gz")
+    inner = mocker.Mock()
+    inner.post.side_effect = slow
+    with LinearClient("key", transport=RecordingTransport(path, inner)) as client:
+        client.get_viewer()
+
+    sleep = mocker.patch("linear_python.cassette.time.sleep")
+    replay = ReplayTransport(path)
+    LinearClient("key", transport=replay).get_viewer()
+    assert sleep.call_args.args[0] >= 0.05
+
+    replay.speed = 5.0
+    LinearClient("key", transport=replay).get_viewer()
+    assert sleep.call_args.args[0] == pytest.approx(replay.interactions[0].latency / 5)
+
+    sleep.reset_mock()
+    replay.speed = None
+    LinearClient("key", transport=replay).get_viewer()
+    sleep.assert_not_called()
+
+
+def test_async_replay(tmp_path, mocker):
+    path, transport = record(tmp_path, mocker, [make_response(viewer("Ada"))])
+    with LinearClient("key", transport=transport) as client:
+        client.get_viewer()
+
+    async def replay():
+        replay = AsyncReplayTransport(path, speed=None)
+        async with AsyncLinearClient("key", transport=replay) as client:
+            return await asyncio.gather(*(client.get_viewer() for _ in range(10)))
+
+    assert [user["name"] for user in asyncio.run(replay())] == ["Ada"] * 10
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.ndjson.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(b'{"version": 99}\n')
+    with pytest.raises(ValueError, match="cassette"):
+        ReplayTransport(str(path))
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+pytest.importorskip("typer")
+from typer.testing import CliRunner  # noqa: E402
+
+from linear_python import cli  # noqa: E402
+
+
+class FakeClient:
+    def __init__(self):
+        self.created = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def _resolve_references(self, data, issue_id=None):
+        data = dict(data)
+        data["teamId"] = f"team-{data.pop('team')}"
+        return data
+
+    def create_issues(self, items, batch_size):
+        self.created.extend(items)
+        return [
+            {"success": True, "issue": {"id": f"id-{item['title']}"}} for item in items
+        ]
+
+
+def test_import_command(tmp_path, mocker, monkeypatch):
+    client = FakeClient()
+    make_client = mocker.patch.object(cli, "_client", return_value=client)
+    source = tmp_path / "issues.ndjson"
+    source.write_text('{"team": "ENG", "title": "a"}\n{"team": "ENG", "title": "b"}\n')
+    results = tmp_path / "results.ndjson"
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(
+        cli.app,
+        ["import", str(source), "--results", str(results), "--api-key", "key"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Created 2 issues" in result.output
+    assert make_client.call_args.args[0] == "key"
+    assert [item["title"] for item in client.created] == ["a", "b"]
+    assert [json.loads(line)["id"] for line in results.read_text().splitlines()] == [
+        "id-a",
+        "id-b",
+    ]
+    assert json.loads((tmp_path / "results.ndjson.checkpoint").read_text())["next"] == 2
+
+    again = CliRunner().invoke(
+        cli.app,
+        ["import", str(source), "--results", str(results), "--api-key", "key"],
+    )
+    assert "2 already done" in again.output
+    assert len(client.created) == 2
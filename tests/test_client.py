@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from linear_python.client import LinearClient
+
+
+def test_sub_clients_share_transport(mocker):
+    transport = mocker.Mock()
+    client = LinearClient("test_api_key", transport=transport)
+
+    assert client._issues.transport is transport
+    assert client._projects.transport is transport
+    assert client._teams.transport is transport
+    assert client._users.transport is transport
+
+
+def test_default_transport_is_shared():
+    client = LinearClient("test_api_key")
+    assert client._issues.transport is client._users.transport
+
+
+def test_delegation(mocker):
+    client = LinearClient("test_api_key", transport=mocker.Mock())
+    assert client.get_viewer.__self__ is client._users
+
+    with pytest.raises(AttributeError):
+        client.not_a_method
+
+
+def test_methods_are_dispatched_without_getattr(mocker):
+    client = LinearClient("test_api_key", transport=mocker.Mock())
+    getattr_ = mocker.patch.object(LinearClient, "__getattr__")
+
+    assert client.get_issue.__self__ is client._issues
+    assert client.get_team.__self__ is client._teams
+    assert client.close.__self__ is client
+    getattr_.assert_not_called()
+
+
+def test_non_method_attributes_are_delegated(mocker):
+    client = LinearClient("test_api_key", transport=mocker.Mock())
+    assert client.api_key == "test_api_key"
+
+
+def test_shared_client_across_threads(mocker):
+    response = mocker.Mock(status_code=200)
+    response.json.return_value = {"data": {"viewer": {"id": "user-1"}}}
+    post = mocker.patch("requests.Session.post", return_value=response)
+    client = LinearClient("test_api_key")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.get_viewer(), range(64)))
+
+    assert results == [{"id": "user-1"}] * 64
+    assert post.call_count == 64
@@ -0,0 +1,75 @@
+import gzip
+import json
+
+from linear_python import codec
+from linear_python.base import BaseClient, RequestsTransport
+
+from .conftest import make_response
+
+
+def test_dumps_loads_round_trip():
+    value = {"input": {"title": "Café", "priority": 2, "labelIds": ["a", "b"]}}
+
+    body = codec.dumps(value)
+
+    assert isinstance(body, bytes)
+    assert b" " not in body
+    assert codec.loads(body) == value
+
+
+def test_large_request_bodies_are_gzipped(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response({"data": {}})
+    client = BaseClient("key", transport=transport, compress_requests=True)
+
+    client._make_request(
+        "mutation CreateIssue($input: IssueCreateInput!) { issueCreate(input: $input) { success } }",
+        {"input": {"title": "x", "description": "word " * 1000}},
+    )
+
+    kwargs = transport.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert kwargs["headers"]["Authorization"] == "key"
+    sent = json.loads(gzip.decompress(kwargs["data"]))
+    assert sent["variables"]["input"]["description"] == "word " * 1000
+
+
+def test_small_request_bodies_are_sent_as_is(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response({"data": {}})
+    client = BaseClient("key", transport=transport, compress_requests=True)
+
+    client._make_request("query GetViewer { viewer { id } }")
+
+    kwargs = transport.post.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+    assert json.loads(kwargs["data"])["query"]
+
+
+def test_compression_threshold(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response({"data": {}})
+    client = BaseClient("key", transport=transport, compress_requests=10)
+
+    client._make_request("query GetViewer { viewer { id } }")
+
+    assert transport.post.call_args.kwargs["headers"]["Content-Encoding"] == "gzip"
+
+
+def test_requests_are_not_compressed_by_default(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response({"data": {}})
+    client = BaseClient("key", transport=transport)
+
+    client._make_request("query GetIssue { issue { description } }", {"x": "y" * 5000})
+
+    assert "Content-Encoding" not in transport.post.call_args.kwargs["headers"]
+
+
+def test_sessions_negotiate_compression():
+    transport = RequestsTransport()
+
+    accepted = transport.session.headers["Accept-Encoding"]
+
+    assert "gzip" in accepted and "deflate" in accepted
+    transport.close()
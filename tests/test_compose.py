@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from linear_python.base import AsyncBaseClient, BaseClient
+from linear_python.compose import Q, compose
+
+from .conftest import make_response
+
+
+def test_compose_renames_colliding_variables():
+    document, variables, aliases, tags = compose(
+        [Q.get_viewer(), Q.get_team("a"), Q.get_team("b", fields=["id"])]
+    )
+
+    assert document.startswith(
+        "query FetchMany($teamId_1: String!, $teamId_2: String!) "
+    )
+    assert "i0: viewer {" in document
+    assert "i1: team(id: $teamId_1) {" in document
+    assert "i2: team(id: $teamId_2) { id }" in document
+    assert variables == {"teamId_1": "a", "teamId_2": "b"}
+    assert aliases == ["i0", "i1", "i2"]
+    assert tags == ["team:a", "team:b"]
+
+
+def test_compose_sends_identical_calls_once():
+    document, variables, aliases, _ = compose(
+        [Q.get_team("a"), Q.get_viewer(), Q.get_team("a")]
+    )
+
+    assert document.count("team(") == 1
+    assert variables == {"teamId_0": "a"}
+    assert aliases == ["i0", "i1", "i0"]
+
+
+def test_compose_rejects_other_values():
+    with pytest.raises(TypeError):
+        compose(["get_viewer"])
+
+
+def test_fetch_many_sends_one_request(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response(
+        {
+            "data": {
+                "i0": {"id": "user-1", "name": "Ada", "email": "ada@example.com"},
+                "i1": {"nodes": [{"id": "team-1", "name": "Eng"}]},
+                "i2": {"id": "team-1", "name": "Eng", "members": {"nodes": []}},
+                "i3": None,
+            }
+        }
+    )
+    client = BaseClient("key", transport=transport)
+
+    viewer, teams, team, missing = client.fetch_many(
+        Q.get_viewer(), Q.get_teams(), Q.get_team("team-1"), Q.get_issue("nope")
+    )
+
+    transport.post.assert_called_once()
+    assert viewer["email"] == "ada@example.com"
+    assert teams == {"nodes": [{"id": "team-1", "name": "Eng"}]}
+    assert team["name"] == "Eng"
+    assert missing is None
+
+
+def test_fetch_many_by_name(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response(
+        {"data": {"i0": {"id": "user-1"}, "i1": {"id": "user-2"}}}
+    )
+    client = BaseClient("key", transport=transport)
+
+    result = client.fetch_many(me=Q.get_viewer(fields=["id"]), other=Q.get_user("u2"))
+
+    assert result == {"me": {"id": "user-1"}, "other": {"id": "user-2"}}
+    with pytest.raises(TypeError):
+        client.fetch_many(Q.get_viewer(), me=Q.get_viewer())
+
+
+def test_fetch_many_request_failure(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response({}, status_code=500)
+    client = BaseClient("key", transport=transport)
+
+    assert client.fetch_many(Q.get_viewer(), Q.get_teams()) == [None, None]
+    assert client.fetch_many() == []
+
+
+def test_fetch_many_decodes_models(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response(
+        {"data": {"i0": {"id": "team-1", "name": "Eng"}}}
+    )
+    client = BaseClient("key", transport=transport, models=True)
+
+    (team,) = client.fetch_many(Q.get_team("team-1", fields=["id", "name"]))
+
+    assert team.name == "Eng"
+
+
+def test_async_fetch_many(mocker):
+    transport = mocker.Mock()
+    transport.post = mocker.AsyncMock(
+        return_value=make_response({"data": {"i0": {"id": "u"}, "i1": {"id": "t"}}})
+    )
+    client = AsyncBaseClient("key", transport=transport)
+
+    viewer, team = asyncio.run(client.fetch_many(Q.get_viewer(), Q.get_team("t")))
+
+    assert transport.post.await_count == 1
+    assert (viewer, team) == ({"id": "u"}, {"id": "t"})
@@ -0,0 +1,147 @@
+import csv
+import json
+
+import pytest
+
+from linear_python.export import COLUMNS, flatten_issue
+from linear_python.filters import F
+from linear_python.resources.issues import IssueClient
+
+
+def issue(number, team_id):
+    return {
+        "id": f"issue-{number}",
+        "identifier": f"ENG-{number}",
+        "title": f"Issue {number}",
+        "priority": 2,
+        "state": {"name": "Todo", "type": "unstarted"},
+        "team": {"id": team_id, "key": team_id.upper()},
+        "assignee": {"id": "user-1", "name": "Ada"} if number % 2 else None,
+        "project": None,
+        "labels": {"nodes": [{"name": "bug"}, {"name": "ui"}]},
+    }
+
+
+class FakeAPI:
+    """Serves teams and per-team issue pages; optionally fails one request."""
+
+    def __init__(self, issues, fail_at=None):
+        self.issues = issues
+        self.fail_at = fail_at
+        self.requests = []
+
+    def __call__(self, client, query, variables=None, cache_tags=()):
+        self.requests.append(variables)
+        if len(self.requests) == self.fail_at:
+            raise ConnectionError("connection reset")
+        if "IterTeams" in query:
+            teams = sorted({node["team"]["id"] for node in self.issues})
+            return {"data": {"teams": self.page([{"id": t} for t in teams], variables)}}
+
+        shard = variables["filter"]
+        team_id = (shard["and"][1] if "and" in shard else shard)["team"]["id"]["eq"]
+        nodes = [node for node in self.issues if node["team"]["id"] == team_id]
+        return {"data": {"issues": self.page(nodes, variables)}}
+
+    @staticmethod
+    def page(nodes, variables):
+        start = int(variables["after"] or 0)
+        end = start + variables["first"]
+        return {
+            "nodes": nodes[start:end],
+            "pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end)},
+        }
+
+
+@pytest.fixture
+def issues():
+    return [issue(i, "team-a") for i in range(5)] + [
+        issue(i, "team-b") for i in range(5, 8)
+    ]
+
+
+def test_flatten_issue():
+    row = flatten_issue(issue(1, "team-a"))
+
+    assert tuple(row) == COLUMNS
+    assert row["state"] == "Todo"
+    assert row["team_key"] == "TEAM-A"
+    assert row["assignee_name"] == "Ada"
+    assert row["project_id"] is None
+    assert row["labels"] == ["bug", "ui"]
+
+
+def test_export_ndjson_shards_by_team(mocker, tmp_path, issues):
+    api = FakeAPI(issues)
+    mocker.patch.object(IssueClient, "_make_request", autospec=True, side_effect=api)
+    path = tmp_path / "issues.ndjson"
+
+    rows = IssueClient("key").export_issues(
+        str(path), filter={"priority": {"eq": 2}}, workers=1, page_size=2
+    )
+
+    assert rows == 8
+    exported = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [row["id"] for row in exported] == [node["id"] for node in issues]
+    shard_filters = [v["filter"] for v in api.requests if "filter" in v]
+    assert shard_filters[0] == {
+        "and": [{"priority": {"eq": 2}}, {"team": {"id": {"eq": "team-a"}}}]
+    }
+    assert not (tmp_path / "issues.ndjson.parts").exists()
+
+
+def test_export_compiles_filter_expressions(mocker, tmp_path, issues):
+    api = FakeAPI(issues)
+    mocker.patch.object(IssueClient, "_make_request", autospec=True, side_effect=api)
+
+    IssueClient("key").export_issues(
+        str(tmp_path / "issues.ndjson"), filter=F.priority <= 2, workers=1
+    )
+
+    shard_filters = [v["filter"] for v in api.requests if "filter" in v]
+    assert shard_filters[0] == {
+        "and": [{"priority": {"lte": 2}}, {"team": {"id": {"eq": "team-a"}}}]
+    }
+
+
+def test_export_csv(mocker, tmp_path, issues):
+    mocker.patch.object(
+        IssueClient, "_make_request", autospec=True, side_effect=FakeAPI(issues)
+    )
+    path = tmp_path / "issues.csv"
+
+    IssueClient("key").export_issues(str(path), workers=1)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 8
+    assert rows[0]["identifier"] == "ENG-0"
+    assert rows[0]["labels"] == "bug,ui"
+
+
+def test_interrupted_export_resumes_from_checkpoint(mocker, tmp_path, issues):
+    path = tmp_path / "issues.ndjson"
+    failing = FakeAPI(issues, fail_at=3)
+    request = mocker.patch.object(
+        IssueClient, "_make_request", autospec=True, side_effect=failing
+    )
+
+    with pytest.raises(ConnectionError):
+        IssueClient("key").export_issues(str(path), workers=1, page_size=2)
+    assert not path.exists()
+    assert (tmp_path / "issues.ndjson.parts" / "shards.json").exists()
+
+    resumed = FakeAPI(issues)
+    request.side_effect = resumed
+    rows = IssueClient("key").export_issues(str(path), workers=1, page_size=2)
+
+    ids = [json.loads(line)["id"] for line in path.read_text().splitlines()]
+    assert rows == 8
+    assert ids == [node["id"] for node in issues]
+    # The team list and the first page came from the checkpoint
+    assert resumed.requests[0]["after"] == "2"
+
+
+def test_export_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="unsupported export format"):
+        IssueClient("key").export_issues(str(tmp_path / "issues.xlsx"))
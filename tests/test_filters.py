@@ -0,0 +1,64 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from linear_python.filters import F, compile_filter
+
+
+def test_comparisons():
+    assert (F.priority == 1).compile() == {"priority": {"eq": 1}}
+    assert (F.priority != 0).compile() == {"priority": {"neq": 0}}
+    assert (F.priority < 3).compile() == {"priority": {"lt": 3}}
+    assert (F.priority >= 2).compile() == {"priority": {"gte": 2}}
+    assert (F.assignee == None).compile() == {"assignee": {"null": True}}  # noqa: E711
+    assert F.title.contains("crash").compile() == {
+        "title": {"containsIgnoreCase": "crash"}
+    }
+    assert F.state.type.in_(("started", "unstarted")).compile() == {
+        "state": {"type": {"in": ["started", "unstarted"]}}
+    }
+
+
+def test_nested_relations_and_collections():
+    assert (F.assignee.email == "ada@example.com").compile() == {
+        "assignee": {"email": {"eq": "ada@example.com"}}
+    }
+    assert F.labels.some(F.name == "Bug").compile() == {
+        "labels": {"some": {"name": {"eq": "Bug"}}}
+    }
+
+
+def test_combinators_flatten():
+    expr = (F.team.key == "ENG") & (F.priority == 1) & (F.estimate > 2)
+    assert expr.compile() == {
+        "and": [
+            {"team": {"key": {"eq": "ENG"}}},
+            {"priority": {"eq": 1}},
+            {"estimate": {"gt": 2}},
+        ]
+    }
+    assert ((F.priority == 1) | (F.priority == 2)).compile() == {
+        "or": [{"priority": {"eq": 1}}, {"priority": {"eq": 2}}]
+    }
+
+
+def test_dates_and_ranges():
+    start = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    assert F.updatedAt.between(start, date(2024, 2, 1)).compile() == {
+        "updatedAt": {"gte": "2024-01-01T12:00:00.000Z", "lte": "2024-02-01"}
+    }
+    assert F.updatedAt.between(end="2024-02-01").compile() == {
+        "updatedAt": {"lte": "2024-02-01"}
+    }
+    with pytest.raises(ValueError):
+        F.updatedAt.between()
+
+
+def test_compile_filter_passes_dicts_through():
+    raw = {"priority": {"eq": 1}}
+    assert compile_filter(raw) is raw
+    assert compile_filter(None) is None
+    with pytest.raises(TypeError):
+        compile_filter("priority = 1")
+    with pytest.raises(TypeError):
+        (F.priority == 1) & {"priority": {"eq": 2}}
@@ -0,0 +1,67 @@
+import subprocess
+import sys
+
+import pytest
+
+import linear_python
+
+
+def loaded_after(statement, modules):
+    """Which of `modules` a fresh interpreter has imported after `statement`."""
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(' '.join(m for m in {modules!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return output.stdout.split()
+
+
+def test_import_is_lazy():
+    heavy = ("requests", "strawberry", "graphql", "dotenv", "linear_python.client")
+    assert loaded_after("import linear_python", heavy) == []
+
+
+def test_client_does_not_load_types_or_dotenv():
+    statement = (
+        "from linear_python import LinearClient\n"
+        "client = LinearClient('key')\n"
+        "client.get_issue"
+    )
+    modules = ("strawberry", "graphql", "dotenv", "asyncio", "sqlite3")
+    assert loaded_after(statement, modules) == []
+
+
+def test_selecting_fields_loads_types():
+    statement = (
+        "from linear_python.resources.issues import GET_ISSUE\n"
+        "GET_ISSUE.select('id title')"
+    )
+    assert loaded_after(statement, ("strawberry",)) == ["strawberry"]
+
+
+def test_config_reads_environment_on_first_use(tmp_path):
+    code = (
+        "import sys\n"
+        "from linear_python import Config\n"
+        "assert 'dotenv' not in sys.modules\n"
+        "print(Config.API_KEY)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={"LINEAR_API_KEY": "lin_api_env", "PYTHONPATH": ":".join(sys.path)},
+    )
+    assert output.stdout.strip() == "lin_api_env"
+
+
+def test_lazy_exports():
+    assert linear_python.LinearClient.__name__ == "LinearClient"
+    assert "LinearClient" in dir(linear_python)
+    with pytest.raises(AttributeError):
+        linear_python.NotAClient
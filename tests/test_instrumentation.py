@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+import requests
+
+from linear_python.base import AsyncBaseClient, BaseClient
+from linear_python.instrumentation import Hook, PrometheusMetrics
+
+from .conftest import make_response
+
+
+class Recorder(Hook):
+    def __init__(self):
+        self.events = []
+
+    def before(self, info):
+        self.events.append(("before", info.operation))
+
+    def after(self, info):
+        self.events.append(("after", info))
+
+    def error(self, info, exc):
+        self.events.append(("error", info, exc))
+
+
+def test_hooks_see_operation_sizes_timings_and_rate_limits(mocker):
+    response = make_response(
+        headers={"X-RateLimit-Requests-Remaining": "1499", "X-Complexity": "12"},
+        elapsed=0.05,
+    )
+    transport = mocker.Mock()
+    transport.post.return_value = response
+    recorder = Recorder()
+    client = BaseClient("key", transport=transport, hooks=[recorder])
+
+    client._make_request("query GetViewer { viewer { id } }")
+
+    assert recorder.events[0] == ("before", "GetViewer")
+    _, info = recorder.events[1]
+    assert info.status == 200
+    assert info.request_bytes == len(transport.post.call_args.kwargs["data"])
+    assert info.response_bytes == len(response.content)
+    assert info.ttfb == pytest.approx(0.05)
+    assert info.total >= 0
+    assert info.rate_limit == {
+        "X-RateLimit-Requests-Remaining": "1499",
+        "X-Complexity": "12",
+    }
+
+
+def test_hooks_see_transport_errors(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = requests.ConnectionError("down")
+    recorder = Recorder()
+    client = BaseClient("key", transport=transport, hooks=[recorder])
+
+    with pytest.raises(requests.ConnectionError):
+        client._make_request("query GetViewer { viewer { id } }")
+
+    kind, info, exc = recorder.events[1]
+    assert kind == "error"
+    assert info.operation == "GetViewer"
+    assert isinstance(exc, requests.ConnectionError)
+
+
+def test_async_hooks(mocker):
+    transport = mocker.Mock()
+    transport.post = mocker.AsyncMock(return_value=make_response())
+    recorder = Recorder()
+    client = AsyncBaseClient("key", transport=transport, hooks=[recorder])
+
+    asyncio.run(client._make_request("query GetViewer { viewer { id } }"))
+
+    assert [event[0] for event in recorder.events] == ["before", "after"]
+
+
+def test_prometheus_metrics(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        make_response(headers={"X-RateLimit-Requests-Remaining": "1400"}),
+        make_response(status_code=500),
+        requests.Timeout("slow"),
+    ]
+    metrics = PrometheusMetrics(buckets=(0.1, 1.0))
+    client = BaseClient("key", transport=transport, hooks=[metrics])
+
+    client._make_request("query GetViewer { viewer { id } }")
+    client._make_request("query GetViewer { viewer { id } }")
+    with pytest.raises(requests.Timeout):
+        client._make_request("query GetViewer { viewer { id } }")
+
+    text = metrics.render()
+    assert 'linear_requests_total{operation="GetViewer",status="200"} 1' in text
+    assert 'linear_requests_total{operation="GetViewer",status="500"} 1' in text
+    assert (
+        'linear_request_errors_total{operation="GetViewer",error="Timeout"} 1' in text
+    )
+    assert (
+        'linear_request_duration_seconds_bucket{operation="GetViewer",le="+Inf"} 3'
+        in text
+    )
+    assert (
+        'linear_rate_limit_remaining{header="x-ratelimit-requests-remaining"} 1400'
+        in text
+    )
+
+
+def test_no_hooks_by_default(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response()
+    client = BaseClient("key", transport=transport)
+
+    assert client.hooks == ()
+    assert client._make_request("query GetViewer { viewer { id } }") == {"data": {}}
+
+
+def test_opentelemetry_spans(mocker):
+    pytest.importorskip("opentelemetry")
+    from linear_python.instrumentation import OpenTelemetryHook
+
+    tracer = mocker.Mock()
+    span = tracer.start_span.return_value
+    transport = mocker.Mock()
+    transport.post.return_value = make_response(status_code=500)
+    client = BaseClient(
+        "key", transport=transport, hooks=[OpenTelemetryHook(tracer=tracer)]
+    )
+
+    client._make_request("query GetViewer { viewer { id } }")
+
+    assert tracer.start_span.call_args.args == ("linear GetViewer",)
+    span.set_attribute.assert_any_call("http.response.status_code", 500)
+    span.set_status.assert_called_once()
+    span.end.assert_called_once()
@@ -1,5 +1,6 @@
 import pytest
 
+from linear_python.filters import F
 from linear_python.resources.issues import IssueClient
 
 
@@ -70,3 +71,133 @@ def test_delete_issue(issue_client, mocker):
 
     result = issue_client.delete_issue("test-id")
     assert result == mock_response["data"]["issueDelete"]
+
+
+def test_create_issues_batches_mutations(issue_client, mocker):
+    def respond(document, variables):
+        count = document.count("issueCreate(")
+        return {
+            "data": {
+                f"i{i}": {"success": True, "issue": {"id": i}} for i in range(count)
+            }
+        }
+
+    mock_request = mocker.patch.object(
+        issue_client, "_make_request", side_effect=respond
+    )
+
+    items = [{"teamId": "team-1", "title": f"Issue {i}"} for i in range(5)]
+    result = issue_client.create_issues(items, batch_size=2)
+
+    assert len(result) == 5
+    assert all(payload["success"] for payload in result)
+    assert mock_request.call_count == 3
+    document, variables = mock_request.call_args_list[0].args
+    assert "i0: issueCreate(input: $input_0)" in document
+    assert "i1: issueCreate(input: $input_1)" in document
+    assert variables["input_1"] == {"teamId": "team-1", "title": "Issue 1"}
+
+
+def test_create_issues_validates_each_item(issue_client, mocker):
+    mock_request = mocker.patch.object(issue_client, "_make_request")
+
+    with pytest.raises(ValueError):
+        issue_client.create_issues(
+            [{"teamId": "team-1", "title": "Valid"}, {"teamId": "team-1"}]
+        )
+
+    mock_request.assert_not_called()
+
+
+def test_update_issues_partial_failure(issue_client, mocker):
+    error = {"message": "Entity not found", "path": ["i1"]}
+    mock_response = {
+        "data": {"i0": {"success": True, "issue": {"id": "a"}}, "i1": None},
+        "errors": [error],
+    }
+    mocker.patch.object(issue_client, "_make_request", return_value=mock_response)
+
+    result = issue_client.update_issues({"a": {"title": "A"}, "b": {"title": "B"}})
+
+    assert result[0]["success"] is True
+    assert result[1] == {"success": False, "errors": [error]}
+
+
+def test_delete_issues(issue_client, mocker):
+    mock_response = {"data": {"i0": {"success": True}, "i1": {"success": True}}}
+    mock_request = mocker.patch.object(
+        issue_client, "_make_request", return_value=mock_response
+    )
+
+    result = issue_client.delete_issues(["a", "b"])
+
+    assert result == [{"success": True}, {"success": True}]
+    assert mock_request.call_args.args[1] == {"issueId_0": "a", "issueId_1": "b"}
+
+
+def test_get_issue_with_fields(issue_client, mocker):
+    mock_response = {"data": {"issue": {"id": "test-id", "state": {"name": "Todo"}}}}
+    mock_request = mocker.patch.object(
+        issue_client, "_make_request", return_value=mock_response
+    )
+
+    result = issue_client.get_issue("test-id", fields=["id", "state { name }"])
+
+    assert result == mock_response["data"]["issue"]
+    document = mock_request.call_args.args[0]
+    assert "issue(id: $issueId) { id state { name } }" in document
+
+
+def test_iter_issues_with_filter(issue_client, mocker):
+    page = {
+        "data": {
+            "issues": {
+                "nodes": [{"id": "issue-1"}],
+                "pageInfo": {"hasNextPage": False, "endCursor": "cursor-1"},
+            }
+        }
+    }
+    mock_request = mocker.patch.object(issue_client, "_make_request", return_value=page)
+    updated = {"updatedAt": {"gte": "2024-01-01T00:00:00.000Z"}}
+
+    result = list(issue_client.iter_issues(filter=updated, include_archived=True))
+
+    assert result == [{"id": "issue-1"}]
+    document, variables = mock_request.call_args.args
+    assert "$filter: IssueFilter" in document
+    assert variables == {
+        "first": 50,
+        "after": None,
+        "filter": updated,
+        "includeArchived": True,
+    }
+
+
+def test_search_issues_compiles_filter(issue_client, mocker):
+    page = {
+        "data": {
+            "issues": {
+                "nodes": [{"id": "issue-1"}],
+                "pageInfo": {"hasNextPage": False, "endCursor": "cursor-1"},
+            }
+        }
+    }
+    mock_request = mocker.patch.object(issue_client, "_make_request", return_value=page)
+
+    result = list(
+        issue_client.search_issues(
+            (F.team.key == "ENG") & (F.priority <= 2),
+            order_by="updatedAt",
+            stream=False,
+        )
+    )
+
+    assert result == [{"id": "issue-1"}]
+    document, variables = mock_request.call_args.args
+    assert "orderBy: $orderBy" in document
+    assert variables == {
+        "first": 50,
+        "after": None,
+        "filter": {"and": [{"team": {"key": {"eq": "ENG"}}}, {"priority": {"lte": 2}}]},
+        "orderBy": "updatedAt",
+    }
@@ -0,0 +1,110 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from linear_python.loader import AsyncDataLoader, DataLoader
+from linear_python.resources.issues import IssueClient
+
+
+def test_data_loader_coalesces_threads():
+    batches = []
+
+    def batch_fn(keys):
+        batches.append(keys)
+        return [f"value-{key}" for key in keys]
+
+    loader = DataLoader(batch_fn, window=0.05)
+    keys = ["a", "b", "a", "c", "b", "a"]
+    with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+        results = list(pool.map(loader.load, keys))
+
+    assert results == [f"value-{key}" for key in keys]
+    assert len(batches) == 1
+    assert sorted(batches[0]) == ["a", "b", "c"]
+
+
+def test_data_loader_dispatches_full_batch():
+    batches = []
+
+    def batch_fn(keys):
+        batches.append(keys)
+        return keys
+
+    loader = DataLoader(batch_fn, window=10, max_batch_size=1)
+
+    assert loader.load("a") == "a"
+    assert batches == [["a"]]
+
+
+def test_data_loader_propagates_errors():
+    def batch_fn(keys):
+        raise RuntimeError("boom")
+
+    loader = DataLoader(batch_fn, window=0)
+
+    with pytest.raises(RuntimeError):
+        loader.load("a")
+
+
+def test_async_data_loader_coalesces_tasks():
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(keys)
+        return [key.upper() for key in keys]
+
+    async def run():
+        loader = AsyncDataLoader(batch_fn, window=0.01)
+        return await asyncio.gather(*(loader.load(key) for key in "abab"))
+
+    assert asyncio.run(run()) == ["A", "B", "A", "B"]
+    assert batches == [["a", "b"]]
+
+
+def test_async_data_loader_survives_cancelled_leader():
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(keys)
+        return [key.upper() for key in keys]
+
+    async def run():
+        loader = AsyncDataLoader(batch_fn, window=0.05)
+        leader = asyncio.ensure_future(loader.load("a"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(loader.load("b"))
+        duplicate = asyncio.ensure_future(loader.load("a"))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(leader, timeout=0.001)
+        results = await asyncio.wait_for(asyncio.gather(follower, duplicate), 1)
+        later = await asyncio.wait_for(loader.load("c"), 1)
+        return results, later
+
+    assert asyncio.run(run()) == (["B", "A"], "C")
+    assert batches == [["a", "b"], ["c"]]
+
+
+def test_get_issue_coalesced(mocker):
+    def respond(document, variables, **kwargs):
+        return {
+            "data": {
+                f"i{name.rsplit('_', 1)[1]}": (
+                    None if value == "missing" else {"id": value}
+                )
+                for name, value in variables.items()
+            }
+        }
+
+    client = IssueClient("test_api_key", coalesce_window=0.05)
+    mock_request = mocker.patch.object(client, "_make_request", side_effect=respond)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(client.get_issue, ["issue-1", "missing", "issue-1"]))
+
+    assert results == [{"id": "issue-1"}, None, {"id": "issue-1"}]
+    mock_request.assert_called_once()
+    document, variables = mock_request.call_args.args
+    assert "i0: issue(id: $issueId_0)" in document
+    assert sorted(variables.values()) == ["issue-1", "missing"]
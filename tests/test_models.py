@@ -0,0 +1,124 @@
+import asyncio
+import pickle
+
+import pytest
+
+from linear_python.client import AsyncLinearClient, LinearClient
+from linear_python.models import Model, as_dict, decode, model_for
+from linear_python.types import Issue, TeamConnection, User
+
+
+def issue(i, assignee="user-1"):
+    return {
+        "id": f"issue-{i}",
+        "title": f"Issue {i}",
+        "priority": 2.0,
+        "assignee": {"id": assignee, "name": "Ada"},
+        "state": {"id": "state-1", "name": "Todo"},
+        "labels": {"nodes": [{"id": "label-1", "name": "Bug"}]},
+    }
+
+
+def test_models_are_slotted_and_immutable():
+    result = decode(issue(1), Issue)
+
+    assert type(result) is model_for(Issue)
+    assert not hasattr(result, "__dict__")
+    assert result.title == "Issue 1"
+    with pytest.raises(AttributeError):
+        result.title = "Changed"
+
+
+def test_unselected_fields_raise():
+    result = decode(issue(1), Issue)
+
+    with pytest.raises(AttributeError, match="Issue.description was not selected"):
+        result.description
+    with pytest.raises(AttributeError, match="Issue.team was not selected"):
+        result.team
+
+
+def test_nested_entities_are_interned():
+    first, second, other = decode([issue(1), issue(2), issue(3, "user-2")], Issue)
+
+    assert first.assignee is second.assignee
+    assert first.assignee is not other.assignee
+    assert first.state is second.state
+    assert first.assignee.name == "Ada"
+
+
+def test_nested_connections_are_decoded_lazily():
+    result = decode(issue(1), Issue)
+
+    assert type(object.__getattribute__(result, "_labels")) is dict
+    assert result.labels.nodes[0].name == "Bug"
+    assert isinstance(object.__getattribute__(result, "_labels"), Model)
+
+
+def test_aliases_and_round_trip():
+    result = decode({"nodes": [{"id": "team-1", "short": "ENG"}]}, TeamConnection)
+
+    assert result.nodes[0].short == "ENG"
+    assert result.to_dict() == {"nodes": [{"id": "team-1", "short": "ENG"}]}
+    assert as_dict(decode(issue(1), Issue)) == issue(1)
+    assert as_dict({"id": "plain"}) == {"id": "plain"}
+
+
+def test_models_pickle():
+    result = pickle.loads(pickle.dumps(decode(issue(1), Issue)))
+
+    assert result.to_dict() == issue(1)
+    assert result.labels.nodes[0].name == "Bug"
+
+
+def test_client_returns_models(mocker):
+    client = LinearClient("test_api_key", models=True)
+    mocker.patch.object(
+        client._users,
+        "_make_request",
+        return_value={"data": {"user": {"id": "user-1", "name": "Ada"}}},
+    )
+
+    result = client.get_user("user-1")
+
+    assert isinstance(result, model_for(User))
+    assert result.name == "Ada"
+
+
+def test_client_iterators_return_models(mocker):
+    client = LinearClient("test_api_key", models=True)
+    page = {
+        "data": {
+            "issues": {
+                "nodes": [issue(1), issue(2)],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    }
+    mocker.patch.object(client._issues, "_make_request", return_value=page)
+
+    first, second = client.iter_issues()
+
+    assert first.title == "Issue 1"
+    assert first.assignee is second.assignee
+
+
+def test_async_client_returns_models(mocker):
+    client = AsyncLinearClient("test_api_key", transport=mocker.Mock(), models=True)
+    page = {
+        "data": {
+            "users": {
+                "nodes": [{"id": "user-1", "name": "Ada"}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    }
+    mocker.patch.object(
+        client._users, "_make_request", mocker.AsyncMock(return_value=page)
+    )
+
+    async def collect():
+        return [user async for user in client.iter_users()]
+
+    (user,) = asyncio.run(collect())
+    assert user.name == "Ada"
@@ -0,0 +1,65 @@
+from linear_python.operations import (
+    Operation,
+    build_batch,
+    split_batch_response,
+)
+
+GET_THING = Operation(
+    "query",
+    "GetThing",
+    "thing",
+    variables={"thingId": "String!", "first": "Int!"},
+    arguments={"id": "thingId"},
+    selection="""
+        id
+        children(first: $first) {
+            nodes {
+                id
+            }
+        }
+    """,
+)
+
+
+def test_document():
+    assert GET_THING.document == (
+        "query GetThing($thingId: String!, $first: Int!) "
+        "{ thing(id: $thingId) { id children(first: $first) { nodes { id } } } }"
+    )
+
+
+def test_document_without_variables():
+    operation = Operation("query", "Me", "viewer", selection="id name")
+    assert operation.document == "query Me { viewer { id name } }"
+
+
+def test_build_batch_aliases_and_renames_variables():
+    document, variables, aliases = build_batch(
+        "GetThings",
+        [
+            (GET_THING, {"thingId": "a", "first": 1}),
+            (GET_THING, {"thingId": "b", "first": 2}),
+        ],
+    )
+
+    assert aliases == ["i0", "i1"]
+    assert variables == {"thingId_0": "a", "first_0": 1, "thingId_1": "b", "first_1": 2}
+    assert document.startswith(
+        "query GetThings($thingId_0: String!, $first_0: Int!, "
+        "$thingId_1: String!, $first_1: Int!) { i0: thing(id: $thingId_0) "
+        "{ id children(first: $first_0)"
+    )
+    assert "i1: thing(id: $thingId_1) { id children(first: $first_1)" in document
+
+
+def test_split_batch_response_reports_partial_failures():
+    error = {"message": "Entity not found", "path": ["i1"]}
+    response = {"data": {"i0": {"success": True}, "i1": None}, "errors": [error]}
+
+    results = split_batch_response(response, ["i0", "i1"])
+
+    assert results == [{"success": True}, {"success": False, "errors": [error]}]
+
+
+def test_split_batch_response_failed_request():
+    assert split_batch_response(None, ["i0", "i1"]) == [None, None]
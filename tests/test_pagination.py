@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from linear_python.base import LinearAPIError
+from linear_python.pagination import apaginate, paginate
+
+
+def make_pages(total, page_size):
+    pages = {}
+    cursor = None
+    for start in range(0, total, page_size):
+        end = min(start + page_size, total)
+        next_cursor = f"c{end}" if end < total else None
+        pages[cursor] = {
+            "nodes": [{"id": str(i)} for i in range(start, end)],
+            "pageInfo": {"hasNextPage": end < total, "endCursor": next_cursor},
+        }
+        cursor = next_cursor
+    return pages
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paginate_follows_cursors(prefetch):
+    pages = make_pages(25, 10)
+    requested = []
+
+    def fetch_page(after):
+        requested.append(after)
+        return pages[after]
+
+    nodes = list(paginate(fetch_page, prefetch=prefetch))
+
+    assert [n["id"] for n in nodes] == [str(i) for i in range(25)]
+    assert requested == [None, "c10", "c20"]
+
+
+def test_paginate_is_lazy():
+    pages = make_pages(25, 10)
+    requested = []
+
+    def fetch_page(after):
+        requested.append(after)
+        return pages[after]
+
+    iterator = paginate(fetch_page)
+    assert requested == []
+
+    next(iterator)
+    assert requested == [None]
+
+
+def test_paginate_raises_on_failed_page():
+    pages = make_pages(25, 10)
+
+    def fetch_page(after):
+        return None if after == "c10" else pages[after]
+
+    with pytest.raises(LinearAPIError):
+        list(paginate(fetch_page))
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_apaginate_follows_cursors(prefetch):
+    pages = make_pages(25, 10)
+
+    async def fetch_page(after):
+        return pages[after]
+
+    async def collect():
+        return [node async for node in apaginate(fetch_page, prefetch=prefetch)]
+
+    nodes = asyncio.run(collect())
+
+    assert [n["id"] for n in nodes] == [str(i) for i in range(25)]
@@ -0,0 +1,218 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from linear_python.client import LinearClient
+from linear_python.ratelimit import (
+    AdaptiveConcurrency,
+    RetryPolicy,
+    Scheduler,
+    TokenBucket,
+    is_rate_limited,
+)
+
+from .conftest import make_response
+
+
+@pytest.fixture
+def no_sleep(mocker):
+    return mocker.patch("linear_python.ratelimit.time.sleep")
+
+
+def test_token_bucket_waits_when_empty():
+    bucket = TokenBucket(capacity=3600, window=3600)
+    bucket.update(remaining=0)
+
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.01)
+
+
+def test_token_bucket_wait_bounded_by_reset():
+    bucket = TokenBucket(capacity=1, window=3600)
+    bucket.update(remaining=0, reset_at=time.time() + 2)
+
+    assert bucket.reserve() <= 2
+
+
+def test_is_rate_limited(mocker):
+    ratelimited = {"errors": [{"extensions": {"code": "RATELIMITED"}}]}
+
+    assert is_rate_limited(make_response(status_code=429))
+    assert is_rate_limited(make_response(ratelimited, status_code=400))
+    assert not is_rate_limited(make_response({"errors": [{}]}, status_code=400))
+    assert not is_rate_limited(make_response())
+
+
+def test_retry_policy_honors_retry_after(mocker):
+    policy = RetryPolicy(backoff_max=30)
+    response = make_response(status_code=429, headers={"Retry-After": "7"})
+
+    assert policy.delay(0, response) == 7
+
+
+def test_retry_policy_jittered_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+    assert all(0 <= policy.delay(attempt) <= 5 for attempt in range(10))
+
+
+def test_scheduler_retries_throttled_requests(mocker, no_sleep):
+    responses = [
+        make_response(status_code=429),
+        make_response(status_code=503),
+        make_response(),
+    ]
+    send = mocker.Mock(side_effect=responses)
+    scheduler = Scheduler()
+
+    assert scheduler.execute(send) is responses[-1]
+    assert send.call_count == 3
+    assert scheduler.concurrency.limit < scheduler.concurrency.max_concurrency
+
+
+def test_scheduler_gives_up_after_max_retries(mocker, no_sleep):
+    send = mocker.Mock(return_value=make_response(status_code=500))
+    scheduler = Scheduler(retry=RetryPolicy(max_retries=2))
+
+    assert scheduler.execute(send).status_code == 500
+    assert send.call_count == 3
+
+
+def test_scheduler_retries_connection_errors(mocker, no_sleep):
+    send = mocker.Mock(side_effect=requests.exceptions.ConnectionError)
+    scheduler = Scheduler(retry=RetryPolicy(max_retries=1))
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        scheduler.execute(send)
+    assert send.call_count == 2
+
+
+def test_scheduler_does_not_retry_mutations_that_may_have_applied(mocker, no_sleep):
+    send = mocker.Mock(side_effect=requests.exceptions.ReadTimeout)
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        Scheduler().execute(send, "IssueCreate", "mutation")
+    assert send.call_count == 1
+
+    send = mocker.Mock(return_value=make_response(status_code=503))
+    assert Scheduler().execute(send, "IssueCreate", "mutation").status_code == 503
+    assert send.call_count == 1
+
+
+def test_scheduler_retries_mutations_that_were_not_applied(mocker, no_sleep):
+    refused = requests.exceptions.ConnectionError(
+        MaxRetryError(None, "/graphql", NewConnectionError(None, "refused"))
+    )
+    responses = [
+        make_response(status_code=429),
+        make_response(),
+    ]
+    send = mocker.Mock(
+        side_effect=[refused, requests.exceptions.ConnectTimeout(), *responses]
+    )
+
+    assert Scheduler().execute(send, "IssueCreate", "mutation") is responses[-1]
+    assert send.call_count == 4
+
+
+def test_create_issue_is_sent_once_after_read_timeout(mocker, no_sleep):
+    transport = mocker.Mock()
+    transport.post.side_effect = requests.exceptions.ReadTimeout
+    client = LinearClient("test_api_key", transport=transport, scheduler=Scheduler())
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client.create_issue({"title": "Once", "teamId": "team-1"})
+    assert transport.post.call_count == 1
+
+
+def test_scheduler_seeds_buckets_from_headers(mocker):
+    headers = {
+        "X-RateLimit-Requests-Limit": "1500",
+        "X-RateLimit-Requests-Remaining": "150",
+        "X-RateLimit-Complexity-Limit": "250000",
+        "X-RateLimit-Complexity-Remaining": "200000",
+        "X-Complexity": "42",
+    }
+    scheduler = Scheduler(max_concurrency=10)
+    scheduler.concurrency.limit = 1
+
+    scheduler.execute(lambda: make_response(headers=headers), "GetIssue")
+
+    assert scheduler.requests.tokens == 150
+    assert scheduler.complexity.tokens == 200000
+    assert scheduler._costs["GetIssue"] == 42
+    # Only 10% of the request budget is left, so concurrency stays low
+    assert scheduler.concurrency.limit == 1
+
+
+def test_adaptive_concurrency_bounds():
+    concurrency = AdaptiveConcurrency(max_concurrency=8, min_concurrency=2)
+    for _ in range(5):
+        concurrency.on_throttle()
+    assert concurrency.limit == 2
+
+    for _ in range(20):
+        concurrency.on_success(budget_fraction=0.5)
+    assert concurrency.limit == 4
+
+
+def test_adaptive_concurrency_across_event_loops():
+    concurrency = AdaptiveConcurrency(max_concurrency=1)
+
+    async def contend():
+        async def one():
+            await concurrency.aacquire()
+            await asyncio.sleep(0)
+            await concurrency.arelease()
+
+        await asyncio.wait_for(asyncio.gather(one(), one(), one()), timeout=5)
+
+    # Waiting isn't tied to the first loop that used it
+    asyncio.run(contend())
+    asyncio.run(contend())
+    assert concurrency.in_flight == 0
+
+
+def test_sync_callers_wake_async_waiters():
+    concurrency = AdaptiveConcurrency(max_concurrency=2)
+    concurrency.limit = 1
+    concurrency.acquire()
+
+    async def wait_for_slot():
+        threading.Timer(0.01, concurrency.on_success).start()
+        await asyncio.wait_for(concurrency.aacquire(), timeout=5)
+
+    asyncio.run(wait_for_slot())
+    assert concurrency.in_flight == 2
+
+
+def test_scheduler_aexecute(mocker):
+    responses = [make_response(status_code=429), make_response()]
+    mocker.patch("linear_python.ratelimit.asyncio.sleep", side_effect=_no_wait)
+
+    async def send():
+        return responses.pop(0)
+
+    response = asyncio.run(Scheduler().aexecute(send))
+
+    assert response.status_code == 200
+
+
+async def _no_wait(delay):
+    return None
+
+
+def test_linear_client_shares_scheduler(mocker, no_sleep):
+    scheduler = Scheduler()
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        make_response(status_code=429),
+        make_response({"data": {"viewer": {"id": "viewer1"}}}),
+    ]
+    client = LinearClient("test_api_key", transport=transport, scheduler=scheduler)
+
+    assert client._issues.scheduler is client._users.scheduler
+    assert client.get_viewer() == {"id": "viewer1"}
+    assert transport.post.call_count == 2
@@ -0,0 +1,38 @@
+import hashlib
+import json
+
+from linear_python import registry
+from linear_python.resources.issues import GET_ISSUE
+
+
+def test_operations_are_registered_at_import():
+    assert registry.lookup(GET_ISSUE.document) is GET_ISSUE.compiled
+    assert GET_ISSUE.compiled.name == "GetIssue"
+    assert "\n" not in GET_ISSUE.document
+
+
+def test_compiled_query_hash():
+    compiled = registry.lookup("query Me { viewer { id } }")
+    expected = hashlib.sha256(b"query Me { viewer { id } }").hexdigest()
+
+    assert compiled.hash == expected
+    assert registry.lookup("query Me { viewer { id } }") is compiled
+
+
+def test_body_encodings():
+    compiled = registry.lookup("query Me { viewer { id } }")
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": compiled.hash}}
+
+    assert json.loads(compiled.body({"a": 1})) == {
+        "query": compiled.document,
+        "variables": {"a": 1},
+    }
+    assert json.loads(compiled.body(None, persisted=True, include_query=False)) == {
+        "extensions": extensions,
+        "variables": None,
+    }
+    assert json.loads(compiled.body(None, persisted=True)) == {
+        "query": compiled.document,
+        "extensions": extensions,
+        "variables": None,
+    }
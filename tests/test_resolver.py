@@ -0,0 +1,301 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from linear_python.base import AsyncBaseClient, BaseClient
+from linear_python.cache import ResponseCache
+from linear_python.resolver import Index, ResolverIndex, UnknownReference
+from linear_python.resources.issues import IssueClient
+
+from .conftest import make_response
+
+USERS = [
+    {"id": "u1", "name": "Ada Lovelace", "email": "ada@example.com"},
+    {"id": "u2", "name": "Grace Hopper", "email": "grace@example.com"},
+]
+TEAMS = [
+    {"id": "t1", "key": "ENG", "name": "Engineering"},
+    {"id": "t2", "key": "OPS", "name": "Ops"},
+]
+STATES = [
+    {"id": "s1", "name": "In Progress", "type": "started", "team": {"id": "t1"}},
+    {"id": "s2", "name": "In Progress", "type": "started", "team": {"id": "t2"}},
+    {"id": "s3", "name": "Triage", "type": "triage", "team": {"id": "t2"}},
+]
+LABELS = [
+    {"id": "l1", "name": "Bug", "team": None},
+    {"id": "l2", "name": "Bug", "team": {"id": "t2"}},
+    {"id": "l3", "name": "Feature", "team": None},
+]
+
+
+def connection(nodes, cursor=None):
+    return {
+        "nodes": nodes,
+        "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+    }
+
+
+def index_response():
+    return make_response(
+        {
+            "data": {
+                "i0": connection(USERS),
+                "i1": connection(TEAMS),
+                "i2": connection(STATES),
+                "i3": connection(LABELS),
+            }
+        }
+    )
+
+
+def test_index_lookups():
+    index = Index(USERS, TEAMS, STATES, LABELS)
+
+    assert index.user("ADA@example.com") == "u1"
+    assert index.user("Grace Hopper") == "u2"
+    assert index.user("u2") == "u2"
+    assert index.team("eng") == "t1"
+    assert index.team("Ops") == "t2"
+    assert index.state("in progress", team="OPS") == "s2"
+    assert index.state("Triage") == "s3"
+    assert index.label("Bug", team="OPS") == "l2"
+    assert index.label("Bug", team="ENG") == "l1"
+    assert index.label("Feature", team="OPS") == "l3"
+
+
+def test_index_rejects_unknown_and_ambiguous_references():
+    index = Index(USERS, TEAMS, STATES, LABELS)
+
+    with pytest.raises(UnknownReference):
+        index.user("nobody@example.com")
+    with pytest.raises(ValueError, match="more than one"):
+        index.state("In Progress")
+    with pytest.raises(ValueError, match="more than one"):
+        index.label("Bug")
+
+
+def test_resolve_issue_input():
+    index = Index(USERS, TEAMS, STATES, LABELS)
+
+    data = index.resolve_issue_input(
+        {
+            "team": "OPS",
+            "title": "Pager is down",
+            "assignee": "grace@example.com",
+            "state": "In Progress",
+            "labels": ["Bug", "Feature"],
+        }
+    )
+
+    assert data == {
+        "teamId": "t2",
+        "title": "Pager is down",
+        "assigneeId": "u2",
+        "stateId": "s2",
+        "labelIds": ["l2", "l3"],
+    }
+
+
+def test_index_is_loaded_in_one_request(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = index_response()
+    client = BaseClient("key", transport=transport)
+
+    index = ResolverIndex().get(client)
+
+    assert transport.post.call_count == 1
+    body = json.loads(transport.post.call_args.kwargs["data"])
+    assert body["query"].startswith("query IndexWorkspace(")
+    assert index.team("ENG") == "t1"
+
+
+def test_index_follows_pagination(mocker):
+    first = index_response()
+    payload = json.loads(first.content)
+    payload["data"]["i0"] = connection(USERS[:1], cursor="1")
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        make_response(payload),
+        make_response({"data": {"users": connection(USERS[1:])}}),
+    ]
+    client = BaseClient("key", transport=transport)
+
+    index = ResolverIndex().get(client)
+
+    assert index.user("grace@example.com") == "u2"
+    assert json.loads(transport.post.call_args.kwargs["data"])["variables"] == {
+        "first": 250,
+        "after": "1",
+    }
+
+
+def test_stale_index_refreshes_in_background(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = lambda *args, **kwargs: index_response()
+    client = BaseClient("key", transport=transport)
+    resolver = ResolverIndex(ttl=60)
+    first = resolver.get(client)
+    first.loaded_at -= 61
+    started = mocker.patch("linear_python.resolver.threading.Thread")
+
+    assert resolver.get(client) is first
+    started.return_value.start.assert_called_once()
+    resolver._refresh(client)
+    assert resolver.get(client) is not first
+
+
+def test_unknown_reference_reloads_once(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = lambda *args, **kwargs: index_response()
+    client = BaseClient("key", transport=transport)
+    resolver = ResolverIndex(miss_interval=10)
+    resolver.get(client)
+
+    with pytest.raises(UnknownReference):
+        resolver.resolve_issue_input(client, {"team": "DESIGN"})
+    assert transport.post.call_count == 1
+
+    resolver._index.loaded_at -= 11
+    with pytest.raises(UnknownReference):
+        resolver.resolve_issue_input(client, {"team": "DESIGN"})
+    assert transport.post.call_count == 2
+
+
+def test_resolver_bypasses_the_response_cache(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = lambda *args, **kwargs: index_response()
+    cache = ResponseCache()
+    client = BaseClient("key", transport=transport, cache=cache)
+    resolver = ResolverIndex(miss_interval=10)
+    resolver.get(client)
+
+    resolver._index.loaded_at -= 11
+    with pytest.raises(UnknownReference):
+        resolver.resolve_issue_input(client, {"team": "DESIGN"})
+    resolver._refresh(client)
+    assert transport.post.call_count == 3
+    assert cache.stats.hits == 0
+
+
+def test_create_issue_with_references(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        index_response(),
+        make_response({"data": {"issueCreate": {"success": True}}}),
+    ]
+    client = IssueClient("key", transport=transport, resolver=ResolverIndex())
+
+    client.create_issue(
+        {"team": "ENG", "title": "Fix login", "assignee": "Ada Lovelace"}
+    )
+
+    body = json.loads(transport.post.call_args.kwargs["data"])
+    assert body["variables"]["input"] == {
+        "teamId": "t1",
+        "title": "Fix login",
+        "assigneeId": "u1",
+    }
+
+
+def issue_teams_response(*team_ids):
+    return make_response(
+        {
+            "data": {
+                f"i{n}": {"id": f"issue-{n}", "team": {"id": team_id}}
+                for n, team_id in enumerate(team_ids)
+            }
+        }
+    )
+
+
+def test_update_resolves_names_in_the_issues_team(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        issue_teams_response("t2"),
+        index_response(),
+        make_response({"data": {"issueUpdate": {"success": True}}}),
+        make_response({"data": {"issueUpdate": {"success": True}}}),
+    ]
+    client = IssueClient("key", transport=transport, resolver=ResolverIndex())
+
+    client.update_issue("issue-1", {"state": "In Progress", "labels": ["Bug"]})
+
+    body = json.loads(transport.post.call_args.kwargs["data"])
+    # Scoped by the issue's team, which isn't written into the update
+    assert body["variables"]["input"] == {"stateId": "s2", "labelIds": ["l2"]}
+
+    client.update_issue("issue-1", {"state": "In Progress"})
+    assert transport.post.call_count == 4
+    body = json.loads(transport.post.call_args.kwargs["data"])
+    assert body["variables"]["input"] == {"stateId": "s2"}
+
+
+def test_issue_teams_expire_and_moves_drop_them(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        issue_teams_response("t2"),
+        index_response(),
+        make_response({"data": {"issueUpdate": {"success": True}}}),
+        make_response({"data": {"issueUpdate": {"success": True}}}),
+        issue_teams_response("t1"),
+        make_response({"data": {"issueUpdate": {"success": True}}}),
+        issue_teams_response("t1"),
+        make_response({"data": {"issueUpdate": {"success": True}}}),
+    ]
+    resolver = ResolverIndex(ttl=60)
+    client = IssueClient("key", transport=transport, resolver=resolver)
+
+    client.update_issue("issue-1", {"state": "In Progress"})
+    # Moving the issue forgets the team it was in
+    client.update_issue("issue-1", {"teamId": "t1"})
+    client.update_issue("issue-1", {"state": "In Progress"})
+    body = json.loads(transport.post.call_args.kwargs["data"])
+    assert body["variables"]["input"] == {"stateId": "s1"}
+
+    resolver._index.loaded_at = time.monotonic()
+    for issue_id, (team_id, expires_at) in resolver._issue_teams.items():
+        resolver._issue_teams[issue_id] = (team_id, expires_at - 61)
+    client.update_issue("issue-1", {"state": "In Progress"})
+    lookup = json.loads(transport.post.call_args_list[-2].kwargs["data"])
+    assert lookup["query"].startswith("query IssueTeams(")
+    assert transport.post.call_count == 8
+
+
+def test_update_issues_looks_up_issue_teams_in_one_request(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        issue_teams_response("t1", "t2"),
+        index_response(),
+        make_response({"data": {"i0": {"success": True}, "i1": {"success": True}}}),
+    ]
+    client = IssueClient("key", transport=transport, resolver=ResolverIndex())
+
+    client.update_issues(
+        {"issue-a": {"state": "In Progress"}, "issue-b": {"state": "In Progress"}}
+    )
+
+    lookup = json.loads(transport.post.call_args_list[0].kwargs["data"])
+    assert lookup["query"].startswith("query IssueTeams(")
+    body = json.loads(transport.post.call_args.kwargs["data"])
+    assert body["variables"]["input_0"] == {"stateId": "s1"}
+    assert body["variables"]["input_1"] == {"stateId": "s2"}
+
+
+def test_references_need_a_resolver(mocker):
+    client = IssueClient("key", transport=mocker.Mock())
+
+    with pytest.raises(ValueError, match="resolver"):
+        client.create_issue({"team": "ENG", "title": "Fix login"})
+
+
+def test_async_resolver(mocker):
+    transport = mocker.Mock()
+    transport.post = mocker.AsyncMock(return_value=index_response())
+    client = AsyncBaseClient("key", transport=transport, resolver=ResolverIndex())
+
+    data = asyncio.run(client._resolve_references({"team": "OPS", "state": "Triage"}))
+
+    assert data == {"teamId": "t2", "stateId": "s3"}
@@ -0,0 +1,39 @@
+import pytest
+
+from linear_python.resources.issues import GET_ISSUE
+from linear_python.selection import build_selection, normalize_fields
+from linear_python.types import Issue, Team
+
+
+def test_normalize_fields_forms():
+    assert normalize_fields("id  state {\n name }") == "id state { name }"
+    assert normalize_fields(["id", "state { name }"]) == "id state { name }"
+    assert normalize_fields({"id": True, "state": ["name"]}) == "id state { name }"
+
+
+def test_build_selection_validates_fields():
+    with pytest.raises(ValueError):
+        build_selection(Issue, "id notAField")
+
+    with pytest.raises(ValueError):
+        build_selection(Issue, "title { id }")
+
+
+def test_build_selection_expands_objects_and_connections():
+    assert build_selection(Issue, "assignee labels { name }") == (
+        "assignee { id } labels { nodes { name } }"
+    )
+    assert build_selection(Team, "members(first: 5) { email }") == (
+        "members(first: 5) { nodes { email } }"
+    )
+
+
+def test_select_is_cached():
+    operation = GET_ISSUE.select(["id", "state { name }"])
+
+    assert operation is GET_ISSUE.select("id state { name }")
+    assert GET_ISSUE.select(None) is GET_ISSUE
+    assert operation.document == (
+        "query GetIssue($issueId: String!) "
+        "{ issue(id: $issueId) { id state { name } } }"
+    )
@@ -0,0 +1,175 @@
+import asyncio
+import json
+
+import pytest
+
+from linear_python.base import LinearAPIError
+from linear_python.client import AsyncLinearClient, LinearClient
+from linear_python.streaming import AsyncNodeStream, NodeParser, NodeStream
+
+PATH = ("data", "users", "nodes")
+
+
+def page(nodes, cursor=None, **extra):
+    return {
+        "data": {
+            "users": {
+                "nodes": nodes,
+                "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+            }
+        },
+        **extra,
+    }
+
+
+def chunked(document, size):
+    body = json.dumps(document).encode()
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 4096])
+def test_parser_yields_nodes_across_chunk_boundaries(size):
+    nodes = [
+        {"id": f"user-{i}", "name": 'Zoë "Z" [x]', "n": i * 1001} for i in range(20)
+    ]
+    stream = NodeStream(chunked(page(nodes, "cursor-1"), size), PATH)
+
+    assert list(stream) == nodes
+    assert stream.connection == {
+        "nodes": [],
+        "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+    }
+
+
+def test_parser_yields_nodes_before_body_is_complete():
+    body = json.dumps(page([{"id": "a"}, {"id": "b"}])).encode()
+    parser = NodeParser(PATH)
+
+    cut = body.index(b'{"id": "b"}')
+    assert parser.feed(body[:cut]) == [{"id": "a"}]
+    assert parser.feed(body[cut:]) == [{"id": "b"}]
+    assert parser.close() == []
+
+
+def test_parser_holds_back_numbers_split_across_chunks():
+    parser = NodeParser(("data", "items"))
+
+    assert parser.feed(b'{"data": {"items": [12') == []
+    assert parser.feed(b"34, 5") == [1234]
+    assert parser.feed(b"6]}}") == [56]
+    assert parser.close() == []
+
+
+def test_errors_after_data_are_raised():
+    document = page([{"id": "a"}], errors=[{"message": "Boom"}])
+    stream = NodeStream(chunked(document, 16), PATH)
+
+    with pytest.raises(LinearAPIError, match="Boom"):
+        list(stream)
+
+
+def test_truncated_body_is_rejected():
+    body = json.dumps(page([{"id": "a"}])).encode()
+    with pytest.raises(ValueError):
+        list(NodeStream([body[:-5]], PATH))
+
+
+def test_stream_closes_response():
+    closed = []
+    stream = NodeStream(chunked(page([]), 8), PATH, close=lambda: closed.append(1))
+
+    assert list(stream) == []
+    assert closed == [1]
+
+
+def streamed_response(mocker, document, size=32):
+    response = mocker.Mock()
+    response.status_code = 200
+    response.iter_content.return_value = chunked(document, size)
+    return response
+
+
+def test_iter_users_stream(mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        streamed_response(mocker, page([{"id": "user-1"}], "cursor-1")),
+        streamed_response(mocker, page([{"id": "user-2"}])),
+    ]
+    client = LinearClient("test_api_key", transport=transport)
+
+    users = list(client.iter_users(page_size=1, stream=True))
+
+    assert users == [{"id": "user-1"}, {"id": "user-2"}]
+    assert transport.post.call_count == 2
+    assert transport.post.call_args.kwargs["stream"] is True
+    assert b'"after":"cursor-1"' in transport.post.call_args.kwargs["data"]
+
+
+def test_iter_team_members_stream(mocker):
+    document = {
+        "data": {
+            "team": {
+                "members": {
+                    "nodes": [{"id": "user-1"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                }
+            }
+        }
+    }
+    transport = mocker.Mock()
+    transport.post.return_value = streamed_response(mocker, document)
+    client = LinearClient("test_api_key", transport=transport)
+
+    assert list(client.iter_team_members("team-1", stream=True)) == [{"id": "user-1"}]
+
+
+def test_stream_request_failure(mocker):
+    transport = mocker.Mock()
+    transport.post.return_value.status_code = 500
+    client = LinearClient("test_api_key", transport=transport)
+
+    with pytest.raises(LinearAPIError):
+        list(client.iter_users(stream=True))
+
+
+def test_async_iter_users_stream(mocker):
+    class StreamedResponse:
+        status_code = 200
+
+        def __init__(self, document):
+            self.chunks = chunked(document, 16)
+
+        async def aiter_bytes(self):
+            for chunk in self.chunks:
+                yield chunk
+
+        async def aclose(self):
+            pass
+
+    transport = mocker.Mock()
+    transport.post = mocker.AsyncMock(
+        side_effect=[
+            StreamedResponse(page([{"id": "user-1"}], "cursor-1")),
+            StreamedResponse(page([{"id": "user-2"}])),
+        ]
+    )
+    client = AsyncLinearClient("test_api_key", transport=transport)
+
+    async def collect():
+        return [user async for user in client.iter_users(stream=True)]
+
+    assert asyncio.run(collect()) == [{"id": "user-1"}, {"id": "user-2"}]
+
+
+def test_async_node_stream():
+    async def chunks():
+        for chunk in chunked(page([{"id": "a"}]), 5):
+            yield chunk
+
+    async def collect():
+        stream = AsyncNodeStream(chunks(), PATH)
+        return [node async for node in stream], stream.connection["pageInfo"]
+
+    nodes, page_info = asyncio.run(collect())
+    assert nodes == [{"id": "a"}]
+    assert page_info["hasNextPage"] is False
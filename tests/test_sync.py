@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from linear_python.sync import AsyncSyncEngine, MemoryStore, SQLiteStore, SyncEngine
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryStore()
+    return SQLiteStore(str(tmp_path / "mirror.db"))
+
+
+class FakeClient:
+    """Serves canned nodes per kind and records the iterator arguments."""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.calls = []
+
+    def __getattr__(self, name):
+        kind = name[len("iter_") : -1]
+
+        def iterate(**kwargs):
+            self.calls.append((kind, kwargs))
+            return iter(self.nodes.get(kind, []))
+
+        return iterate
+
+
+def node(entity_id, updated_at, **fields):
+    return {"id": entity_id, "updatedAt": updated_at, **fields}
+
+
+def test_first_sync_loads_everything(store):
+    client = FakeClient(
+        {
+            "team": [node("team-1", "2024-01-01T00:00:00.000Z", name="Eng")],
+            "issue": [
+                node("issue-1", "2024-01-02T00:00:00.000Z", title="A"),
+                node("issue-2", "2024-01-03T00:00:00.000Z", title="B"),
+            ],
+        }
+    )
+    engine = SyncEngine(client, store=store, page_size=1)
+
+    counts = engine.sync()
+
+    assert counts == {"team": 1, "user": 0, "project": 0, "issue": 2}
+    assert engine.get("issue", "issue-2")["title"] == "B"
+    assert {team["name"] for team in engine.all("team")} == {"Eng"}
+    assert store.watermark("issue") == "2024-01-03T00:00:00.000Z"
+    assert all(kwargs["filter"] is None for _, kwargs in client.calls)
+
+
+def test_later_syncs_fetch_only_changes(store):
+    client = FakeClient(
+        {
+            "issue": [
+                node("issue-1", "2024-01-02T00:00:00.000Z", title="A"),
+                node("issue-2", "2024-01-03T00:00:00.000Z", title="B"),
+            ]
+        }
+    )
+    engine = SyncEngine(client, store=store, kinds=["issue"])
+    engine.sync()
+
+    client.nodes["issue"] = [
+        node("issue-1", "2024-01-05T00:00:00.000Z", title="A2"),
+        node(
+            "issue-2",
+            "2024-01-04T00:00:00.000Z",
+            archivedAt="2024-01-04T00:00:00.000Z",
+        ),
+    ]
+    client.calls.clear()
+    counts = engine.sync()
+
+    _, kwargs = client.calls[0]
+    assert kwargs["filter"] == {"updatedAt": {"gte": "2024-01-03T00:00:00.000Z"}}
+    assert kwargs["include_archived"] is True
+    assert counts == {"issue": 2}
+    assert engine.get("issue", "issue-1")["title"] == "A2"
+    assert engine.get("issue", "issue-2") is None
+    assert store.watermark("issue") == "2024-01-05T00:00:00.000Z"
+
+
+def test_empty_delta_keeps_watermark(store):
+    client = FakeClient({"user": [node("user-1", "2024-01-01T00:00:00.000Z")]})
+    engine = SyncEngine(client, store=store, kinds=["user"])
+    engine.sync()
+
+    client.nodes["user"] = []
+    assert engine.sync() == {"user": 0}
+    assert store.watermark("user") == "2024-01-01T00:00:00.000Z"
+
+
+def test_sqlite_store_survives_reopen(tmp_path):
+    path = str(tmp_path / "mirror.db")
+    client = FakeClient({"team": [node("team-1", "2024-01-01T00:00:00.000Z")]})
+    SyncEngine(client, store=SQLiteStore(path), kinds=["team"]).sync()
+
+    engine = SyncEngine(client, store=SQLiteStore(path), kinds=["team"])
+    assert engine.get("team", "team-1")["id"] == "team-1"
+
+    engine.sync()
+    _, kwargs = client.calls[-1]
+    assert kwargs["filter"] == {"updatedAt": {"gte": "2024-01-01T00:00:00.000Z"}}
+
+
+def test_async_sync_engine():
+    class FakeAsyncClient(FakeClient):
+        def __getattr__(self, name):
+            iterate = super().__getattr__(name)
+
+            async def aiterate(**kwargs):
+                for item in iterate(**kwargs):
+                    yield item
+
+            return aiterate
+
+    client = FakeAsyncClient({"user": [node("user-1", "2024-01-01T00:00:00.000Z")]})
+    engine = AsyncSyncEngine(client, kinds=["user"])
+
+    assert asyncio.run(engine.sync()) == {"user": 1}
+    assert engine.get("user", "user-1")["id"] == "user-1"
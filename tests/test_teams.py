@@ -43,3 +43,62 @@ def test_get_team(team_client, mocker):
 
     result = team_client.get_team("team-1")
     assert result == mock_response["data"]["team"]
+
+
+def test_iter_teams(team_client, mocker):
+    pages = [
+        {
+            "data": {
+                "teams": {
+                    "nodes": [{"id": "team-1", "name": "Team 1"}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+                }
+            }
+        },
+        {
+            "data": {
+                "teams": {
+                    "nodes": [{"id": "team-2", "name": "Team 2"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": "cursor-2"},
+                }
+            }
+        },
+    ]
+    mock_request = mocker.patch.object(team_client, "_make_request", side_effect=pages)
+
+    result = list(team_client.iter_teams(page_size=1))
+
+    assert [team["id"] for team in result] == ["team-1", "team-2"]
+    assert mock_request.call_args.args[1] == {"first": 1, "after": "cursor-1"}
+
+
+def test_iter_team_members(team_client, mocker):
+    mock_response = {
+        "data": {
+            "team": {
+                "members": {
+                    "nodes": [{"id": "user-1", "name": "User 1"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                }
+            }
+        }
+    }
+    mock_request = mocker.patch.object(
+        team_client, "_make_request", return_value=mock_response
+    )
+
+    result = list(team_client.iter_team_members("team-1"))
+
+    assert result == [{"id": "user-1", "name": "User 1"}]
+    assert mock_request.call_args.args[1]["teamId"] == "team-1"
+
+
+def test_get_teams_with_fields(team_client, mocker):
+    mock_response = {"data": {"teams": {"nodes": [{"id": "team-1"}]}}}
+    mock_request = mocker.patch.object(
+        team_client, "_make_request", return_value=mock_response
+    )
+
+    team_client.get_teams(fields=["id"])
+
+    assert mock_request.call_args.args[0] == "query GetTeams { teams { nodes { id } } }"
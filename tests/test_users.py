@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from linear_python.resources.users import UserClient
 
@@ -8,7 +8,7 @@ class TestUserClient(unittest.TestCase):
     def setUp(self):
         self.client = UserClient("fake-api-key")
 
-    @patch("linear_python.base.requests.post")
+    @patch("requests.Session.post")
     def test_get_user(self, mock_post):
         # Setup mock response
         mock_post.return_value.status_code = 200
@@ -25,7 +25,7 @@ class TestUserClient(unittest.TestCase):
         mock_post.assert_called_once()
         self.assertEqual(response["id"], "user1")
 
-    @patch("linear_python.base.requests.post")
+    @patch("requests.Session.post")
     def test_get_users(self, mock_post):
         # Setup mock response
         mock_post.return_value.status_code = 200
@@ -46,7 +46,7 @@ class TestUserClient(unittest.TestCase):
         mock_post.assert_called_once()
         self.assertEqual(len(response["nodes"]), 1)
 
-    @patch("linear_python.base.requests.post")
+    @patch("requests.Session.post")
     def test_get_viewer(self, mock_post):
         # Setup mock response
         mock_post.return_value.status_code = 200
@@ -67,6 +67,36 @@ class TestUserClient(unittest.TestCase):
         mock_post.assert_called_once()
         self.assertEqual(response["id"], "viewer1")
 
+    @patch("requests.Session.post")
+    def test_iter_users(self, mock_post):
+        # Setup mock responses, one per page
+        first, second = Mock(), Mock()
+        first.status_code = second.status_code = 200
+        first.json.return_value = {
+            "data": {
+                "users": {
+                    "nodes": [{"id": "user1"}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor1"},
+                }
+            }
+        }
+        second.json.return_value = {
+            "data": {
+                "users": {
+                    "nodes": [{"id": "user2"}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": "cursor2"},
+                }
+            }
+        }
+        mock_post.side_effect = [first, second]
+
+        # Iterate across both pages
+        response = list(self.client.iter_users(page_size=1))
+
+        # Assert one request was made per page
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual([user["id"] for user in response], ["user1", "user2"])
+
 
 if __name__ == "__main__":
     unittest.main()
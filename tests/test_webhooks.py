@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+
+from linear_python.cache import ResponseCache
+from linear_python.sync import SyncEngine
+from linear_python.webhooks import WebhookEvent, WebhookReceiver, verify_signature
+
+SECRET = "webhook-secret"
+
+
+def sign(body, secret=SECRET):
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def payload(action="update", type="Issue", **data):
+    return {
+        "action": action,
+        "type": type,
+        "data": {"id": "issue-1", **data},
+        "createdAt": "2024-01-01T00:00:00.000Z",
+        "webhookTimestamp": int(time.time() * 1000),
+    }
+
+
+async def adeliver(receiver, body, signature=None):
+    """Send one POST through the ASGI app and return the response status."""
+    if isinstance(body, dict):
+        body = json.dumps(body).encode()
+    signature = sign(body) if signature is None else signature
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/webhooks/linear",
+        "raw_path": b"/webhooks/linear",
+        "root_path": "",
+        "scheme": "http",
+        "query_string": b"",
+        "headers": [(b"linear-signature", signature.encode())],
+        "server": ("testserver", 80),
+        "client": ("testclient", 1234),
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await receiver(scope, receive, send)
+    return sent[0]["status"]
+
+
+def deliver(receiver, body, signature=None):
+    return asyncio.run(adeliver(receiver, body, signature))
+
+
+def test_verify_signature():
+    body = b'{"action":"create"}'
+    assert verify_signature(body, sign(body), SECRET)
+    assert not verify_signature(body, sign(body, "other"), SECRET)
+    assert not verify_signature(body, None, SECRET)
+
+
+def test_rejects_bad_signature_and_stale_deliveries():
+    receiver = WebhookReceiver(SECRET)
+    assert deliver(receiver, payload(), signature="0" * 64) == 401
+
+    stale = payload()
+    stale["webhookTimestamp"] -= 120 * 1000
+    assert deliver(receiver, stale) == 401
+    assert deliver(receiver, b"not json") == 400
+    assert deliver(receiver, payload()) == 200
+
+
+def test_events_update_mirror():
+    mirror = SyncEngine(client=None)
+    mirror.apply("issue", {"id": "issue-1", "title": "Old", "url": "https://x"})
+    receiver = WebhookReceiver(SECRET, mirror=mirror)
+
+    deliver(receiver, payload(title="New", teamId="team-1", labels=[{"id": "l"}]))
+
+    issue = mirror.get("issue", "issue-1")
+    assert issue["title"] == "New"
+    assert issue["url"] == "https://x"
+    assert issue["team"] == {"id": "team-1"}
+    assert issue["labels"] == {"nodes": [{"id": "l"}]}
+
+    deliver(receiver, payload(action="remove"))
+    assert mirror.get("issue", "issue-1") is None
+
+
+def test_older_events_do_not_overwrite_newer_ones():
+    mirror = SyncEngine(client=None)
+    receiver = WebhookReceiver(SECRET, mirror=mirror)
+    newer = payload(title="Newer", updatedAt="2024-01-02T00:00:00.000Z")
+    older = payload(title="Older", updatedAt="2024-01-01T00:00:00.000Z")
+
+    deliver(receiver, newer)
+    deliver(receiver, older)
+    assert mirror.get("issue", "issue-1")["title"] == "Newer"
+
+    # A redelivery of the same version is applied again harmlessly
+    deliver(receiver, newer)
+    assert mirror.get("issue", "issue-1")["title"] == "Newer"
+
+
+def test_events_evict_cache():
+    cache = ResponseCache()
+    cache.set(
+        "key", "GetIssue", {"data": {"issue": {"id": "issue-1"}}}, ["issue:issue-1"]
+    )
+    receiver = WebhookReceiver(SECRET, cache=cache)
+
+    deliver(receiver, payload(title="New"))
+
+    assert cache.get("key") is None
+
+
+def test_unknown_event_types_are_ignored():
+    mirror = SyncEngine(client=None)
+    receiver = WebhookReceiver(SECRET, mirror=mirror)
+
+    assert deliver(receiver, payload(type="Comment", body="hi")) == 200
+    assert mirror.all("issue") == []
+
+
+def test_event_entity_type():
+    event = WebhookEvent(payload(type="User"))
+    assert event.kind == "user"
+    assert event.entity_type.__name__ == "User"
+    assert WebhookEvent(payload(type="Comment")).entity_type is None
+
+
+def test_batches_and_backpressure():
+    receiver = WebhookReceiver(SECRET, queue_size=2)
+
+    async def run():
+        statuses = [await adeliver(receiver, payload(title=str(i))) for i in range(3)]
+        batches = receiver.batches(max_size=5, max_wait=0.01)
+        batch = await batches.__anext__()
+        return statuses, [event.data["title"] for event in batch]
+
+    statuses, titles = asyncio.run(run())
+    assert statuses == [200, 200, 503]
+    assert titles == ["0", "1"]
@@ -0,0 +1,203 @@
+import json
+
+import pytest
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from linear_python.resources.issues import IssueClient
+from linear_python.writebehind import WriteBehindQueue, merge_patch
+
+from .conftest import make_response
+
+
+def sent_body(transport):
+    return json.loads(transport.post.call_args.kwargs["data"])
+
+
+def queue(tmp_path, transport, **options):
+    client = IssueClient("key", transport=transport)
+    return WriteBehindQueue(
+        client, str(tmp_path / "journal.db"), background=False, **options
+    )
+
+
+def test_merge_patch():
+    assert merge_patch({"title": "a", "stateId": "s1"}, {"state": "Done"}) == {
+        "title": "a",
+        "state": "Done",
+    }
+    assert merge_patch({"title": "a"}, {"title": "b", "priority": 1}) == {
+        "title": "b",
+        "priority": 1,
+    }
+
+
+def test_updates_to_one_issue_are_merged(tmp_path, mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response(
+        {"data": {"i0": {"success": True}, "i1": {"success": True}}}
+    )
+    writes = queue(tmp_path, transport)
+
+    first = writes.update_issue("issue-1", {"title": "New title"})
+    assert writes.update_issue("issue-1", {"description": "Details"}) == first
+    writes.update_issue("issue-2", {"priority": 1})
+
+    assert writes.flush()
+    transport.post.assert_called_once()
+    body = sent_body(transport)
+    assert body["query"].startswith("mutation FlushIssueWrites(")
+    assert body["variables"]["input_0"] == {
+        "title": "New title",
+        "description": "Details",
+    }
+    assert body["variables"]["issueId_1"] == "issue-2"
+    assert writes.pending() == 0
+    assert writes.stats["merged"] == 1
+
+
+def test_delete_drops_waiting_updates(tmp_path, mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response({"data": {"i0": {"success": True}}})
+    writes = queue(tmp_path, transport)
+
+    writes.update_issue("issue-1", {"title": "New title"})
+    writes.delete_issue("issue-1")
+    writes.flush()
+
+    body = sent_body(transport)
+    assert "issueDelete" in body["query"]
+    assert "issueUpdate" not in body["query"]
+
+
+def test_journal_survives_a_restart(tmp_path, mocker):
+    transport = mocker.Mock()
+    writes = queue(tmp_path, transport)
+    writes.create_issue({"teamId": "team-1", "title": "Queued"})
+    writes._conn.close()  # the process dies before flushing
+
+    transport.post.return_value = make_response({"data": {"i0": {"success": True}}})
+    replayed = queue(tmp_path, transport)
+    assert replayed.pending() == 1
+    replayed.flush()
+
+    assert sent_body(transport)["variables"]["input_0"]["title"] == "Queued"
+    assert replayed.pending() == 0
+
+
+def test_failed_requests_stay_queued(tmp_path, mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response({}, status_code=500)
+    writes = queue(tmp_path, transport)
+    writes.update_issue("issue-1", {"title": "New title"})
+
+    assert not writes.flush()
+    assert writes.pending() == 1
+
+    transport.post.return_value = make_response({"data": {"i0": {"success": True}}})
+    assert writes.flush()
+    assert writes.pending() == 0
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [make_response({}, status_code=502), requests.ReadTimeout("read timed out")],
+)
+def test_create_with_unknown_outcome_is_not_resent(tmp_path, mocker, outcome):
+    transport = mocker.Mock()
+    if isinstance(outcome, Exception):
+        transport.post.side_effect = outcome
+    else:
+        transport.post.return_value = outcome
+    writes = queue(tmp_path, transport)
+    seq = writes.create_issue({"title": "New issue", "teamId": "team-1"})
+    writes.update_issue("issue-1", {"title": "New title"})
+
+    assert not writes.flush()
+    [failure] = writes.failed()
+    assert failure["seq"] == seq
+    assert failure["errors"][0]["message"].startswith("outcome unknown")
+    # The update is safe to apply twice, so it waits for the next flush
+    assert writes.pending() == 1
+    assert transport.post.call_count == 1
+
+
+def test_create_is_retried_when_it_was_not_sent(tmp_path, mocker):
+    transport = mocker.Mock()
+    transport.post.side_effect = [
+        requests.ConnectionError(NewConnectionError(None, "refused")),
+        make_response({"data": {"i0": {"success": True}}}),
+    ]
+    writes = queue(tmp_path, transport)
+    writes.create_issue({"title": "New issue", "teamId": "team-1"})
+
+    assert not writes.flush()
+    assert writes.pending() == 1
+    assert writes.flush()
+    assert writes.pending() == 0
+    assert writes.failed() == []
+
+
+def test_rejected_items_are_moved_to_failed(tmp_path, mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response(
+        {
+            "data": {"i0": None, "i1": {"success": True}},
+            "errors": [{"message": "Entity not found", "path": ["i0"]}],
+        }
+    )
+    writes = queue(tmp_path, transport)
+    writes.update_issue("missing", {"title": "x"})
+    writes.update_issue("issue-1", {"title": "y"})
+    writes.create_issue({"title": "no team"})
+
+    assert writes.flush()
+
+    failed = writes.failed()
+    assert [(item["issue_id"], item["errors"][0]["message"]) for item in failed] == [
+        ("missing", "Entity not found"),
+        (None, "teamId is required in data"),
+    ]
+    assert writes.pending() == 0
+
+
+@pytest.mark.parametrize("status_code", [400, 200])
+def test_invalid_row_is_isolated_from_its_batch(tmp_path, mocker, status_code):
+    def server(url, headers=None, data=None, **kwargs):
+        variables = json.loads(data)["variables"]
+        inputs = [value for key, value in variables.items() if key.startswith("input")]
+        if any("titel" in item for item in inputs):
+            # GraphQL validation rejects the whole document
+            error = {"message": 'Field "titel" is not defined by type IssueUpdateInput'}
+            return make_response({"errors": [error]}, status_code=status_code)
+        aliases = [
+            key.replace("input_", "i") for key in variables if key.startswith("input")
+        ]
+        return make_response({"data": {alias: {"success": True} for alias in aliases}})
+
+    transport = mocker.Mock()
+    transport.post.side_effect = server
+    writes = queue(tmp_path, transport)
+    writes.update_issue("a", {"title": "A"})
+    bad = writes.update_issue("b", {"titel": "B"})
+    writes.update_issue("c", {"title": "C"})
+
+    assert writes.flush()
+    assert writes.pending() == 0
+    [failure] = writes.failed()
+    assert failure["seq"] == bad
+    assert "titel" in failure["errors"][0]["message"]
+    assert writes.stats["sent"] == 2
+
+
+def test_background_flush(tmp_path, mocker):
+    transport = mocker.Mock()
+    transport.post.return_value = make_response({"data": {"i0": {"success": True}}})
+    client = IssueClient("key", transport=transport)
+
+    with WriteBehindQueue(
+        client, str(tmp_path / "journal.db"), flush_interval=60
+    ) as writes:
+        writes.update_issue("issue-1", {"title": "New title"})
+
+    transport.post.assert_called_once()